@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import functools
 import json
+import os
+import re
 from collections.abc import Iterable
-from fnmatch import fnmatch
+from fnmatch import translate
 from pathlib import Path
 
 DEFAULT_TESTS_POLICY = {
@@ -10,21 +13,32 @@ DEFAULT_TESTS_POLICY = {
     "review": "targeted",
     "qa": "full",
 }
+_TESTS_POLICY_NONE = frozenset(("none", "no", "off", "disabled", "skip"))
+_TESTS_POLICY_TARGETED = frozenset(("targeted", "selective"))
+_TESTS_POLICY_FULL = frozenset(("full", "all"))
 
 
 def _resolve_gates_path(target: Path) -> Path:
     return target / "config" / "gates.json" if target.is_dir() else target
 
 
+@functools.lru_cache(maxsize=32)
+def _load_gates_cached(path_str: str, mtime_ns: int, size: int) -> dict:
+    try:
+        payload = json.loads(Path(path_str).read_text(encoding="utf-8"))
+    except Exception as exc:
+        raise ValueError(f"failed to read {path_str}: {exc}") from exc
+    return payload if isinstance(payload, dict) else {}
+
+
 def load_gates_config(target: Path) -> dict:
     path = _resolve_gates_path(target)
-    if not path.exists():
-        return {}
     try:
-        payload = json.loads(path.read_text(encoding="utf-8"))
-        return payload if isinstance(payload, dict) else {}
-    except Exception as exc:
-        raise ValueError(f"failed to read {path}: {exc}") from exc
+        stat = path.stat()
+    except OSError:
+        return {}
+    # parsed config is reused until gates.json changes on disk
+    return dict(_load_gates_cached(str(path), stat.st_mtime_ns, stat.st_size))
 
 
 def load_gate_section(target: Path, section: str) -> dict:
@@ -50,11 +64,11 @@ def _normalize_tests_policy_value(value: object) -> str:
     if value is None:
         return ""
     raw = str(value).strip().lower()
-    if raw in {"none", "no", "off", "disabled", "skip"}:
+    if raw in _TESTS_POLICY_NONE:
         return "none"
-    if raw in {"targeted", "selective"}:
+    if raw in _TESTS_POLICY_TARGETED:
         return "targeted"
-    if raw in {"full", "all"}:
+    if raw in _TESTS_POLICY_FULL:
         return "full"
     return ""
 
@@ -63,19 +77,20 @@ def resolve_stage_tests_policy(config: dict, stage: str) -> str:
     stage_value = str(stage or "").strip().lower()
     if stage_value not in DEFAULT_TESTS_POLICY:
         return ""
-    raw_policy = (
-        config.get("tests_policy") or config.get("testsPolicy")
-        if isinstance(config, dict)
-        else None
-    )
-    policy_value = ""
+    default = DEFAULT_TESTS_POLICY[stage_value]
+    if not isinstance(config, dict):
+        return default
+    raw_policy = config.get("tests_policy")
+    if raw_policy is None:
+        raw_policy = config.get("testsPolicy")
     if isinstance(raw_policy, dict):
-        policy_value = _normalize_tests_policy_value(raw_policy.get(stage_value))
-    elif raw_policy is not None:
-        policy_value = _normalize_tests_policy_value(raw_policy)
-    if policy_value:
-        return policy_value
-    return DEFAULT_TESTS_POLICY.get(stage_value, "")
+        raw_policy = raw_policy.get(stage_value)
+    return _normalize_tests_policy_value(raw_policy) or default
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_patterns(patterns: tuple[str, ...]) -> re.Pattern[str]:
+    return re.compile("|".join(translate(os.path.normcase(pattern)) for pattern in patterns))
 
 
 def matches(patterns: Iterable[str] | None, value: str) -> bool:
@@ -83,7 +98,10 @@ def matches(patterns: Iterable[str] | None, value: str) -> bool:
         return False
     if isinstance(patterns, str):
         patterns = (patterns,)
-    return any(pattern and fnmatch(value, pattern) for pattern in patterns or ())
+    compiled = tuple(pattern for pattern in patterns or () if pattern)
+    if not compiled:
+        return False
+    return _compile_patterns(compiled).match(os.path.normcase(value)) is not None
 
 
 def branch_enabled(
@@ -1,14 +1,27 @@
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 DEFAULT_PROJECT_SUBDIR = "aidd"
 _WORKSPACE_MARKERS = (".git", ".aidd-plugin", "pyproject.toml")
+_MARKER_SET = frozenset(_WORKSPACE_MARKERS)
 
 
 def _find_workspace_boundary(target: Path) -> Path | None:
     for parent in (target, *target.parents):
+        # one directory listing per level rules out most parents without a stat per marker
+        try:
+            listed = _MARKER_SET.intersection(os.listdir(parent))
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+        except PermissionError:
+            # execute-only directories cannot be listed, but their entries can still be stat'ed
+            listed = _MARKER_SET
         for marker in _WORKSPACE_MARKERS:
+            if marker not in listed:
+                continue
+            # a listed name may be a dangling symlink, which is not a marker
             marker_path = parent / marker
             if marker_path.is_dir() or marker_path.is_file():
                 return parent
@@ -28,9 +41,8 @@ def resolve_project_root(target: Path, subdir: str = DEFAULT_PROJECT_SUBDIR) ->
     for parent in (target, *target.parents):
         if parent.name == subdir:
             return parent.parent, parent
-        candidate = parent / subdir
-        if candidate.is_dir():
-            return parent, candidate
+        if os.path.isdir(os.path.join(parent, subdir)):
+            return parent, parent / subdir
         if boundary and parent == boundary:
             break
     if target.name == subdir:
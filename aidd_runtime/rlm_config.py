@@ -156,6 +156,12 @@ def rev_sha_for_bytes(data: bytes) -> str:
     return hashlib.sha1(data).hexdigest()
 
 
+def rev_sha_for_file(path: Path) -> str:
+    """Return the rev_sha_for_bytes digest, streamed from disk."""
+    with path.open("rb") as handle:
+        return hashlib.file_digest(handle, "sha1").hexdigest()
+
+
 def detect_lang(path: Path) -> str:
     if path.name in SPECIAL_FILES:
         return SPECIAL_FILES[path.name]
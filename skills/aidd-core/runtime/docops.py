@@ -3,21 +3,21 @@
 
 from __future__ import annotations
 
+import functools
 import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 
 from aidd_runtime.tasklist_check import (
     CHECKBOX_RE,
+    ParsedTasklist,
+    Section,
     build_next3_lines,
     build_open_items,
     dedupe_progress,
-    parse_front_matter,
-    parse_handoff_items,
-    parse_iteration_items,
     parse_plan_iteration_ids,
-    parse_sections,
-    progress_entries_from_lines,
+    parse_tasklist_full,
     progress_entry_line,
     resolve_plan_path,
     section_body,
@@ -25,6 +25,13 @@ from aidd_runtime.tasklist_check import (
 
 from aidd_runtime import runtime
 
+_CHECKBOX_LINE_RE = re.compile(
+    r"^(?P<prefix>\s*-\s*\[)(?P<state>[ xX])(?P<suffix>\]\s+(?P<body>.*))$"
+)
+_ITERATION_ID_FIELD_RE = re.compile(r"\biteration_id\s*[:=]\s*", re.IGNORECASE)
+_HANDOFF_ID_FIELD_RE = re.compile(r"\bid\s*:\s*", re.IGNORECASE)
+_STATE_LINE_RE = re.compile(r"^(\s*-?\s*State\s*:)\s*.*$", re.IGNORECASE)
+
 
 @dataclass
 class DocOpsResult:
@@ -33,10 +40,54 @@ class DocOpsResult:
     error: bool = False
 
 
-def _ensure_trailing_newline(text: str) -> str:
-    if text and not text.endswith("\n"):
-        return text + "\n"
-    return text
+@dataclass(frozen=True)
+class ParsedDoc:
+    text: str
+    lines: tuple[str, ...]
+
+
+@functools.lru_cache(maxsize=64)
+def _load_doc(path_str: str, mtime_ns: int, size: int) -> ParsedDoc:
+    text = Path(path_str).read_text(encoding="utf-8")
+    return ParsedDoc(text=text, lines=tuple(text.splitlines()))
+
+
+def _read_doc(path: Path) -> ParsedDoc:
+    """Return the split document, reusing the previous read while the file is unchanged."""
+    stat = path.stat()
+    return _load_doc(str(path), stat.st_mtime_ns, stat.st_size)
+
+
+def _tasklist_path(root: Path, ticket: str) -> Path:
+    return root / "docs" / "tasklist" / f"{ticket}.md"
+
+
+def _context_pack_path(root: Path, ticket: str) -> Path:
+    return root / "reports" / "context" / f"{ticket}.pack.md"
+
+
+def prefetch_docs(
+    root: Path, ticket: str, *, tasklist: bool = True, context_pack: bool = True
+) -> dict[Path, ParsedDoc]:
+    """Read the requested ticket docs, concurrently when both exist, and warm the doc cache."""
+    candidates = []
+    if tasklist:
+        candidates.append(_tasklist_path(root, ticket))
+    if context_pack:
+        candidates.append(_context_pack_path(root, ticket))
+    paths = [path for path in candidates if path.exists()]
+    if len(paths) < 2:
+        return {path: _read_doc(path) for path in paths}
+    with ThreadPoolExecutor(max_workers=len(paths)) as pool:
+        return dict(zip(paths, pool.map(_read_doc, paths), strict=True))
+
+
+def _write_doc(path: Path, lines: list[str]) -> None:
+    buf = "\n".join(lines)
+    if buf and not buf.endswith("\n"):
+        buf += "\n"
+    path.write_bytes(buf.encode("utf-8"))
+    _load_doc.cache_clear()
 
 
 def _replace_section_lines(
@@ -45,287 +96,351 @@ def _replace_section_lines(
     return lines[:section_start] + new_lines + lines[section_end:]
 
 
-def _mark_checkbox_done(lines: list[str], item_id: str, *, kind: str) -> tuple[list[str], str]:
-    pattern = None
-    if kind == "iteration":
-        pattern = re.compile(
-            rf"^(?P<prefix>\s*-\s*\[)(?P<state>[ xX])(?P<suffix>\]\s+.*\biteration_id\s*[:=]\s*{re.escape(item_id)}\b.*)$",
-            re.IGNORECASE,
-        )
-        fallback = re.compile(
-            rf"^(?P<prefix>\s*-\s*\[)(?P<state>[ xX])(?P<suffix>\]\s+{re.escape(item_id)}\b.*)$",
-            re.IGNORECASE,
-        )
-    else:
-        pattern = re.compile(
-            rf"^(?P<prefix>\s*-\s*\[)(?P<state>[ xX])(?P<suffix>\]\s+.*\bid\s*:\s*{re.escape(item_id)}\b.*)$",
-            re.IGNORECASE,
-        )
-        fallback = re.compile(
-            rf"^(?P<prefix>\s*-\s*\[)(?P<state>[ xX])(?P<suffix>\]\s+{re.escape(item_id)}\b.*)$",
-            re.IGNORECASE,
-        )
+def _word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+def _id_at(text: str, pos: int, item_id: str) -> bool:
+    end = pos + len(item_id)
+    if text[pos:end].lower() != item_id.lower():
+        return False
+    # mirror the regex `\b` that used to follow the escaped id
+    return _word_char(item_id[-1]) != _word_char(text[end : end + 1])
 
-    found = False
+
+def _checkbox_matches_id(body: str, item_id: str, *, kind: str) -> bool:
+    if _id_at(body, 0, item_id):
+        return True
+    field_re = _ITERATION_ID_FIELD_RE if kind == "iteration" else _HANDOFF_ID_FIELD_RE
+    return any(_id_at(body, match.end(), item_id) for match in field_re.finditer(body))
+
+
+def _mark_checkbox_done(lines: list[str], item_id: str, *, kind: str) -> tuple[list[str], str]:
+    if not item_id:
+        return list(lines), "not_found"
     new_lines = list(lines)
     for idx, line in enumerate(lines):
-        match = pattern.match(line) if pattern else None
-        if not match:
-            match = fallback.match(line) if fallback else None
-        if not match:
+        match = _CHECKBOX_LINE_RE.match(line)
+        if not match or not _checkbox_matches_id(match.group("body"), item_id, kind=kind):
             continue
-        found = True
         state = match.group("state")
         if state.lower() == "x":
             return new_lines, "already_done"
         new_lines[idx] = f"{match.group('prefix')}x{match.group('suffix')}"
         # update optional State field inside the same block
         for j in range(idx + 1, len(new_lines)):
-            if j != idx and CHECKBOX_RE.match(new_lines[j]):
+            if CHECKBOX_RE.match(new_lines[j]):
                 break
-            if re.match(r"^\s*-?\s*State\s*:\s*", new_lines[j], re.IGNORECASE):
-                new_lines[j] = re.sub(
-                    r"(^\s*-?\s*State\s*:)\s*.*$", r"\1 done", new_lines[j], flags=re.IGNORECASE
-                )
+            if _STATE_LINE_RE.match(new_lines[j]):
+                new_lines[j] = _STATE_LINE_RE.sub(r"\1 done", new_lines[j])
                 break
         return new_lines, "changed"
-    if not found:
-        return new_lines, "not_found"
-    return new_lines, "unchanged"
+    return new_lines, "not_found"
 
 
-def tasklist_set_iteration_done(
-    root: Path, ticket: str, item_id: str, *, kind: str = "iteration"
-) -> DocOpsResult:
-    tasklist_path = root / "docs" / "tasklist" / f"{ticket}.md"
-    if not tasklist_path.exists():
-        return DocOpsResult(
-            False, f"tasklist missing: {runtime.rel_path(tasklist_path, root)}", error=True
-        )
-    text = tasklist_path.read_text(encoding="utf-8")
-    lines = text.splitlines()
-    sections, section_map = parse_sections(lines)
+class TasklistTransaction:
+    """Apply several tasklist DocOps in memory and write the tasklist once on exit."""
 
-    title = "AIDD:ITERATIONS_FULL" if kind == "iteration" else "AIDD:HANDOFF_INBOX"
-    section = section_map.get(title, [])
-    if not section:
-        return DocOpsResult(False, f"missing section: {title}", error=True)
+    def __init__(self, root: Path, ticket: str) -> None:
+        self.root = root
+        self.ticket = ticket
+        self.path = _tasklist_path(root, ticket)
+        self.lines: list[str] = []
+        self.exists = False
+        self.changed = False
+        self._parsed: ParsedTasklist | None = None
 
-    entry = section[0]
-    updated_section, status = _mark_checkbox_done(entry.lines, item_id, kind=kind)
-    if status == "already_done":
-        return DocOpsResult(False, f"item already done: {item_id}")
-    if status == "not_found":
-        return DocOpsResult(False, f"item not found: {item_id}", error=True)
+    def __enter__(self) -> TasklistTransaction:
+        if self.path.exists():
+            self.lines = list(_read_doc(self.path).lines)
+            self.exists = True
+        return self
 
-    updated_lines = _replace_section_lines(lines, entry.start, entry.end, updated_section)
-    tasklist_path.write_text(_ensure_trailing_newline("\n".join(updated_lines)), encoding="utf-8")
-    return DocOpsResult(True, f"marked {kind} {item_id} done")
+    def __exit__(self, exc_type: object, exc: object, tb: object) -> None:
+        if exc_type is None:
+            self.commit()
 
+    def commit(self) -> None:
+        if self.changed:
+            _write_doc(self.path, self.lines)
+            self.changed = False
 
-def tasklist_append_progress_log(root: Path, ticket: str, entry: dict) -> DocOpsResult:
-    tasklist_path = root / "docs" / "tasklist" / f"{ticket}.md"
-    if not tasklist_path.exists():
+    def _missing(self) -> DocOpsResult:
         return DocOpsResult(
-            False, f"tasklist missing: {runtime.rel_path(tasklist_path, root)}", error=True
+            False, f"tasklist missing: {runtime.rel_path(self.path, self.root)}", error=True
         )
-    text = tasklist_path.read_text(encoding="utf-8")
-    lines = text.splitlines()
-    sections, section_map = parse_sections(lines)
-    section = section_map.get("AIDD:PROGRESS_LOG", [])
-    if not section:
-        return DocOpsResult(False, "missing section: AIDD:PROGRESS_LOG", error=True)
-
-    entry_key = (entry.get("date"), entry.get("source"), entry.get("item_id"), entry.get("hash"))
-
-    block = section[0]
-    body = section_body(block)
-    preamble: list[str] = []
-    content: list[str] = []
-    for idx, line in enumerate(body):
-        if line.strip().startswith("-"):
-            content = body[idx:]
-            break
-        preamble.append(line)
-    entries, _ = progress_entries_from_lines(content)
-    for existing in entries:
-        if (
-            existing.get("date"),
-            existing.get("source"),
-            existing.get("item_id"),
-            existing.get("hash"),
-        ) == entry_key:
-            return DocOpsResult(False, "progress entry already present")
-
-    entries.append(entry)
-    deduped = dedupe_progress(entries)
-    new_block = [block.lines[0], *preamble]
-    if deduped:
-        for item in deduped:
-            new_block.append(progress_entry_line(item))
-    else:
-        new_block.append("- (empty)")
-
-    updated_lines = _replace_section_lines(lines, block.start, block.end, new_block)
-    tasklist_path.write_text(_ensure_trailing_newline("\n".join(updated_lines)), encoding="utf-8")
-    return DocOpsResult(True, "progress log appended")
-
 
-def tasklist_next3_recompute(root: Path, ticket: str) -> DocOpsResult:
-    tasklist_path = root / "docs" / "tasklist" / f"{ticket}.md"
-    if not tasklist_path.exists():
-        return DocOpsResult(
-            False, f"tasklist missing: {runtime.rel_path(tasklist_path, root)}", error=True
+    def _tasklist(self) -> ParsedTasklist:
+        # parsed on first use and owned by this transaction, never shared through the doc cache
+        if self._parsed is None:
+            self._parsed = parse_tasklist_full(self.lines)
+        return self._parsed
+
+    def _sections(self, title: str) -> list[Section]:
+        return self._tasklist().section_map.get(title, [])
+
+    def _update(self, lines: list[str]) -> None:
+        self.lines = lines
+        self._parsed = None
+        self.changed = True
+
+    def set_iteration_done(self, item_id: str, *, kind: str = "iteration") -> DocOpsResult:
+        if not self.exists:
+            return self._missing()
+        title = "AIDD:ITERATIONS_FULL" if kind == "iteration" else "AIDD:HANDOFF_INBOX"
+        section = self._sections(title)
+        if not section:
+            return DocOpsResult(False, f"missing section: {title}", error=True)
+
+        entry = section[0]
+        updated_section, status = _mark_checkbox_done(entry.lines, item_id, kind=kind)
+        if status == "already_done":
+            return DocOpsResult(False, f"item already done: {item_id}")
+        if status == "not_found":
+            return DocOpsResult(False, f"item not found: {item_id}", error=True)
+
+        self._update(_replace_section_lines(self.lines, entry.start, entry.end, updated_section))
+        return DocOpsResult(True, f"marked {kind} {item_id} done")
+
+    def append_progress_log(self, entry: dict) -> DocOpsResult:
+        if not self.exists:
+            return self._missing()
+        section = self._sections("AIDD:PROGRESS_LOG")
+        if not section:
+            return DocOpsResult(False, "missing section: AIDD:PROGRESS_LOG", error=True)
+
+        entry_key = (
+            entry.get("date"),
+            entry.get("source"),
+            entry.get("item_id"),
+            entry.get("hash"),
         )
-    text = tasklist_path.read_text(encoding="utf-8")
-    lines = text.splitlines()
-    front, _ = parse_front_matter(lines)
-    sections, section_map = parse_sections(lines)
-
-    iter_section = section_map.get("AIDD:ITERATIONS_FULL", [])
-    handoff_section = section_map.get("AIDD:HANDOFF_INBOX", [])
-
-    iterations = parse_iteration_items(section_body(iter_section[0])) if iter_section else []
-    handoffs = parse_handoff_items(section_body(handoff_section[0])) if handoff_section else []
-    plan_ids = parse_plan_iteration_ids(root, resolve_plan_path(root, front, ticket))
-    open_items, _, _ = build_open_items(iterations, handoffs, plan_ids)
-
-    preamble: list[str] = []
-    next3_section = section_map.get("AIDD:NEXT_3", [])
-    if next3_section:
-        body = section_body(next3_section[0])
-        for line in body:
+
+        entries = self._tasklist().progress_entries
+        for existing in entries:
+            if (
+                existing.get("date"),
+                existing.get("source"),
+                existing.get("item_id"),
+                existing.get("hash"),
+            ) == entry_key:
+                return DocOpsResult(False, "progress entry already present")
+
+        self._write_progress_block(section[0], [*entries, entry])
+        return DocOpsResult(True, "progress log appended")
+
+    def compact_progress_log(self) -> DocOpsResult:
+        if not self.exists:
+            return self._missing()
+        section = self._sections("AIDD:PROGRESS_LOG")
+        if not section:
+            return DocOpsResult(False, "missing section: AIDD:PROGRESS_LOG", error=True)
+        entries = self._tasklist().progress_entries
+        deduped = dedupe_progress(entries)
+        if len(deduped) == len(entries):
+            return DocOpsResult(False, "progress log already compact")
+        self._write_progress_block(section[0], deduped)
+        return DocOpsResult(True, "progress log compacted")
+
+    def _write_progress_block(self, block: Section, entries: list[dict]) -> None:
+        new_block = [block.lines[0]]
+        for line in section_body(block):
             if line.strip().startswith("-"):
                 break
-            preamble.append(line)
+            new_block.append(line)
+        if entries:
+            new_block.extend(progress_entry_line(item) for item in entries)
+        else:
+            new_block.append("- (empty)")
+        self._update(_replace_section_lines(self.lines, block.start, block.end, new_block))
+
+    def recompute_next3(self) -> DocOpsResult:
+        if not self.exists:
+            return self._missing()
+        parsed = self._tasklist()
+        iter_section = self._sections("AIDD:ITERATIONS_FULL")
+        plan_ids = parse_plan_iteration_ids(
+            self.root, resolve_plan_path(self.root, parsed.front, self.ticket)
+        )
+        open_items, _, _ = build_open_items(parsed.iterations, parsed.handoffs, plan_ids)
+
+        preamble: list[str] = []
+        next3_section = self._sections("AIDD:NEXT_3")
+        if next3_section:
+            body = section_body(next3_section[0])
+            for line in body:
+                if line.strip().startswith("-"):
+                    break
+                preamble.append(line)
+
+        next3_lines = build_next3_lines(open_items, preamble)
+
+        lines = self.lines
+        if next3_section:
+            entry = next3_section[0]
+            if lines[entry.start : entry.end] == next3_lines:
+                return DocOpsResult(False, "AIDD:NEXT_3 already up to date")
+            updated_lines = _replace_section_lines(lines, entry.start, entry.end, next3_lines)
+        else:
+            insert_idx = len(lines)
+            if iter_section:
+                insert_idx = iter_section[0].end
+            updated_lines = lines[:insert_idx] + next3_lines + lines[insert_idx:]
+
+        self._update(updated_lines)
+        return DocOpsResult(True, "AIDD:NEXT_3 recomputed")
 
-    next3_lines = build_next3_lines(open_items, preamble)
 
-    if next3_section:
-        entry = next3_section[0]
-        updated_lines = _replace_section_lines(lines, entry.start, entry.end, next3_lines)
-    else:
-        updated_lines = list(lines)
-        insert_idx = len(lines)
-        if iter_section:
-            insert_idx = iter_section[0].end
-        updated_lines = updated_lines[:insert_idx] + next3_lines + updated_lines[insert_idx:]
+def tasklist_set_iteration_done(
+    root: Path, ticket: str, item_id: str, *, kind: str = "iteration"
+) -> DocOpsResult:
+    with TasklistTransaction(root, ticket) as tx:
+        return tx.set_iteration_done(item_id, kind=kind)
 
-    if "\n".join(updated_lines) == text:
-        return DocOpsResult(False, "AIDD:NEXT_3 already up to date")
 
-    tasklist_path.write_text(_ensure_trailing_newline("\n".join(updated_lines)), encoding="utf-8")
-    return DocOpsResult(True, "AIDD:NEXT_3 recomputed")
+def tasklist_append_progress_log(root: Path, ticket: str, entry: dict) -> DocOpsResult:
+    with TasklistTransaction(root, ticket) as tx:
+        return tx.append_progress_log(entry)
 
 
-def _replace_list_section(
-    lines: list[str], heading: str, items: list[str]
-) -> tuple[list[str], bool]:
-    for idx, line in enumerate(lines):
-        if line.strip() != heading:
-            continue
-        start = idx + 1
-        end = start
-        while end < len(lines):
-            if lines[end].startswith("## "):
-                break
-            if lines[end].lstrip().startswith("-") or not lines[end].strip():
-                end += 1
-                continue
-            break
-        replacement = [f"- {item}" for item in items] if items else ["- n/a"]
-        return lines[:start] + replacement + lines[end:], True
-    return lines, False
+def tasklist_progress_compact(root: Path, ticket: str) -> DocOpsResult:
+    with TasklistTransaction(root, ticket) as tx:
+        return tx.compact_progress_log()
 
 
-def _replace_inline_list(
-    lines: list[str], heading: str, items: list[str]
-) -> tuple[list[str], bool]:
-    for idx, line in enumerate(lines):
-        if line.strip() != heading:
-            continue
-        start = idx + 1
-        end = start
-        while end < len(lines):
-            if lines[end].lstrip().startswith("-"):
-                end += 1
-                continue
-            break
-        replacement = [f"- {item}" for item in items] if items else ["- n/a"]
-        return lines[:start] + replacement + lines[end:], True
-    return lines, False
+def tasklist_next3_recompute(root: Path, ticket: str) -> DocOpsResult:
+    with TasklistTransaction(root, ticket) as tx:
+        return tx.recompute_next3()
 
 
-def _replace_frontmatter_value(lines: list[str], key: str, value: str) -> tuple[list[str], bool]:
-    needle = f"{key}:"
-    for idx, line in enumerate(lines):
-        if line.strip().startswith(needle):
-            new_line = f"{key}: {value}"
-            if line == new_line:
-                return lines, False
-            lines[idx] = new_line
-            return lines, True
-    return lines, False
+_Edit = tuple[int, int, list[str]]
 
 
-def _replace_first_list_item(lines: list[str], heading: str, value: str) -> tuple[list[str], bool]:
+def _build_line_index(lines: list[str]) -> tuple[dict[str, int], dict[str, int]]:
+    """Map headings (`## ...`, `name:`) and `key:` prefixes to their first line index."""
+    headings: dict[str, int] = {}
+    keys: dict[str, int] = {}
     for idx, line in enumerate(lines):
-        if line.strip() != heading:
+        stripped = line.strip()
+        if stripped.startswith("#") or stripped.endswith(":"):
+            headings.setdefault(stripped, idx)
+        colon = stripped.find(":")
+        if colon != -1:
+            keys.setdefault(stripped[: colon + 1], idx)
+    return headings, keys
+
+
+def _list_items(items: list[str]) -> list[str]:
+    return [f"- {item}" for item in items] if items else ["- n/a"]
+
+
+def _list_section_edit(
+    lines: list[str], heading: str, items: list[str], headings: dict[str, int]
+) -> _Edit | None:
+    idx = headings.get(heading)
+    if idx is None:
+        return None
+    start = idx + 1
+    end = start
+    while end < len(lines):
+        if lines[end].startswith("## "):
+            break
+        if lines[end].lstrip().startswith("-") or not lines[end].strip():
+            end += 1
             continue
-        for j in range(idx + 1, len(lines)):
-            if lines[j].startswith("## "):
-                break
-            if lines[j].lstrip().startswith("-"):
-                lines[j] = f"- {value or 'n/a'}"
-                return lines, True
-        # if no list item found, insert
-        lines.insert(idx + 1, f"- {value or 'n/a'}")
-        return lines, True
-    return lines, False
+        break
+    replacement = _list_items(items)
+    if lines[start:end] == replacement:
+        return None
+    return start, end, replacement
+
+
+def _inline_list_edit(
+    lines: list[str], heading: str, items: list[str], headings: dict[str, int]
+) -> _Edit | None:
+    idx = headings.get(heading)
+    if idx is None:
+        return None
+    start = idx + 1
+    end = start
+    while end < len(lines) and lines[end].lstrip().startswith("-"):
+        end += 1
+    replacement = _list_items(items)
+    if lines[start:end] == replacement:
+        return None
+    return start, end, replacement
+
+
+def _frontmatter_value_edit(
+    lines: list[str], key: str, value: str, keys: dict[str, int]
+) -> _Edit | None:
+    idx = keys.get(f"{key}:")
+    if idx is None:
+        return None
+    new_line = f"{key}: {value}"
+    if lines[idx] == new_line:
+        return None
+    return idx, idx + 1, [new_line]
+
+
+def _first_list_item_edit(
+    lines: list[str], heading: str, value: str, headings: dict[str, int]
+) -> _Edit | None:
+    idx = headings.get(heading)
+    if idx is None:
+        return None
+    new_line = f"- {value or 'n/a'}"
+    for j in range(idx + 1, len(lines)):
+        if lines[j].startswith("## "):
+            break
+        if lines[j].lstrip().startswith("-"):
+            if lines[j] == new_line:
+                return None
+            return j, j + 1, [new_line]
+    # if no list item found, insert
+    return idx + 1, idx + 1, [new_line]
 
 
 def context_pack_update(root: Path, ticket: str, payload: dict) -> DocOpsResult:
-    context_path = root / "reports" / "context" / f"{ticket}.pack.md"
+    context_path = _context_pack_path(root, ticket)
     if not context_path.exists():
         return DocOpsResult(
             False, f"context pack missing: {runtime.rel_path(context_path, root)}", error=True
         )
-    text = context_path.read_text(encoding="utf-8")
-    lines = text.splitlines()
-    changed = False
+    lines = list(_read_doc(context_path).lines)
+    headings, keys = _build_line_index(lines)
+    # every edit is computed against the unmodified lines, then spliced bottom-up
+    edits: list[_Edit | None] = []
 
     read_log = payload.get("read_log")
     if read_log is not None:
-        lines, updated = _replace_list_section(lines, "## AIDD:READ_LOG", read_log)
-        changed = changed or updated
+        edits.append(_list_section_edit(lines, "## AIDD:READ_LOG", read_log, headings))
 
     read_next = payload.get("read_next")
     if read_next is not None:
-        lines, updated = _replace_inline_list(lines, "read_next:", read_next)
-        changed = changed or updated
+        edits.append(_inline_list_edit(lines, "read_next:", read_next, headings))
 
     generated_at = payload.get("generated_at")
     if generated_at is not None:
-        lines, updated = _replace_frontmatter_value(lines, "generated_at", str(generated_at))
-        changed = changed or updated
+        edits.append(_frontmatter_value_edit(lines, "generated_at", str(generated_at), keys))
 
     artefact_links = payload.get("artefact_links")
     if artefact_links is not None:
-        lines, updated = _replace_inline_list(lines, "artefact_links:", artefact_links)
-        changed = changed or updated
+        edits.append(_inline_list_edit(lines, "artefact_links:", artefact_links, headings))
 
     what_to_do = payload.get("what_to_do")
     if what_to_do is not None:
-        lines, updated = _replace_first_list_item(lines, "## What to do now", what_to_do)
-        changed = changed or updated
+        edits.append(_first_list_item_edit(lines, "## What to do now", what_to_do, headings))
 
     user_note = payload.get("user_note")
     if user_note is not None:
-        lines, updated = _replace_first_list_item(lines, "## User note", user_note)
-        changed = changed or updated
+        edits.append(_first_list_item_edit(lines, "## User note", user_note, headings))
 
-    if not changed:
+    pending = sorted((edit for edit in edits if edit is not None), reverse=True)
+    if not pending:
         return DocOpsResult(False, "context pack already up to date")
 
-    context_path.write_text(_ensure_trailing_newline("\n".join(lines)), encoding="utf-8")
+    for start, end, replacement in pending:
+        lines[start:end] = replacement
+    _write_doc(context_path, lines)
     return DocOpsResult(True, "context pack updated")
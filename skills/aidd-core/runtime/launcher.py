@@ -3,7 +3,7 @@ from __future__ import annotations
 import io
 import os
 from collections.abc import Callable
-from contextlib import redirect_stderr, redirect_stdout
+from contextlib import redirect_stderr, redirect_stdout, suppress
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
@@ -79,24 +79,106 @@ def resolve_context(
 
 
 def actions_paths(context: LaunchContext) -> dict[str, Path]:
-    actions_base = context.root / "reports" / "actions" / context.ticket / context.scope_key
-    context_base = context.root / "reports" / "context" / context.ticket
-    loops_base = context.root / "reports" / "loops" / context.ticket / context.scope_key
-    return {
-        "actions_template": actions_base / f"{context.stage}.actions.template.json",
-        "actions_path": actions_base / f"{context.stage}.actions.json",
-        "apply_log": actions_base / f"{context.stage}.apply.jsonl",
-        "readmap_json": context_base / f"{context.scope_key}.readmap.json",
-        "readmap_md": context_base / f"{context.scope_key}.readmap.md",
-        "writemap_json": context_base / f"{context.scope_key}.writemap.json",
-        "writemap_md": context_base / f"{context.scope_key}.writemap.md",
-        "preflight_result": loops_base / "stage.preflight.result.json",
-        "readmap_json_fallback": actions_base / "readmap.json",
-        "readmap_md_fallback": actions_base / "readmap.md",
-        "writemap_json_fallback": actions_base / "writemap.json",
-        "writemap_md_fallback": actions_base / "writemap.md",
-        "preflight_result_fallback": actions_base / "stage.preflight.result.json",
+    root = str(context.root)
+    ticket, scope_key, stage = context.ticket, context.scope_key, context.stage
+    actions_base = os.path.join(root, "reports", "actions", ticket, scope_key)
+    context_base = os.path.join(root, "reports", "context", ticket)
+    loops_base = os.path.join(root, "reports", "loops", ticket, scope_key)
+    paths = {
+        "actions_template": f"{actions_base}/{stage}.actions.template.json",
+        "actions_path": f"{actions_base}/{stage}.actions.json",
+        "apply_log": f"{actions_base}/{stage}.apply.jsonl",
+        "readmap_json": f"{context_base}/{scope_key}.readmap.json",
+        "readmap_md": f"{context_base}/{scope_key}.readmap.md",
+        "writemap_json": f"{context_base}/{scope_key}.writemap.json",
+        "writemap_md": f"{context_base}/{scope_key}.writemap.md",
+        "preflight_result": f"{loops_base}/stage.preflight.result.json",
+        "readmap_json_fallback": f"{actions_base}/readmap.json",
+        "readmap_md_fallback": f"{actions_base}/readmap.md",
+        "writemap_json_fallback": f"{actions_base}/writemap.json",
+        "writemap_md_fallback": f"{actions_base}/writemap.md",
+        "preflight_result_fallback": f"{actions_base}/stage.preflight.result.json",
     }
+    return {key: Path(value) for key, value in paths.items()}
+
+
+class _OutputLimitExceeded(BaseException):
+    """Raised inside the runner once captured output crosses its cap."""
+
+
+class CountingStringIO(io.StringIO):
+    """StringIO that tracks UTF-8 size and line count as text is written.
+
+    When caps are given, the write that crosses one keeps only the part that fits, raises
+    `_OutputLimitExceeded`, and later writes are dropped, so a runaway runner cannot grow the
+    buffer without bound.
+    """
+
+    __slots__ = ("nbytes", "nlines", "limit_exceeded", "_open_line", "_byte_cap", "_line_cap")
+
+    def __init__(self, *, byte_cap: int | None = None, line_cap: int | None = None) -> None:
+        super().__init__()
+        self.nbytes = 0
+        self.nlines = 0
+        self.limit_exceeded = False
+        self._open_line = False
+        self._byte_cap = byte_cap
+        self._line_cap = line_cap
+
+    def write(self, text: str) -> int:
+        if self.limit_exceeded:
+            return len(text)
+        if not text:
+            return super().write(text)
+        nbytes = len(text) if text.isascii() else len(text.encode("utf-8"))
+        nlines = text.count("\n")
+        open_line = not text.endswith("\n")
+        if (self._byte_cap is None or self.nbytes + nbytes <= self._byte_cap) and (
+            self._line_cap is None or self.nlines + nlines + open_line <= self._line_cap
+        ):
+            self._count(nbytes, nlines, open_line)
+            return super().write(text)
+        # keep only the part that fits, so one oversized write cannot grow the buffer
+        kept = self._fitting_prefix(text)
+        if kept:
+            self._count(len(kept.encode("utf-8")), kept.count("\n"), not kept.endswith("\n"))
+            super().write(kept)
+        self.limit_exceeded = True
+        raise _OutputLimitExceeded()
+
+    def _count(self, nbytes: int, nlines: int, open_line: bool) -> None:
+        self.nbytes += nbytes
+        self.nlines += nlines
+        self._open_line = open_line
+
+    def _fitting_prefix(self, text: str) -> str:
+        end = len(text)
+        if self._line_cap is not None:
+            count = self.line_count
+            open_line = self._open_line
+            pos = 0
+            while pos < end:
+                if not open_line:
+                    # the next character would start a new line
+                    if count >= self._line_cap:
+                        end = pos
+                        break
+                    count += 1
+                newline = text.find("\n", pos, end)
+                if newline == -1:
+                    break
+                pos = newline + 1
+                open_line = False
+        kept = text[:end]
+        if self._byte_cap is not None:
+            room = max(self._byte_cap - self.nbytes, 0)
+            # a multi-byte character cut by the cap is dropped whole
+            kept = kept.encode("utf-8")[:room].decode("utf-8", errors="ignore")
+        return kept
+
+    @property
+    def line_count(self) -> int:
+        return self.nlines + (1 if self._open_line else 0)
 
 
 def log_path(
@@ -116,12 +198,14 @@ def log_path(
 
 def _append_log(log_path_value: Path, stdout_text: str, stderr_text: str) -> None:
     log_path_value.parent.mkdir(parents=True, exist_ok=True)
-    with log_path_value.open("a", encoding="utf-8") as handle:
-        handle.write("[stdout]\n")
-        handle.write(stdout_text)
-        handle.write("\n[stderr]\n")
-        handle.write(stderr_text)
-        handle.write("\n")
+    payload = memoryview(f"[stdout]\n{stdout_text}\n[stderr]\n{stderr_text}\n".encode())
+    # one O_APPEND write keeps concurrent wrapper runs from interleaving their sections
+    fd = os.open(log_path_value, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+    try:
+        while payload:
+            payload = payload[os.write(fd, payload) :]
+    finally:
+        os.close(fd)
 
 
 def run_guarded(
@@ -132,34 +216,31 @@ def run_guarded(
     stdout_max_bytes: int = STDOUT_MAX_BYTES,
     stderr_max_lines: int = STDERR_MAX_LINES,
 ) -> LaunchResult:
-    out_buf = io.StringIO()
-    err_buf = io.StringIO()
+    out_buf = CountingStringIO(byte_cap=stdout_max_bytes, line_cap=stdout_max_lines)
+    err_buf = CountingStringIO(line_cap=stderr_max_lines)
     wrapped_exit_code = 0
     try:
         with redirect_stdout(out_buf), redirect_stderr(err_buf):
             result = runner()
         wrapped_exit_code = int(result or 0)
+    except _OutputLimitExceeded:
+        wrapped_exit_code = OUTPUT_LIMIT_EXIT_CODE
     except SystemExit as exc:
         wrapped_exit_code = (
             int(exc.code or 0) if isinstance(exc.code, int) else RUNTIME_FAILURE_EXIT_CODE
         )
     except Exception as exc:  # pragma: no cover - defensive fallback
         wrapped_exit_code = RUNTIME_FAILURE_EXIT_CODE
-        err_buf.write(f"[aidd] ERROR: {exc}\n")
-
-    stdout_text = out_buf.getvalue()
-    stderr_text = err_buf.getvalue()
-    _append_log(log_path_value, stdout_text, stderr_text)
+        with suppress(_OutputLimitExceeded):
+            err_buf.write(f"[aidd] ERROR: {exc}\n")
 
-    stdout_lines = len(stdout_text.splitlines())
-    stdout_bytes = len(stdout_text.encode("utf-8"))
-    stderr_lines = len(stderr_text.splitlines())
-    output_limited = (
-        stdout_lines > stdout_max_lines
-        or stdout_bytes > stdout_max_bytes
-        or stderr_lines > stderr_max_lines
-    )
+    stdout_lines = out_buf.line_count
+    stdout_bytes = out_buf.nbytes
+    stderr_lines = err_buf.line_count
+    output_limited = out_buf.limit_exceeded or err_buf.limit_exceeded
     if output_limited:
+        # the captured text only goes to the log; don't keep a copy around for the result
+        _append_log(log_path_value, out_buf.getvalue(), err_buf.getvalue())
         limited_stderr = (
             "[aidd] ERROR: output exceeded limits "
             f"(stdout lines={stdout_lines} bytes={stdout_bytes}, stderr lines={stderr_lines}). "
@@ -176,6 +257,10 @@ def run_guarded(
             stdout_bytes=stdout_bytes,
             stderr_lines=stderr_lines,
         )
+
+    stdout_text = out_buf.getvalue()
+    stderr_text = err_buf.getvalue()
+    _append_log(log_path_value, stdout_text, stderr_text)
     return LaunchResult(
         exit_code=wrapped_exit_code,
         wrapped_exit_code=wrapped_exit_code,
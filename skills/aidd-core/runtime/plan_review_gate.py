@@ -39,15 +39,15 @@ def _bootstrap_entrypoint() -> None:
 _bootstrap_entrypoint()
 
 import argparse
-import re
+import functools
 from collections.abc import Iterable
 from pathlib import Path
 
 from aidd_runtime import gates
 from aidd_runtime.feature_ids import resolve_aidd_root
 
-DEFAULT_APPROVED = {"ready"}
-DEFAULT_BLOCKING = {"blocked"}
+DEFAULT_APPROVED = frozenset({"ready"})
+DEFAULT_BLOCKING = frozenset({"blocked"})
 REVIEW_HEADER = "## Plan Review"
 ACTION_ITEMS_HEADER = "action items"
 FENCE_PREFIXES = ("```", "~~~")
@@ -91,7 +91,30 @@ def normalize_path(raw: str, root: Path) -> str:
     return normalized.lstrip("/")
 
 
-def parse_review_section(content: str) -> tuple[bool, str, list[str]]:
+def _normalize_heading(text: str) -> str:
+    chars: list[str] = []
+    in_separator = False
+    for char in text:
+        if char == "-" or char == "_":
+            if not in_separator:
+                chars.append(" ")
+            in_separator = True
+            continue
+        in_separator = False
+        chars.append(char)
+    return "".join(chars)
+
+
+def _parse_status(raw_value: str) -> str:
+    end = 0
+    while end < len(raw_value) and raw_value[end].isascii() and raw_value[end].isalpha():
+        end += 1
+    return (raw_value[:end] if end else raw_value).lower()
+
+
+def _scan_review_section(
+    content: str, *, stop_at_open_item: bool = False
+) -> tuple[bool, str, list[str]]:
     inside = False
     found = False
     status = ""
@@ -101,9 +124,16 @@ def parse_review_section(content: str) -> tuple[bool, str, list[str]]:
     saw_action_items = False
     inside_fence = False
 
-    for raw in content.splitlines():
-        stripped = raw.strip()
-        if stripped.startswith("## "):
+    pos = 0
+    size = len(content)
+    while pos < size:
+        newline = content.find("\n", pos)
+        if newline == -1:
+            newline = size
+        stripped = content[pos:newline].strip()
+        pos = newline + 1
+
+        if stripped[:3] == "## ":
             if stripped == REVIEW_HEADER:
                 inside = True
                 found = True
@@ -123,23 +153,23 @@ def parse_review_section(content: str) -> tuple[bool, str, list[str]]:
         if inside_fence:
             continue
 
-        if stripped.startswith("### "):
-            heading = re.sub(r"[-_]+", " ", stripped[4:].strip().lower())
+        if stripped[:4] == "### ":
+            heading = _normalize_heading(stripped[4:].strip().lower())
             inside_action_items = heading == ACTION_ITEMS_HEADER
             if inside_action_items:
                 saw_action_items = True
             continue
 
-        lower = stripped.lower()
-        if lower.startswith("status:"):
-            raw_value = stripped.split(":", 1)[1].strip()
-            match = re.match(r"([a-z]+)", raw_value, flags=re.IGNORECASE)
-            status = match.group(1).lower() if match else raw_value.lower()
+        if stripped[:7].lower() == "status:":
+            status = _parse_status(stripped[7:].strip())
             continue
 
-        if stripped.startswith("- ["):
+        if stripped[:3] == "- [":
             if inside_action_items:
                 action_items.append(stripped)
+                if stop_at_open_item and status and stripped.startswith("- [ ]"):
+                    # the gate only needs to know that an open item exists
+                    return found, status, action_items
             elif not saw_action_items:
                 fallback_items.append(stripped)
 
@@ -149,6 +179,50 @@ def parse_review_section(content: str) -> tuple[bool, str, list[str]]:
     return found, status, action_items
 
 
+def parse_review_section(content: str) -> tuple[bool, str, list[str]]:
+    return _scan_review_section(content)
+
+
+def parse_review_section_for_gate(
+    content: str, *, stop_at_open_item: bool = True
+) -> tuple[bool, str, bool]:
+    """Return (found, status, has_open_item).
+
+    With ``stop_at_open_item`` the scan ends at the first open action item, which is only
+    safe when open items block anyway; otherwise the last ``Status:`` line must be seen.
+    """
+    found, status, action_items = _scan_review_section(content, stop_at_open_item=stop_at_open_item)
+    return found, status, any(item.startswith("- [ ]") for item in action_items)
+
+
+@functools.lru_cache(maxsize=16)
+def _review_gate_cached(
+    path_str: str, mtime_ns: int, size: int, stop_at_open_item: bool
+) -> tuple[bool, str, bool]:
+    return parse_review_section_for_gate(
+        Path(path_str).read_text(encoding="utf-8"), stop_at_open_item=stop_at_open_item
+    )
+
+
+def load_review_section(
+    plan_path: Path, *, stop_at_open_item: bool = True
+) -> tuple[bool, str, bool]:
+    """Scan the plan review for the gate, reusing the result while the plan is unchanged."""
+    stat = plan_path.stat()
+    return _review_gate_cached(str(plan_path), stat.st_mtime_ns, stat.st_size, stop_at_open_item)
+
+
+@functools.lru_cache(maxsize=16)
+def _lowered_statuses(items: tuple[str, ...]) -> frozenset[str]:
+    return frozenset(item.lower() for item in items)
+
+
+def _status_set(raw: Iterable[object] | None, default: frozenset[str]) -> frozenset[str]:
+    if raw is None:
+        return default
+    return _lowered_statuses(tuple(str(item) for item in raw))
+
+
 def run_gate(args: argparse.Namespace) -> int:
     root = detect_project_root()
     config_path = Path(args.config)
@@ -181,8 +255,8 @@ def run_gate(args: argparse.Namespace) -> int:
     if args.skip_on_plan_edit and normalized.endswith(f"docs/plan/{ticket}.md"):
         return 0
 
-    content = plan_path.read_text(encoding="utf-8")
-    found, status, action_items = parse_review_section(content)
+    require_closed = bool(gate.get("require_action_items_closed", True))
+    found, status, has_open_items = load_review_section(plan_path, stop_at_open_item=require_closed)
 
     allow_missing = bool(gate.get("allow_missing_section", False))
     if not found:
@@ -193,12 +267,8 @@ def run_gate(args: argparse.Namespace) -> int:
         )
         return 1
 
-    approved: set[str] = {
-        str(item).lower() for item in gate.get("approved_statuses", DEFAULT_APPROVED)
-    }
-    blocking: set[str] = {
-        str(item).lower() for item in gate.get("blocking_statuses", DEFAULT_BLOCKING)
-    }
+    approved = _status_set(gate.get("approved_statuses"), DEFAULT_APPROVED)
+    blocking = _status_set(gate.get("blocking_statuses"), DEFAULT_BLOCKING)
 
     if status in blocking:
         print(
@@ -212,13 +282,9 @@ def run_gate(args: argparse.Namespace) -> int:
         )
         return 1
 
-    if bool(gate.get("require_action_items_closed", True)):
-        for item in action_items:
-            if item.startswith("- [ ]"):
-                print(
-                    f"BLOCK: Plan Review still has open action items -> update docs/plan/{ticket}.md"
-                )
-                return 1
+    if require_closed and has_open_items:
+        print(f"BLOCK: Plan Review still has open action items -> update docs/plan/{ticket}.md")
+        return 1
 
     return 0
 
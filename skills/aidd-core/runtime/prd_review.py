@@ -49,11 +49,12 @@ import json
 import os
 import re
 import sys
-from collections.abc import Iterable
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
 from pathlib import Path
 
+from aidd_runtime import prd_scan
 from aidd_runtime.feature_ids import resolve_aidd_root, resolve_identifiers
+from aidd_runtime.prd_scan import MAX_PLACEHOLDER_FINDINGS, scan_prd
 
 
 def detect_project_root(target: Path | None = None) -> Path:
@@ -64,9 +65,11 @@ def detect_project_root(target: Path | None = None) -> Path:
 DEFAULT_STATUS = "pending"
 APPROVED_STATUSES = {"ready"}
 BLOCKING_TOKENS = {"blocked", "reject"}
-PLACEHOLDER_PATTERN = re.compile(r"<[^>]+>")
+PLACEHOLDER_FINDING_TITLE = "Placeholder content found in PRD"
 REVIEW_SECTION_HEADER = "## PRD Review"
-REVIEW_SECTION_HEADER_RE = re.compile(r"^##\s+(?:\d+\.\s+)?PRD Review\s*$", re.IGNORECASE)
+_ID_SEP = b"|"
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False, indent=2)
+_WS_RE = re.compile(r"\s+")
 
 
 def _normalize_output_path(root: Path, path: Path) -> Path:
@@ -78,7 +81,8 @@ def _normalize_output_path(root: Path, path: Path) -> Path:
         parts = path.parts
     if parts and parts[0] == "aidd" and root.name == "aidd":
         path = Path(*parts[1:])
-    return (root / path).resolve()
+    # root comes from detect_project_root and is already resolved
+    return Path(os.path.normpath(root / path))
 
 
 def _rel_path(root: Path, path: Path) -> str:
@@ -92,20 +96,20 @@ def _rel_path(root: Path, path: Path) -> str:
 
 
 def _normalize_id_text(value: str) -> str:
-    return " ".join(str(value).strip().split())
+    return _WS_RE.sub(" ", str(value)).strip()
 
 
 def _stable_id(prefix: str, *parts: str) -> str:
-    digest = hashlib.sha1()
+    digest = hashlib.blake2b(digest_size=6)
     digest.update(prefix.encode("utf-8"))
-    digest.update(b"|")
+    digest.update(_ID_SEP)
     for part in parts:
         digest.update(_normalize_id_text(str(part)).encode("utf-8"))
-        digest.update(b"|")
-    return digest.hexdigest()[:12]
+        digest.update(_ID_SEP)
+    return digest.hexdigest()
 
 
-@dataclass
+@dataclass(slots=True)
 class Finding:
     severity: str  # critical | major | minor
     title: str
@@ -117,7 +121,7 @@ class Finding:
             self.id = _stable_id("prd", self.severity, self.title, self.details)
 
 
-@dataclass
+@dataclass(slots=True)
 class Report:
     ticket: str
     slug: str
@@ -128,9 +132,23 @@ class Report:
     generated_at: str
 
     def to_dict(self) -> dict:
-        payload = asdict(self)
-        payload["findings"] = [asdict(item) for item in self.findings]
-        return payload
+        return {
+            "ticket": self.ticket,
+            "slug": self.slug,
+            "status": self.status,
+            "recommended_status": self.recommended_status,
+            "findings": [
+                {
+                    "severity": item.severity,
+                    "title": item.title,
+                    "details": item.details,
+                    "id": item.id,
+                }
+                for item in self.findings
+            ],
+            "action_items": list(self.action_items),
+            "generated_at": self.generated_at,
+        }
 
 
 def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
@@ -201,57 +219,33 @@ def locate_prd(root: Path, ticket: str, explicit: Path | None) -> Path:
     return root / "docs" / "prd" / f"{ticket}.prd.md"
 
 
-def extract_review_section(content: str) -> tuple[str, list[str]]:
+def extract_review_section(content: str | bytes) -> tuple[str, list[str]]:
     """Return status string and action items from the PRD Review section."""
-    lines = content.splitlines()
-    status = DEFAULT_STATUS
-    action_items: list[str] = []
-    inside_section = False
-
-    for line in lines:
-        stripped_heading = line.strip()
-        if stripped_heading.startswith("## "):
-            inside_section = REVIEW_SECTION_HEADER_RE.match(stripped_heading) is not None
-            continue
-        if not inside_section:
-            continue
-
-        stripped = line.strip()
-        if stripped.lower().startswith("status:"):
-            status = stripped.split(":", 1)[1].strip().lower() or DEFAULT_STATUS
-        elif stripped.startswith("- ["):
-            action_items.append(stripped)
-    return status, action_items
-
-
-def collect_placeholders(content: str) -> Iterable[str]:
-    for line in content.splitlines():
-        trimmed = line.strip()
-        if not trimmed:
-            continue
-        if "TODO" in trimmed or "TBD" in trimmed:
-            yield trimmed
-            continue
-        if PLACEHOLDER_PATTERN.search(trimmed):
-            yield trimmed
-
-
-def analyse_prd(slug: str, prd_path: Path, *, ticket: str | None = None) -> Report:
+    scan = scan_prd(content)
+    return scan.review_status or DEFAULT_STATUS, scan.action_items
+
+
+def analyse_prd(
+    slug: str, prd_path: Path, *, ticket: str | None = None, cache_root: Path | None = None
+) -> Report:
     try:
-        content = prd_path.read_text(encoding="utf-8")
+        scan = prd_scan.scan(prd_path, cache_root=cache_root)
     except FileNotFoundError:
         raise SystemExit(f"[prd-review] PRD not found: {prd_path}")
 
-    status, action_items = extract_review_section(content)
-    findings: list[Finding] = []
-
-    placeholder_hits = list(collect_placeholders(content))
-    for item in placeholder_hits:
+    status = scan.review_status or DEFAULT_STATUS
+    action_items = scan.action_items
+    placeholder_hits = scan.placeholder_lines
+    findings = [
+        Finding(severity="major", title=PLACEHOLDER_FINDING_TITLE, details=item)
+        for item in placeholder_hits
+    ]
+    if scan.placeholders_truncated:
         findings.append(
             Finding(
                 severity="major",
-                title="Placeholder content found in PRD",
-                details=item,
+                title="Additional placeholders truncated",
+                details=f"Only the first {MAX_PLACEHOLDER_FINDINGS} placeholder lines are listed.",
             )
         )
 
@@ -323,13 +317,15 @@ def run(args: argparse.Namespace) -> int:
     slug = slug_hint or ticket
     prd_path = locate_prd(root, ticket, args.prd)
     try:
-        report = analyse_prd(slug, prd_path, ticket=ticket)
+        report = analyse_prd(slug, prd_path, ticket=ticket, cache_root=root)
     except SystemExit as exc:
         message = str(exc)
         if message:
             print(message, file=sys.stderr)
         return 1
 
+    payload = report.to_dict()
+    payload_json = _JSON_ENCODER.encode(payload)
     if args.emit_text or args.stdout_format in ("text", "auto"):
         print_text = args.emit_text or args.stdout_format == "text"
     else:
@@ -342,7 +338,7 @@ def run(args: argparse.Namespace) -> int:
         args.stdout_format in ("json", "auto") and not print_text
     ) or args.stdout_format == "json"
     if should_emit_json:
-        print(json.dumps(report.to_dict(), ensure_ascii=False, indent=2))
+        print(payload_json)
 
     output_path = args.report
     if output_path is None:
@@ -350,17 +346,18 @@ def run(args: argparse.Namespace) -> int:
     output_path = _normalize_output_path(root, output_path)
 
     previous_payload = None
-    if args.emit_patch and output_path.exists():
+    if args.emit_patch:
         try:
-            previous_payload = json.loads(output_path.read_text(encoding="utf-8"))
-        except Exception:
+            previous_payload = json.loads(output_path.read_bytes())
+        except (OSError, ValueError):
             previous_payload = None
 
-    output_path.write_text(
-        json.dumps(report.to_dict(), ensure_ascii=False, indent=2), encoding="utf-8"
-    )
+    # pack-only runs keep the report in memory and only write the pack sidecar
+    pack_only = bool(args.pack_only or os.getenv("AIDD_PACK_ONLY", "").strip() == "1")
     rel = _rel_path(root, output_path)
-    print(f"[prd-review] report saved to {rel}", file=sys.stderr)
+    if not pack_only:
+        output_path.write_bytes(payload_json.encode("utf-8"))
+        print(f"[prd-review] report saved to {rel}", file=sys.stderr)
     try:
         from aidd_runtime.reports import events as _events
 
@@ -379,29 +376,30 @@ def run(args: argparse.Namespace) -> int:
     try:
         from aidd_runtime import reports_pack
 
-        pack_path = reports_pack.write_prd_pack(output_path, root=root)
+        pack_path = reports_pack.write_prd_pack_from_payload(payload, output_path, root=root)
     except Exception as exc:
         print(f"[prd-review] WARN: failed to generate pack: {exc}", file=sys.stderr)
+    if pack_only:
+        if pack_path is None:
+            output_path.write_bytes(payload_json.encode("utf-8"))
+            print(f"[prd-review] report saved to {rel}", file=sys.stderr)
+        else:
+            # a report left by an earlier full run would shadow the pack in prd_review_gate
+            try:
+                output_path.unlink(missing_ok=True)
+            except OSError:
+                pass
+            print(f"[prd-review] pack saved to {_rel_path(root, pack_path)}", file=sys.stderr)
 
     if args.emit_patch and previous_payload is not None:
         try:
             from aidd_runtime import json_patch as _json_patch
 
-            patch_ops = _json_patch.diff(previous_payload, report.to_dict())
+            patch_ops = _json_patch.diff(previous_payload, payload)
             patch_path = output_path.with_suffix(".patch.json")
-            patch_path.write_text(
-                json.dumps(patch_ops, ensure_ascii=False, indent=2) + "\n",
-                encoding="utf-8",
-            )
+            patch_path.write_bytes((_JSON_ENCODER.encode(patch_ops) + "\n").encode("utf-8"))
         except Exception as exc:
             print(f"[prd-review] WARN: failed to emit patch: {exc}", file=sys.stderr)
-
-    pack_only = bool(args.pack_only or os.getenv("AIDD_PACK_ONLY", "").strip() == "1")
-    if pack_only and pack_path and pack_path.exists():
-        try:
-            output_path.unlink()
-        except OSError:
-            pass
     return 0
 
 
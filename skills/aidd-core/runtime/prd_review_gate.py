@@ -45,13 +45,18 @@ def _bootstrap_entrypoint() -> None:
 _bootstrap_entrypoint()
 
 import argparse
+import functools
 import json
+import os
 import re
 from collections.abc import Iterable
+from dataclasses import dataclass
+from fnmatch import translate
 from pathlib import Path
 
-from aidd_runtime import gates
+from aidd_runtime import gates, prd_scan
 from aidd_runtime.feature_ids import resolve_aidd_root
+from aidd_runtime.prd_scan import scan_prd
 
 DEFAULT_APPROVED = {"ready"}
 DEFAULT_BLOCKING = {"blocked"}
@@ -71,10 +76,10 @@ DEFAULT_CODE_PREFIXES = (
     "cmd/",
 )
 REVIEW_HEADER = "## PRD Review"
-REVIEW_HEADER_RE = re.compile(r"^##\s+(?:\d+\.\s+)?PRD Review\s*$", re.IGNORECASE)
 DIALOG_HEADER = "## Analyst dialogue"
 LEGACY_DIALOG_HEADER = "## Dialog analyst"
-DIALOG_HEADERS = (DIALOG_HEADER, LEGACY_DIALOG_HEADER)
+DEFAULT_REPORT_TEMPLATE = "aidd/reports/prd/{ticket}.json"
+_REPORT_PLACEHOLDER_RE = re.compile(r"(\{ticket\}|\{slug\})")
 
 
 def feature_label(ticket: str, slug_hint: str | None = None) -> str:
@@ -125,14 +130,19 @@ def parse_args(argv: Iterable[str] | None = None) -> argparse.Namespace:
     return parser.parse_args(list(argv) if argv is not None else None)
 
 
-def _normalize_file_path(raw: str, root: Path) -> str:
+def _normalize_file_path(raw: str, root_resolved: Path) -> str:
     if not raw:
         return ""
-    try:
-        rel = Path(raw).resolve().relative_to(root.resolve())
-        normalized = rel.as_posix()
-    except Exception:
-        normalized = raw.replace("\\", "/")
+    root_prefix = os.path.join(str(root_resolved), "")
+    candidate = os.path.normpath(raw) if os.path.isabs(raw) else ""
+    if candidate.startswith(root_prefix):
+        # already under the resolved root: slice instead of a realpath round-trip
+        normalized = Path(candidate[len(root_prefix) :]).as_posix()
+    else:
+        try:
+            normalized = Path(raw).resolve().relative_to(root_resolved).as_posix()
+        except Exception:
+            normalized = raw.replace("\\", "/")
     if normalized.startswith("./"):
         normalized = normalized[2:]
     return normalized.lstrip("/")
@@ -154,39 +164,106 @@ def _normalize_items(values: Iterable[str] | None, *, suffix: str = "") -> list[
     return result
 
 
-def _is_code_path(path: str, prefixes: Iterable[str], globs: Iterable[str]) -> bool:
+def _compile_globs(globs: Iterable[str]) -> re.Pattern[str] | None:
+    patterns = [f"(?:{translate(pattern)})" for pattern in globs]
+    return re.compile("|".join(patterns)) if patterns else None
+
+
+def _is_code_path(path: str, prefixes: tuple[str, ...], globs_re: re.Pattern[str] | None) -> bool:
     normalized = path.replace("\\", "/")
     if not normalized:
         return False
-    for prefix in prefixes:
-        if normalized.startswith(prefix):
-            return True
-    for pattern in globs:
-        if fnmatch(normalized, pattern):
-            return True
-    return False
+    return normalized.startswith(prefixes) or (
+        globs_re is not None and globs_re.match(normalized) is not None
+    )
+
+
+@dataclass(frozen=True)
+class GateSettings:
+    enabled: bool
+    skip_branches: tuple[str, ...] | None
+    branches: tuple[str, ...] | None
+    allow_missing_section: bool
+    require_action_items_closed: bool
+    approved: frozenset[str]
+    blocking: frozenset[str]
+    blocking_severities: frozenset[str]
+    code_prefixes: tuple[str, ...]
+    code_globs_re: re.Pattern[str] | None
+    allow_missing_report: bool
+    report_template_parts: tuple[str, ...]
+
+    @property
+    def report_templated(self) -> bool:
+        return len(self.report_template_parts) > 1
+
+    def report_path_text(self, ticket: str, slug: str) -> str:
+        values = {"{ticket}": ticket, "{slug}": slug}
+        return "".join(values.get(part, part) for part in self.report_template_parts)
+
+
+def _branch_patterns(raw: object) -> tuple[str, ...] | None:
+    # config may hold one pattern or a list of them; gates.matches takes either
+    if isinstance(raw, str):
+        return (raw,) if raw else None
+    if isinstance(raw, list | tuple):
+        return tuple(item for item in raw if isinstance(item, str))
+    return None
+
+
+def _build_gate_settings(gate: dict) -> GateSettings:
+    return GateSettings(
+        enabled=bool(gate.get("enabled", True)),
+        skip_branches=_branch_patterns(gate.get("skip_branches")),
+        branches=_branch_patterns(gate.get("branches")),
+        allow_missing_section=bool(gate.get("allow_missing_section", False)),
+        require_action_items_closed=bool(gate.get("require_action_items_closed", True)),
+        approved=frozenset(
+            str(item).lower() for item in gate.get("approved_statuses", DEFAULT_APPROVED)
+        ),
+        blocking=frozenset(
+            str(item).lower() for item in gate.get("blocking_statuses", DEFAULT_BLOCKING)
+        ),
+        blocking_severities=frozenset(
+            str(item).lower()
+            for item in gate.get("blocking_severities", DEFAULT_BLOCKING_SEVERITIES)
+        ),
+        code_prefixes=tuple(
+            _normalize_items(gate.get("code_prefixes"), suffix="/") or DEFAULT_CODE_PREFIXES
+        ),
+        code_globs_re=_compile_globs(_normalize_items(gate.get("code_globs"))),
+        allow_missing_report=bool(gate.get("allow_missing_report", False)),
+        report_template_parts=tuple(
+            _REPORT_PLACEHOLDER_RE.split(gate.get("report_path") or DEFAULT_REPORT_TEMPLATE)
+        ),
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _load_gate_cached(path_str: str, mtime_ns: int, size: int) -> GateSettings:
+    try:
+        gate = gates.load_gate_section(Path(path_str), "prd_review")
+    except ValueError:
+        gate = {}
+    return _build_gate_settings(gate)
+
+
+def load_gate_settings(config_path: Path) -> GateSettings:
+    """Return the prd_review gate settings, reusing them while the config file is unchanged."""
+    try:
+        stat = config_path.stat()
+    except OSError:
+        return _build_gate_settings({})
+    return _load_gate_cached(str(config_path), stat.st_mtime_ns, stat.st_size)
+
+
+def detect_project_root(target: Path | None = None) -> Path:
+    return resolve_aidd_root(target or Path.cwd())
 
 
 def parse_review_section(content: str) -> tuple[bool, str, list[str]]:
-    inside = False
-    found = False
-    status = ""
-    action_items: list[str] = []
-    for raw in content.splitlines():
-        stripped = raw.strip()
-        if stripped.startswith("## "):
-            inside = REVIEW_HEADER_RE.match(stripped) is not None
-            if inside:
-                found = True
-            continue
-        if not inside:
-            continue
-        lower = stripped.lower()
-        if lower.startswith("status:"):
-            status = stripped.split(":", 1)[1].strip().lower()
-        elif stripped.startswith("- ["):
-            action_items.append(stripped)
-    return found, status, action_items
+    scan = scan_prd(content)
+    return scan.review_found, scan.review_status, scan.action_items
 
 
 def _resolve_report_path(root: Path, template: str) -> Path:
@@ -195,7 +272,7 @@ def _resolve_report_path(root: Path, template: str) -> Path:
         parts = report_path.parts
         if parts and parts[0] == "aidd" and root.name == "aidd":
             report_path = Path(*parts[1:])
-        report_path = root / report_path
+        report_path = root.joinpath(report_path)
     return report_path
 
 
@@ -260,109 +337,68 @@ def format_message(
     return f"BLOCK: PRD Review is not ready -> run /feature-dev-aidd:review-spec {label or ticket}"
 
 
-def detect_project_root(target: Path | None = None) -> Path:
-    return resolve_aidd_root(target or Path.cwd())
-
-
-def extract_dialog_status(content: str) -> str | None:
-    inside = False
-    for raw in content.splitlines():
-        stripped = raw.strip()
-        lower = stripped.lower()
-        if any(lower.startswith(header.lower()) for header in DIALOG_HEADERS):
-            inside = True
-            continue
-        if inside and stripped.startswith("## "):
-            break
-        if inside and lower.startswith("status:"):
-            return stripped.split(":", 1)[1].strip().lower()
-    return None
-
-
 def run_gate(args: argparse.Namespace) -> int:
     root = detect_project_root()
     config_path = Path(args.config)
     if not config_path.is_absolute():
         config_path = root / config_path
-    try:
-        gate = gates.load_gate_section(config_path, "prd_review")
-    except ValueError:
-        gate = {}
+    settings = load_gate_settings(config_path)
 
     ticket = args.ticket.strip()
     slug_hint = args.slug_hint.strip() or None
 
-    enabled = bool(gate.get("enabled", True))
-    if not enabled:
+    if not settings.enabled:
         return 0
 
-    if gates.matches(gate.get("skip_branches"), args.branch):
+    if gates.matches(settings.skip_branches, args.branch):
         return 0
-    branches = gate.get("branches")
-    if branches and not gates.matches(branches, args.branch):
+    if settings.branches and not gates.matches(settings.branches, args.branch):
         return 0
 
-    code_prefixes = tuple(
-        _normalize_items(gate.get("code_prefixes"), suffix="/") or DEFAULT_CODE_PREFIXES
-    )
-    code_globs = tuple(_normalize_items(gate.get("code_globs")))
-    normalized = _normalize_file_path(args.file_path, root)
+    normalized = _normalize_file_path(args.file_path, root.resolve())
     target_suffix = f"docs/prd/{ticket}.prd.md"
     if args.skip_on_prd_edit and normalized.endswith(target_suffix):
         return 0
-    if normalized and not _is_code_path(normalized, code_prefixes, code_globs):
+    if normalized and not _is_code_path(normalized, settings.code_prefixes, settings.code_globs_re):
         return 0
 
+    # the PRD is only opened once the edited path is known to need the gate
     prd_path = root / "docs" / "prd" / f"{ticket}.prd.md"
-    if not prd_path.is_file():
+    try:
+        scan = prd_scan.scan(prd_path, cache_root=root)
+    except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
         expected = prd_path.as_posix()
         print(
             f"BLOCK: missing PRD (expected {expected}) -> open aidd/docs/prd/{ticket}.prd.md, complete the dialog, and finish /feature-dev-aidd:review-spec {feature_label(ticket, slug_hint) or ticket}."
         )
         return 1
 
-    allow_missing = bool(gate.get("allow_missing_section", False))
-    require_closed = bool(gate.get("require_action_items_closed", True))
-    approved: set[str] = {
-        str(item).lower() for item in gate.get("approved_statuses", DEFAULT_APPROVED)
-    }
-    blocking: set[str] = {
-        str(item).lower() for item in gate.get("blocking_statuses", DEFAULT_BLOCKING)
-    }
-
-    content = prd_path.read_text(encoding="utf-8")
-    dialog_status = extract_dialog_status(content)
-    if dialog_status == "draft":
+    if scan.dialog_status == "draft":
         print(format_message("draft_dialog", ticket, slug_hint))
         return 1
-    found, status, action_items = parse_review_section(content)
+    status = scan.review_status
 
-    if not found:
-        if allow_missing:
+    if not scan.review_found:
+        if settings.allow_missing_section:
             return 0
         print(format_message("missing_section", ticket, slug_hint))
         return 1
 
-    if status in blocking:
+    if status in settings.blocking:
         print(format_message("blocking_status", ticket, slug_hint, status))
         return 1
 
-    if approved and status not in approved:
+    if settings.approved and status not in settings.approved:
         print(format_message("not_approved", ticket, slug_hint, status))
         return 1
 
-    if require_closed:
-        for item in action_items:
+    if settings.require_action_items_closed:
+        for item in scan.action_items:
             if item.startswith("- [ ]"):
                 print(format_message("open_actions", ticket, slug_hint, status))
                 return 1
 
-    allow_missing_report = bool(gate.get("allow_missing_report", False))
-    report_template = gate.get("report_path") or "aidd/reports/prd/{ticket}.json"
-    resolved_report = report_template.replace("{ticket}", ticket).replace(
-        "{slug}", slug_hint or ticket
-    )
-    report_path = _resolve_report_path(root, resolved_report)
+    report_path = _resolve_report_path(root, settings.report_path_text(ticket, slug_hint or ticket))
 
     report_data = None
     if report_path.exists():
@@ -396,23 +432,19 @@ def run_gate(args: argparse.Namespace) -> int:
         findings = (
             _inflate_columnar(raw_findings) if isinstance(raw_findings, dict) else raw_findings
         )
-        blocking_severities: set[str] = {
-            str(item).lower()
-            for item in gate.get("blocking_severities", DEFAULT_BLOCKING_SEVERITIES)
-        }
-        if blocking_severities:
+        if settings.blocking_severities:
             for finding in findings:
                 severity = ""
                 if isinstance(finding, dict):
                     severity = str(finding.get("severity") or "").lower()
-                if severity and severity in blocking_severities:
+                if severity and severity in settings.blocking_severities:
                     label = feature_label(ticket, slug_hint)
                     print(
                         f"BLOCK: PRD Review contains '{severity}' findings -> update PRD and rerun /feature-dev-aidd:review-spec {label or ticket}."
                     )
                     return 1
-    elif not allow_missing_report:
-        if "{ticket}" in report_template or "{slug}" in report_template:
+    elif not settings.allow_missing_report:
+        if settings.report_templated:
             message = format_message("missing_report", ticket, slug_hint)
         else:
             label = feature_label(ticket, slug_hint)
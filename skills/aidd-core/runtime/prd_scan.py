@@ -0,0 +1,161 @@
+"""Shared PRD scanner for prd-review and the prd-review gate.
+
+Scan results are stored in `<aidd_root>/.cache/prd_scan/` and reused while the
+PRD's mtime and size and the scanner's SCAN_VERSION are unchanged.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+from collections.abc import Iterator
+from dataclasses import asdict, dataclass
+from itertools import islice
+from pathlib import Path
+
+MAX_PLACEHOLDER_FINDINGS = 50
+PLACEHOLDER_PATTERN = re.compile(r"TODO|TBD|<[^>\n]+>")
+REVIEW_SECTION_HEADER_RE = re.compile(r"^##\s+(?:\d+\.\s+)?PRD Review\s*$", re.IGNORECASE)
+DIALOG_SECTION_PREFIXES = ("## analyst dialogue", "## dialog analyst")
+CACHE_DIRNAME = "prd_scan"
+# bump whenever scanning changes, so sidecars written by an older scanner are ignored
+SCAN_VERSION = 1
+# PRD scanning runs on raw UTF-8 bytes; only matched lines are decoded
+_DIALOG_PREFIXES_BYTES = tuple(prefix.encode("ascii") for prefix in DIALOG_SECTION_PREFIXES)
+_REVIEW_HEADER_BYTES_RE = re.compile(
+    REVIEW_SECTION_HEADER_RE.pattern.encode("ascii"), re.IGNORECASE
+)
+_HEADER_RE = re.compile(rb"^[^\S\n]*(## .*?)[^\S\n]*$", re.MULTILINE)
+_REVIEW_BODY_RE = re.compile(
+    rb"^[^\S\n]*(?:(?i:status):(?P<status>.*)|(?P<item>- \[.*?)[^\S\n]*)$", re.MULTILINE
+)
+_DIALOG_HEADER_RE = re.compile(
+    rb"^[^\S\n]*## (?:analyst dialogue|dialog analyst)", re.MULTILINE | re.IGNORECASE
+)
+_STATUS_LINE_RE = re.compile(rb"^[^\S\n]*(?i:status):(.*)$", re.MULTILINE)
+_PLACEHOLDER_LINE_RE = re.compile(
+    rb"^.*?(?:" + PLACEHOLDER_PATTERN.pattern.encode("ascii") + rb").*$", re.MULTILINE
+)
+
+
+@dataclass
+class PrdScan:
+    review_found: bool
+    review_status: str
+    action_items: list[str]
+    placeholder_lines: list[str]
+    placeholders_truncated: bool
+    dialog_status: str | None
+
+
+def _as_bytes(content: str | bytes) -> bytes:
+    return content.encode("utf-8") if isinstance(content, str) else content
+
+
+def _decode(raw: bytes) -> str:
+    return raw.decode("utf-8", errors="replace").strip()
+
+
+def scan_prd(content: str | bytes) -> PrdScan:
+    """Collect review status, action items, placeholders and dialog status from the PRD."""
+    data = _as_bytes(content)
+    review_found = False
+    review_status = ""
+    action_items: list[str] = []
+
+    # only `## ` headers are enumerated; section bodies are searched between header offsets
+    headers = list(_HEADER_RE.finditer(data))
+    for idx, header in enumerate(headers):
+        start = header.end()
+        end = headers[idx + 1].start() if idx + 1 < len(headers) else len(data)
+        if _REVIEW_HEADER_BYTES_RE.match(header.group(1)):
+            review_found = True
+            for body in _REVIEW_BODY_RE.finditer(data, start, end):
+                status = body.group("status")
+                if status is None:
+                    action_items.append(_decode(body.group("item")))
+                else:
+                    review_status = _decode(status).lower()
+
+    placeholders = collect_placeholders(data)
+    placeholder_lines = list(islice(placeholders, MAX_PLACEHOLDER_FINDINGS))
+    return PrdScan(
+        review_found=review_found,
+        review_status=review_status,
+        action_items=action_items,
+        placeholder_lines=placeholder_lines,
+        placeholders_truncated=next(placeholders, None) is not None,
+        dialog_status=extract_dialog_status(data),
+    )
+
+
+def extract_dialog_status(content: str | bytes) -> str | None:
+    """Return the status from the analyst dialog section, searching only that section."""
+    data = _as_bytes(content)
+    header = _DIALOG_HEADER_RE.search(data)
+    if header is None:
+        return None
+    start = header.end()
+    end = len(data)
+    for following in _HEADER_RE.finditer(data, start):
+        if not following.group(1).lower().startswith(_DIALOG_PREFIXES_BYTES):
+            end = following.start()
+            break
+    match = _STATUS_LINE_RE.search(data, start, end)
+    return _decode(match.group(1)).lower() if match else None
+
+
+def collect_placeholders(content: str | bytes) -> Iterator[str]:
+    for match in _PLACEHOLDER_LINE_RE.finditer(_as_bytes(content)):
+        yield _decode(match.group())
+
+
+def _cache_path(cache_root: Path, path: Path) -> Path:
+    digest = hashlib.blake2b(str(path).encode("utf-8"), digest_size=8).hexdigest()
+    return cache_root / ".cache" / CACHE_DIRNAME / f"{digest}.json"
+
+
+def _load_cached(cache_path: Path, mtime_ns: int, size: int) -> PrdScan | None:
+    try:
+        payload = json.loads(cache_path.read_bytes())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(payload, dict) or payload.get("version") != SCAN_VERSION:
+        return None
+    if payload.get("mtime_ns") != mtime_ns or payload.get("size") != size:
+        return None
+    try:
+        return PrdScan(**payload["scan"])
+    except (KeyError, TypeError):
+        return None
+
+
+def _write_cached(cache_path: Path, mtime_ns: int, size: int, result: PrdScan) -> None:
+    payload = {
+        "version": SCAN_VERSION,
+        "mtime_ns": mtime_ns,
+        "size": size,
+        "scan": asdict(result),
+    }
+    tmp_path = cache_path.with_suffix(cache_path.suffix + ".tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+        tmp_path.replace(cache_path)
+    except OSError:
+        return
+
+
+def scan(path: Path, *, cache_root: Path | None = None) -> PrdScan:
+    """Scan the PRD at `path`, reusing the sidecar under `cache_root` while it is unchanged."""
+    stat = path.stat()
+    cache_path = _cache_path(cache_root, path) if cache_root is not None else None
+    if cache_path is not None:
+        cached = _load_cached(cache_path, stat.st_mtime_ns, stat.st_size)
+        if cached is not None:
+            return cached
+    result = scan_prd(path.read_bytes())
+    if cache_path is not None:
+        _write_cached(cache_path, stat.st_mtime_ns, stat.st_size, result)
+    return result
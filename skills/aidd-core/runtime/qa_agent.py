@@ -42,17 +42,17 @@ _bootstrap_entrypoint()
 
 import argparse
 import datetime as dt
-import hashlib
+import functools
 import json
 import os
 import re
-import subprocess
+import stat
 import sys
+from collections import Counter
 from collections.abc import Iterable, Sequence
 from dataclasses import dataclass
 from pathlib import Path
 
-from aidd_runtime import runtime
 from aidd_runtime.feature_ids import resolve_aidd_root, resolve_identifiers
 
 
@@ -66,20 +66,58 @@ DEFAULT_BLOCKERS = ("blocker", "critical")
 DEFAULT_WARNINGS = ("major", "minor")
 SEVERITY_ORDER = ["blocker", "critical", "major", "minor", "info"]
 MANUAL_MARKERS = ("manual",)
-
-
+TOKENS_CACHE_FILENAME = "qa-tokens.json"
+TASKLIST_CACHE_FILENAME = "qa-tasklist.json"
+CACHE_DIRNAME = ".cache"
+# bump whenever the cached hits or findings change shape, so older caches are dropped
+CACHE_VERSION = 1
+_QA_CACHE_FILES = frozenset(
+    name + suffix
+    for name in (TOKENS_CACHE_FILENAME, TASKLIST_CACHE_FILENAME)
+    for suffix in ("", ".tmp")
+)
+CODE_SCAN_WORKERS = 8
+CODE_SCAN_DIRS = frozenset({"src", "tests"})
+CODE_SCAN_SUFFIXES = frozenset(
+    {".kt", ".kts", ".java", ".py", ".pyi", ".js", ".jsx", ".ts", ".tsx", ".json", ".yaml"}
+)
+CODE_TOKEN_RULES = {
+    "FIXME": (
+        "blocker",
+        "Found FIXME in code",
+        "Remove or resolve FIXME before merge (QA blocker).",
+    ),
+    "TODO": (
+        "major",
+        "Unresolved TODO",
+        "Resolve TODO or move it into a tracked task before release.",
+    ),
+}
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False, indent=2)
+_FRONT_MATTER_FENCE = "---"
+_HANDOFF_QA_START = "<!-- handoff:qa start -->"
+_HANDOFF_QA_END = "<!-- handoff:qa end -->"
+_HEADING_RE = re.compile(r"^#{1,6}\s+")
+_BLOCKING_RE = re.compile(r"\(Blocking:\s*(true|false)\)", re.IGNORECASE)
+_CODE_TOKENS_BYTES = tuple(token.encode("ascii") for token in CODE_TOKEN_RULES)
+_CODE_TOKEN_RE = re.compile(b"|".join(re.escape(token) for token in _CODE_TOKENS_BYTES))
+
+
+@functools.lru_cache(maxsize=4096)
 def _normalize_id_text(value: str) -> str:
-    return " ".join(str(value).strip().split())
+    return " ".join(value.split())
 
 
 def _stable_id(prefix: str, *parts: str) -> str:
-    digest = hashlib.sha1()
+    import hashlib
+
+    digest = hashlib.blake2b(digest_size=6)
     digest.update(prefix.encode("utf-8"))
     digest.update(b"|")
     for part in parts:
-        digest.update(_normalize_id_text(str(part)).encode("utf-8"))
+        digest.update(_normalize_id_text(part).encode("utf-8"))
         digest.update(b"|")
-    return digest.hexdigest()[:12]
+    return digest.hexdigest()
 
 
 def feature_label(ticket: str | None, slug_hint: str | None) -> str:
@@ -194,7 +232,9 @@ def detect_feature(
     return identifiers.resolved_ticket, identifiers.slug_hint
 
 
-def run_git(args: Sequence[str]) -> list[str]:
+def run_git(args: Sequence[str], *, sep: str | None = None) -> list[str]:
+    import subprocess
+
     cmd = ["git", *args]
     try:
         proc = subprocess.run(
@@ -209,70 +249,174 @@ def run_git(args: Sequence[str]) -> list[str]:
         return []
     if proc.returncode != 0:
         return []
+    if sep is not None:
+        # NUL-separated output keeps file names with spaces or newlines intact
+        return [item for item in proc.stdout.split(sep) if item]
     return [line.strip() for line in proc.stdout.splitlines() if line.strip()]
 
 
-def collect_changed_files() -> list[str]:
+def _parse_status_records(records: Sequence[str]) -> set[str]:
+    """Return paths from `git status --porcelain=v2 -z` records (changed, staged, untracked)."""
     files: set[str] = set()
+    skip_next = False
+    for record in records:
+        if skip_next:
+            # rename/copy entries are followed by the original path
+            skip_next = False
+            continue
+        kind = record[:1]
+        if kind == "1":
+            files.add(record.split(" ", 8)[8])
+        elif kind == "2":
+            files.add(record.split(" ", 9)[9])
+            skip_next = True
+        elif kind == "u":
+            files.add(record.split(" ", 10)[10])
+        elif kind == "?":
+            files.add(record[2:])
+    return files
+
+
+def _in_git_worktree(root: Path) -> bool:
+    if os.environ.get("GIT_DIR"):
+        return True
+    # the aidd root usually sits below the repository top level; `.git` may be a worktree file
+    return any((candidate / ".git").exists() for candidate in (root, *root.parents))
+
+
+def collect_changed_files() -> set[str]:
+    if not _in_git_worktree(ROOT_DIR):
+        return set()
+    status_args = ["status", "--porcelain=v2", "-z", "--untracked-files=all"]
     diff_base = os.environ.get("QA_AGENT_DIFF_BASE", "").strip()
-    if diff_base:
-        files.update(run_git(["diff", "--name-only", f"{diff_base}...HEAD"]))
-    files.update(run_git(["diff", "--name-only", "HEAD"]))
-    files.update(run_git(["diff", "--name-only", "--cached"]))
-    files.update(run_git(["ls-files", "--others", "--exclude-standard"]))
-    return sorted(files)
+    if not diff_base:
+        # one status call covers worktree, index and untracked changes
+        files = _parse_status_records(run_git(status_args, sep="\0"))
+        return {item for item in files if not _is_cache_path(item)}
+    from concurrent.futures import ThreadPoolExecutor
+
+    diff_args = ["diff", "--name-only", "-z", f"{diff_base}...HEAD"]
+    # both git processes start together instead of paying startup back to back
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        status_future = pool.submit(run_git, status_args, sep="\0")
+        diff_future = pool.submit(run_git, diff_args, sep="\0")
+        files = _parse_status_records(status_future.result())
+        files.update(diff_future.result())
+    return {item for item in files if not _is_cache_path(item)}
+
+
+@functools.lru_cache(maxsize=256)
+def _scan_file_tokens(path_str: str, mtime_ns: int, size: int) -> tuple[tuple[str, int, str], ...]:
+    """Return the first (token, line, snippet) hit per code token; keyed by file stat."""
+    try:
+        data = Path(path_str).read_bytes()
+    except OSError:
+        return ()
+    # most files carry no token at all: reject them on raw bytes before any decoding
+    if not any(token in data for token in _CODE_TOKENS_BYTES):
+        return ()
+    # one pass over the bytes finds the first occurrence of every token
+    found: dict[bytes, tuple[str, int, str]] = {}
+    for match in _CODE_TOKEN_RE.finditer(data):
+        token = match.group()
+        if token in found:
+            continue
+        start = match.start()
+        line_start = data.rfind(b"\n", 0, start) + 1
+        line_end = data.find(b"\n", start)
+        line = data[line_start : line_end if line_end != -1 else len(data)]
+        snippet = line.decode("utf-8", errors="replace").strip()
+        found[token] = (token.decode("ascii"), data.count(b"\n", 0, start) + 1, snippet)
+        if len(found) == len(_CODE_TOKENS_BYTES):
+            break
+    return tuple(found[token] for token in _CODE_TOKENS_BYTES if token in found)
+
 
+def _cache_path(root: Path, filename: str) -> Path:
+    return root / CACHE_DIRNAME / filename
 
-def _find_token_lines(content: str, token: str) -> Iterable[tuple[int, str]]:
-    for idx, line in enumerate(content.splitlines(), start=1):
-        if token in line:
-            yield idx, line.strip()
+
+def _is_cache_path(relative: str) -> bool:
+    """Return True for the QA caches (and their tmp files) so they are never scanned."""
+    parts = Path(relative).parts
+    if len(parts) < 2 or parts[-2] != CACHE_DIRNAME or parts[-1] not in _QA_CACHE_FILES:
+        return False
+    # git reports paths from the repository top level, which may sit above ROOT_DIR
+    prefix = parts[:-2]
+    return not prefix or ROOT_DIR.parts[-len(prefix) :] == prefix
+
+
+def _load_json_cache(path: Path) -> dict:
+    """Return the cached entries, or nothing when the cache is missing or from another version."""
+    try:
+        payload = json.loads(path.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(payload, dict) or payload.get("version") != CACHE_VERSION:
+        return {}
+    entries = payload.get("entries")
+    return entries if isinstance(entries, dict) else {}
+
+
+def _write_json_cache(path: Path, entries: dict) -> None:
+    payload = {"version": CACHE_VERSION, "entries": entries}
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        tmp_path.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+        tmp_path.replace(path)
+    except OSError:
+        return
 
 
 def analyse_code_tokens(files: Iterable[str]) -> list[Finding]:
     findings: list[Finding] = []
-    token_rules = {
-        "FIXME": (
-            "blocker",
-            "Found FIXME in code",
-            "Remove or resolve FIXME before merge (QA blocker).",
-        ),
-        "TODO": (
-            "major",
-            "Unresolved TODO",
-            "Resolve TODO or move it into a tracked task before release.",
-        ),
-    }
+    cache_path = _cache_path(ROOT_DIR, TOKENS_CACHE_FILENAME)
+    cache = _load_json_cache(cache_path)
+    scanned: list[str] = []
+    pending: list[tuple[str, str, int, int]] = []
     for relative in files:
-        path = ROOT_DIR / relative
-        if not path.is_file():
+        if _is_cache_path(relative):
             continue
+        relative_path = Path(relative)
         # Limit scanning to source files and tests.
-        if not any(
-            part in relative
-            for part in (
-                "src/",
-                "tests/",
-                ".kt",
-                ".java",
-                ".py",
-                ".js",
-                ".ts",
-                ".tsx",
-                ".json",
-                ".yaml",
-            )
+        if relative_path.suffix not in CODE_SCAN_SUFFIXES and CODE_SCAN_DIRS.isdisjoint(
+            relative_path.parts[:-1]
         ):
             continue
+        path = ROOT_DIR / relative_path
         try:
-            content = path.read_text(encoding="utf-8")
-        except (OSError, UnicodeDecodeError):
+            info = path.stat()
+        except OSError:
+            continue
+        if not stat.S_ISREG(info.st_mode):
             continue
-        for token, (severity, title, recommendation) in token_rules.items():
-            matches = list(_find_token_lines(content, token))
-            if not matches:
+        scanned.append(relative)
+        # unchanged files reuse the hits recorded by a previous QA run
+        entry = cache.get(relative)
+        if not isinstance(entry, dict) or entry.get("key") != [info.st_mtime_ns, info.st_size]:
+            pending.append((relative, str(path), info.st_mtime_ns, info.st_size))
+    if pending:
+        from concurrent.futures import ThreadPoolExecutor
+
+        # file reads release the GIL, so cache misses are scanned on a small ordered pool
+        with ThreadPoolExecutor(max_workers=min(CODE_SCAN_WORKERS, len(pending))) as pool:
+            relatives, paths, mtimes, sizes = zip(*pending, strict=True)
+            results = pool.map(_scan_file_tokens, paths, mtimes, sizes)
+            for relative, mtime_ns, size, hits in zip(
+                relatives, mtimes, sizes, results, strict=True
+            ):
+                cache[relative] = {"key": [mtime_ns, size], "hits": [list(hit) for hit in hits]}
+    # only this run's files are kept, so entries for old or deleted files do not pile up
+    kept = {relative: cache[relative] for relative in scanned}
+    if pending or len(kept) != len(cache):
+        _write_json_cache(cache_path, kept)
+    for relative in scanned:
+        for token, line_no, snippet in kept[relative].get("hits") or []:
+            rule = CODE_TOKEN_RULES.get(token)
+            if rule is None:
                 continue
-            line_no, snippet = matches[0]
+            severity, title, recommendation = rule
             findings.append(
                 Finding(
                     severity=severity,
@@ -285,19 +429,94 @@ def analyse_code_tokens(files: Iterable[str]) -> list[Finding]:
     return findings
 
 
-def _is_heading(line: str) -> bool:
-    return bool(re.match(r"^#{1,6}\s+", line))
-
-
 def _is_qa_checklist_heading(line: str) -> bool:
     return "AIDD:CHECKLIST_QA" in line
 
 
-def _extract_blocking_flag(line: str) -> bool | None:
-    match = re.search(r"\(Blocking:\s*(true|false)\)", line, re.IGNORECASE)
-    if not match:
+def _analyse_tasklist_lines(
+    tasklist_path: Path, lines: Iterable[str]
+) -> tuple[list[Finding], list[str]]:
+    findings: list[Finding] = []
+    manual_required: list[str] = []
+    in_front_matter = False
+    in_qa_checklist = False
+    in_handoff_qa = False
+    rel_path = str(tasklist_path.relative_to(ROOT_DIR))
+    title = f"Open QA item in {rel_path}"
+    for idx, raw in enumerate(lines, start=1):
+        stripped = raw.strip()
+        if stripped == _FRONT_MATTER_FENCE:
+            in_front_matter = not in_front_matter
+            continue
+        if in_front_matter:
+            continue
+        if stripped == _HANDOFF_QA_START:
+            in_handoff_qa = True
+            continue
+        if stripped == _HANDOFF_QA_END:
+            in_handoff_qa = False
+            continue
+        # only headings and checkbox bullets matter below
+        if not stripped.startswith(("#", "- [")):
+            continue
+        if stripped[0] == "#" and _HEADING_RE.match(stripped):
+            in_qa_checklist = _is_qa_checklist_heading(stripped)
+            continue
+        if not stripped.startswith("- ["):
+            continue
+        # `- [x]` / `- [X]` items are closed; plain slicing avoids a regex per bullet
+        if stripped[3:5] in ("x]", "X]"):
+            continue
+        if in_qa_checklist:
+            lowered = stripped.lower()
+            is_manual = any(marker in lowered for marker in MANUAL_MARKERS)
+            details = f"{rel_path}:{idx} → {stripped}"
+            if is_manual:
+                manual_required.append(details)
+            checklist_id = _stable_id("qa-checklist", rel_path, stripped)
+            findings.append(
+                Finding(
+                    severity="major" if is_manual else "blocker",
+                    scope="checklist",
+                    title=title,
+                    details=details,
+                    recommendation="Close QA checklist items or move them to backlog with rationale.",
+                    id=checklist_id,
+                )
+            )
+            continue
+        if not in_handoff_qa:
+            continue
+        blocking_match = _BLOCKING_RE.search(stripped)
+        if blocking_match is None:
+            continue
+        blocking_flag = blocking_match.group(1).lower() == "true"
+        handoff_id = _stable_id("qa-handoff", rel_path, stripped)
+        findings.append(
+            Finding(
+                severity="blocker" if blocking_flag else "major",
+                scope="checklist",
+                title=title,
+                details=f"{rel_path}:{idx} → {stripped}",
+                recommendation="Close QA checklist items or move them to backlog with rationale.",
+                id=handoff_id,
+                blocking=blocking_flag,
+            )
+        )
+    return findings, manual_required
+
+
+def _cached_tasklist_result(
+    entry: object, key: list[int]
+) -> tuple[list[Finding], list[str]] | None:
+    if not isinstance(entry, dict) or entry.get("key") != key:
+        return None
+    try:
+        findings = [Finding(**item) for item in entry.get("findings") or []]
+    except (TypeError, KeyError):
+        # written for another Finding shape: treat it as a miss
         return None
-    return match.group(1).lower() == "true"
+    return findings, list(entry.get("manual_required") or [])
 
 
 def analyse_tasklist(ticket: str | None, slug_hint: str | None) -> tuple[list[Finding], list[str]]:
@@ -311,81 +530,54 @@ def analyse_tasklist(ticket: str | None, slug_hint: str | None) -> tuple[list[Fi
         candidates.extend(sorted(tasklist_dir.glob("*.md")))
     findings: list[Finding] = []
     manual_required: list[str] = []
+    cache_path = _cache_path(ROOT_DIR, TASKLIST_CACHE_FILENAME)
+    cache = _load_json_cache(cache_path)
+    cache_dirty = False
     for tasklist_path in candidates:
         try:
-            lines = tasklist_path.read_text(encoding="utf-8").splitlines()
+            info = tasklist_path.stat()
         except OSError:
             continue
-        in_front_matter = False
-        in_qa_checklist = False
-        in_handoff_qa = False
-        for idx, raw in enumerate(lines, start=1):
-            stripped = raw.strip()
-            if stripped == "---":
-                in_front_matter = not in_front_matter
-                continue
-            if in_front_matter:
-                continue
-            if stripped == "<!-- handoff:qa start -->":
-                in_handoff_qa = True
-                continue
-            if stripped == "<!-- handoff:qa end -->":
-                in_handoff_qa = False
-                continue
-            if _is_heading(stripped):
-                if _is_qa_checklist_heading(stripped):
-                    in_qa_checklist = True
-                else:
-                    in_qa_checklist = False
-                continue
-            if not stripped.startswith("- ["):
-                continue
-            if re.match(r"- \[[xX]\]", stripped):
-                continue
-            if in_qa_checklist:
-                is_manual = any(marker in stripped.lower() for marker in MANUAL_MARKERS)
-                if is_manual:
-                    manual_required.append(
-                        f"{tasklist_path.relative_to(ROOT_DIR)}:{idx} → {stripped}"
-                    )
-                rel_path = tasklist_path.relative_to(ROOT_DIR)
-                checklist_id = _stable_id("qa-checklist", str(rel_path), stripped)
-                findings.append(
-                    Finding(
-                        severity="major" if is_manual else "blocker",
-                        scope="checklist",
-                        title=f"Open QA item in {tasklist_path.relative_to(ROOT_DIR)}",
-                        details=f"{tasklist_path.relative_to(ROOT_DIR)}:{idx} → {stripped}",
-                        recommendation="Close QA checklist items or move them to backlog with rationale.",
-                        id=checklist_id,
-                    )
-                )
-                continue
-            if not in_handoff_qa:
-                continue
-            blocking_flag = _extract_blocking_flag(stripped)
-            if blocking_flag is None:
+        rel_path = tasklist_path.relative_to(ROOT_DIR).as_posix()
+        key = [info.st_mtime_ns, info.st_size]
+        cached = _cached_tasklist_result(cache.get(rel_path), key)
+        if cached is not None:
+            # unchanged tasklists reuse the findings of a previous QA run
+            file_findings, file_manual = cached
+        else:
+            try:
+                # stream the file line by line instead of materialising the whole list
+                with tasklist_path.open(encoding="utf-8") as handle:
+                    file_findings, file_manual = _analyse_tasklist_lines(tasklist_path, handle)
+            except OSError:
                 continue
-            rel_path = tasklist_path.relative_to(ROOT_DIR)
-            handoff_id = _stable_id("qa-handoff", str(rel_path), stripped)
-            findings.append(
-                Finding(
-                    severity="blocker" if blocking_flag else "major",
-                    scope="checklist",
-                    title=f"Open QA item in {tasklist_path.relative_to(ROOT_DIR)}",
-                    details=f"{tasklist_path.relative_to(ROOT_DIR)}:{idx} → {stripped}",
-                    recommendation="Close QA checklist items or move them to backlog with rationale.",
-                    id=handoff_id,
-                    blocking=blocking_flag,
-                )
-            )
+            cache[rel_path] = {
+                "key": key,
+                "findings": [finding.to_dict() for finding in file_findings],
+                "manual_required": file_manual,
+            }
+            cache_dirty = True
+        findings.extend(file_findings)
+        manual_required.extend(file_manual)
+    if not ticket:
+        # a full run sees every tasklist, so entries for deleted or renamed ones are dropped
+        existing = {path.relative_to(ROOT_DIR).as_posix() for path in candidates}
+        for rel_path in [rel_path for rel_path in cache if rel_path not in existing]:
+            del cache[rel_path]
+            cache_dirty = True
+    if cache_dirty:
+        _write_json_cache(cache_path, cache)
     return findings, manual_required
 
 
-def analyse_tests_coverage(files: Sequence[str]) -> list[Finding]:
-    main_changes = [f for f in files if f.startswith("src/main/")]
-    test_changes = [f for f in files if f.startswith("src/test/") or f.startswith("tests/")]
-    if not main_changes or test_changes:
+def analyse_tests_coverage(files: Iterable[str]) -> list[Finding]:
+    main_changes: list[str] = []
+    for path in files:
+        if path.startswith(("src/test/", "tests/")):
+            return []
+        if path.startswith("src/main/"):
+            main_changes.append(path)
+    if not main_changes:
         return []
     changed_preview = ", ".join(main_changes[:3])
     if len(main_changes) > 3:
@@ -485,9 +677,7 @@ def summarise(
     warnings_set: set[str] | None = None,
 ) -> tuple[str, dict, int, int, str]:
     counts = dict.fromkeys(SEVERITY_ORDER, 0)
-    for finding in findings:
-        severity = finding.severity.lower()
-        counts[severity] = counts.get(severity, 0) + 1
+    counts.update(Counter(finding.severity.lower() for finding in findings))
 
     active_blockers = blockers_set or {"blocker", "critical"}
     active_warnings = warnings_set or {"major", "minor"}
@@ -515,9 +705,16 @@ def summarise(
     return summary, counts, blockers, warnings, status
 
 
-def write_report(report_path: Path, payload: dict) -> None:
+def write_report(report_path: Path, payload: dict, *, payload_json: str | None = None) -> None:
     report_path.parent.mkdir(parents=True, exist_ok=True)
-    report_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+    tmp_path = report_path.with_suffix(report_path.suffix + ".tmp")
+    with tmp_path.open("w", encoding="utf-8") as handle:
+        if payload_json is not None:
+            handle.write(payload_json)
+        else:
+            # stream into the file instead of building the whole JSON string first
+            handle.writelines(_JSON_ENCODER.iterencode(payload))
+    tmp_path.replace(report_path)
 
 
 def dedupe_strings(items: Sequence[str]) -> list[str]:
@@ -537,8 +734,13 @@ def main(argv: Sequence[str] | None = None) -> int:
     global ROOT_DIR
     ROOT_DIR = detect_project_root()
     ticket, slug_hint = detect_feature(args.ticket, args.slug_hint)
-    branch = args.branch or runtime.detect_branch(ROOT_DIR)
-    files = collect_changed_files()
+    branch = args.branch
+    if not branch:
+        from aidd_runtime import runtime
+
+        branch = runtime.detect_branch(ROOT_DIR)
+    # sorted once: analyzers and files_considered share the same ordered list
+    files = sorted(collect_changed_files())
     tests_summary, tests_executed, allow_missing_tests = load_tests_metadata()
     findings, manual_required = aggregate_findings(
         files,
@@ -583,15 +785,20 @@ def main(argv: Sequence[str] | None = None) -> int:
         },
     }
 
+    emit_stdout_json = (not args.gate or args.emit_json) and args.format == "json"
+    # the same serialized text serves both the report file and stdout
+    payload_json = _JSON_ENCODER.encode(payload) if emit_stdout_json else None
+
     if args.report:
         previous_payload = None
-        if args.emit_patch and args.report.exists():
+        if args.emit_patch:
             try:
-                previous_payload = json.loads(args.report.read_text(encoding="utf-8"))
-            except Exception:
+                with args.report.open("rb") as handle:
+                    previous_payload = json.load(handle)
+            except (OSError, ValueError):
                 previous_payload = None
 
-        write_report(args.report, payload)
+        write_report(args.report, payload, payload_json=payload_json)
         pack_path = None
         try:
             from aidd_runtime import reports_pack
@@ -606,10 +813,7 @@ def main(argv: Sequence[str] | None = None) -> int:
 
                 patch_ops = _json_patch.diff(previous_payload, payload)
                 patch_path = args.report.with_suffix(".patch.json")
-                patch_path.write_text(
-                    json.dumps(patch_ops, ensure_ascii=False, indent=2) + "\n",
-                    encoding="utf-8",
-                )
+                patch_path.write_text(_JSON_ENCODER.encode(patch_ops) + "\n", encoding="utf-8")
             except Exception as exc:
                 print(f"[qa-agent] WARN: failed to emit patch: {exc}", file=sys.stderr)
 
@@ -621,8 +825,8 @@ def main(argv: Sequence[str] | None = None) -> int:
                 pass
 
     if not args.gate or args.emit_json:
-        if args.format == "json":
-            print(json.dumps(payload, ensure_ascii=False, indent=2))
+        if payload_json is not None:
+            print(payload_json)
         else:
             print(summary)
 
@@ -45,9 +45,9 @@ def load_report(
     json_path: Path, pack_path: Path, *, prefer_pack: bool = True
 ) -> tuple[dict, str, Path]:
     if prefer_pack and pack_path.exists():
-        payload = json.loads(pack_path.read_text(encoding="utf-8"))
+        payload = json.loads(pack_path.read_bytes())
         return payload, "pack", pack_path
-    payload = json.loads(json_path.read_text(encoding="utf-8"))
+    payload = json.loads(json_path.read_bytes())
     return payload, "json", json_path
 
 
@@ -2,12 +2,25 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable
+import functools
+import json
+import os
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+from itertools import islice
 from pathlib import Path
 from typing import Any
 
 from aidd_runtime import runtime
-from aidd_runtime.io_utils import append_jsonl, read_jsonl, utc_timestamp
+from aidd_runtime.io_utils import utc_timestamp
+
+SCHEMA = "aidd.tests_log.v1"
+_SKIPPED_STATUSES = frozenset({"skipped", "not-run", "skip"})
+_TAIL_BLOCK_BYTES = 64 * 1024
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False)
+_TAIL_CACHE_MAX = 64
+# newest-first matches per (path, limit, stages, statuses), valid while (mtime_ns, size) holds
+_TAIL_CACHE: OrderedDict[tuple, tuple[tuple[int, int], list[dict[str, Any]]]] = OrderedDict()
 
 
 def tests_log_dir(root: Path, ticket: str) -> Path:
@@ -45,11 +58,11 @@ def append_log(
 ) -> None:
     if not ticket:
         return
-    stage_value = str(stage or "").strip().lower()
+    stage_value = _normalized(stage)
     scope_value = (
         runtime.sanitize_scope_key(scope_key) or runtime.sanitize_scope_key(ticket) or "ticket"
     )
-    status_value = str(status or "").strip().lower()
+    status_value = _normalized(status)
     if not status_value:
         if exit_code is None:
             status_value = "unknown"
@@ -58,14 +71,14 @@ def append_log(
         else:
             status_value = "fail"
 
-    if status_value in {"skipped", "not-run", "skip"}:
+    if status_value in _SKIPPED_STATUSES:
         if not reason_code:
             reason_code = "manual_skip"
         if not reason:
             reason = "tests skipped"
 
     payload: dict[str, Any] = {
-        "schema": "aidd.tests_log.v1",
+        "schema": SCHEMA,
         "updated_at": utc_timestamp(),
         "ticket": ticket,
         "slug_hint": slug_hint or ticket,
@@ -100,20 +113,105 @@ def append_log(
     if source:
         payload["source"] = source
 
-    path = tests_log_path(root, ticket, scope_value)
-    append_jsonl(path, payload)
+    line = (_JSON_ENCODER.encode(payload) + "\n").encode("utf-8")
+    _append_line(tests_log_path(root, ticket, scope_value), line)
+
+
+def _append_line(path: Path, line: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # one O_APPEND write per entry keeps concurrent writers from interleaving lines
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        data = memoryview(line)
+        while data:
+            data = data[os.write(fd, data) :]
+    finally:
+        os.close(fd)
+
+
+def _parse_line(raw: bytes) -> dict[str, Any] | None:
+    raw = raw.strip()
+    if not raw:
+        return None
+    try:
+        payload = json.loads(raw)
+    except ValueError:
+        return None
+    return payload if isinstance(payload, dict) else None
 
 
-def _load_events(path: Path) -> list[dict[str, Any]]:
-    if not path.exists():
+def _iter_events_reversed(path: Path) -> Iterator[dict[str, Any]]:
+    """Yield JSONL entries from the end of the file backwards, reading fixed-size blocks."""
+    try:
+        handle = path.open("rb")
+    except OSError:
+        return
+    with handle:
+        offset = handle.seek(0, os.SEEK_END)
+        tail = b""
+        while offset > 0:
+            size = min(_TAIL_BLOCK_BYTES, offset)
+            offset -= size
+            handle.seek(offset)
+            lines = (handle.read(size) + tail).split(b"\n")
+            # the first piece may continue in the previous block
+            tail = lines[0]
+            for raw in reversed(lines[1:]):
+                entry = _parse_line(raw)
+                if entry is not None:
+                    yield entry
+        entry = _parse_line(tail)
+        if entry is not None:
+            yield entry
+
+
+def _tail_entries(
+    path: Path,
+    limit: int,
+    stages: frozenset[str] = frozenset(),
+    statuses: frozenset[str] = frozenset(),
+) -> list[dict[str, Any]]:
+    """Up to ``limit`` newest matching entries, newest first; cached until the file changes."""
+    try:
+        stat = path.stat()
+    except OSError:
         return []
-    return read_jsonl(path) or []
+    key = (path, limit, stages, statuses)
+    version = (stat.st_mtime_ns, stat.st_size)
+    cached = _TAIL_CACHE.get(key)
+    if cached is not None and cached[0] == version:
+        _TAIL_CACHE.move_to_end(key)
+        return [dict(entry) for entry in cached[1]]
+
+    entries = _iter_events_reversed(path)
+    if stages:
+        entries = (item for item in entries if _normalized(item.get("stage")) in stages)
+    if statuses:
+        entries = (item for item in entries if _normalized(item.get("status")) in statuses)
+    found = list(islice(entries, limit))
+    _TAIL_CACHE[key] = (version, found)
+    _TAIL_CACHE.move_to_end(key)
+    if len(_TAIL_CACHE) > _TAIL_CACHE_MAX:
+        _TAIL_CACHE.popitem(last=False)
+    return [dict(entry) for entry in found]
 
 
 def _entry_timestamp(entry: dict[str, Any]) -> str:
     return str(entry.get("updated_at") or entry.get("ts") or "")
 
 
+@functools.lru_cache(maxsize=256)
+def _norm(value: str) -> str:
+    return value.strip().lower()
+
+
+def _normalized(value: object) -> str:
+    # log fields repeat a handful of stage/status values, so the str case is memoized
+    if isinstance(value, str):
+        return _norm(value) if value else ""
+    return str(value or "").strip().lower()
+
+
 def read_log(
     root: Path,
     ticket: str,
@@ -124,27 +222,35 @@ def read_log(
 ) -> list[dict[str, Any]]:
     if limit <= 0:
         return []
-    stage_value = str(stage or "").strip().lower()
-    events: list[dict[str, Any]] = []
+    stage_value = _normalized(stage)
 
     if scope_key:
-        events = _load_events(tests_log_path(root, ticket, scope_key))
+        paths = [tests_log_path(root, ticket, scope_key)]
     else:
         dir_path = tests_log_dir(root, ticket)
-        if dir_path.exists():
-            for path in sorted(dir_path.glob("*.jsonl")):
-                events.extend(_load_events(path))
-
-    if stage_value:
-        events = [
-            entry
-            for entry in events
-            if str(entry.get("stage") or "").strip().lower() == stage_value
-        ]
+        try:
+            with os.scandir(dir_path) as entries:
+                names = [
+                    entry.name
+                    for entry in entries
+                    if entry.name.endswith(".jsonl") and entry.is_file()
+                ]
+        except (FileNotFoundError, NotADirectoryError):
+            names = []
+        names.sort()
+        paths = [dir_path / name for name in names]
+
+    # only the newest `limit` matching entries of each append-only file can make the cut
+    stages = frozenset({stage_value}) if stage_value else frozenset()
+    events: list[dict[str, Any]] = []
+    for path in paths:
+        tail = _tail_entries(path, limit, stages)
+        tail.reverse()
+        events.extend(tail)
     if not events:
         return []
     events.sort(key=_entry_timestamp)
-    return events[-max(limit, 0) :]
+    return events[-limit:]
 
 
 def latest_entry(
@@ -156,28 +262,13 @@ def latest_entry(
     statuses: Iterable[str] | None = None,
 ) -> tuple[dict[str, Any] | None, Path | None]:
     path = tests_log_path(root, ticket, scope_key)
-    events = _load_events(path)
-    if not events:
-        return None, path if path.exists() else None
-    stage_set = {
-        str(stage or "").strip().lower() for stage in (stages or []) if str(stage or "").strip()
-    }
-    status_set = {
-        str(status or "").strip().lower()
-        for status in (statuses or [])
-        if str(status or "").strip()
-    }
-    for entry in reversed(events):
-        if stage_set:
-            entry_stage = str(entry.get("stage") or "").strip().lower()
-            if entry_stage not in stage_set:
-                continue
-        if status_set:
-            entry_status = str(entry.get("status") or "").strip().lower()
-            if entry_status not in status_set:
-                continue
-        return entry, path
-    return None, path
+    stage_set = frozenset(_normalized(stage) for stage in (stages or [])) - {""}
+    status_set = frozenset(_normalized(status) for status in (statuses or [])) - {""}
+    # only the newest matching entry is read, from the end of the file
+    found = _tail_entries(path, 1, stage_set, status_set)
+    if found:
+        return found[0], path
+    return None, path if path.exists() else None
 
 
 def summarize_tests(
@@ -190,14 +281,14 @@ def summarize_tests(
     entry, path = latest_entry(root, ticket, scope_key, stages=stages, statuses=None)
     if not entry:
         return "skipped", "tests_log_missing", path if path and path.exists() else None, None
-    status_value = str(entry.get("status") or "").strip().lower()
+    status_value = _normalized(entry.get("status"))
     if status_value in {"pass", "fail"}:
         summary = "run"
-    elif status_value in {"skipped", "not-run", "skip"}:
+    elif status_value in _SKIPPED_STATUSES:
         summary = "skipped"
     else:
         summary = status_value or "skipped"
-    reason_code = str(entry.get("reason_code") or "").strip().lower()
+    reason_code = _normalized(entry.get("reason_code"))
     if summary == "skipped" and not reason_code:
         reason_code = "tests_skipped"
     return summary, reason_code, path, entry
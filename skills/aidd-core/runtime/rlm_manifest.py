@@ -15,11 +15,15 @@ def _bootstrap_entrypoint() -> None:
             plugin_root = candidate.resolve()
 
     if plugin_root is None:
-        current = Path(__file__).resolve()
-        for parent in (current.parent, *current.parents):
-            if (parent / "aidd_runtime").is_dir():
-                plugin_root = parent
-                break
+        parents = Path(__file__).resolve().parents
+        # runtime modules live in <root>/skills/<skill>/runtime/, so that level is tried first
+        if len(parents) > 3 and (parents[3] / "aidd_runtime").is_dir():
+            plugin_root = parents[3]
+        else:
+            for parent in parents:
+                if (parent / "aidd_runtime").is_dir():
+                    plugin_root = parent
+                    break
 
     if plugin_root is None:
         raise RuntimeError("Unable to resolve AIDD_ROOT from entrypoint path.")
@@ -34,8 +38,13 @@ _bootstrap_entrypoint()
 
 import argparse
 import datetime as dt
+import functools
 import json
+import os
 from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
+from operator import itemgetter
 from pathlib import Path
 
 from aidd_runtime import runtime
@@ -47,26 +56,44 @@ from aidd_runtime.rlm_config import (
     normalize_path,
     prompt_version,
     resolve_source_path,
-    rev_sha_for_bytes,
+    rev_sha_for_file,
     workspace_root_for,
 )
 
 SCHEMA = "aidd.rlm_manifest.v1"
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False, indent=2)
 
 
 def _load_targets(path: Path) -> dict:
     return json.loads(path.read_text(encoding="utf-8"))
 
 
+@functools.lru_cache(maxsize=4096)
+def _file_id(rel: str) -> str:
+    return file_id_for_path(Path(rel))
+
+
+def _hash_target(path: Path, max_file_bytes: int) -> tuple[int, str] | None:
+    try:
+        size = path.stat().st_size
+        # oversized files are skipped before any bytes are read
+        if max_file_bytes and size > max_file_bytes:
+            return None
+        return size, rev_sha_for_file(path)
+    except OSError:
+        return None
+
+
 def _iter_files(
     target: Path,
     files: Iterable[str],
     max_file_bytes: int,
     *,
     base_root: Path,
+    prompt_ver: str,
 ) -> list[dict[str, object]]:
-    entries: list[dict[str, object]] = []
     workspace_root = workspace_root_for(target)
+    candidates: list[tuple[Path, str, str]] = []
     for raw in files:
         if not raw:
             continue
@@ -79,13 +106,6 @@ def _iter_files(
         )
         if not path.exists() or not path.is_file():
             continue
-        try:
-            data = path.read_bytes()
-        except OSError:
-            continue
-        size = len(data)
-        if max_file_bytes and size > max_file_bytes:
-            continue
         if raw_path.is_absolute():
             try:
                 rel_path = path.relative_to(base_root)
@@ -97,14 +117,30 @@ def _iter_files(
         lang = detect_lang(path)
         if not lang:
             continue
-        entry = {
-            "file_id": file_id_for_path(Path(rel)),
-            "path": rel,
-            "rev_sha": rev_sha_for_bytes(data),
-            "lang": lang,
-            "size": size,
-        }
-        entries.append(entry)
+        candidates.append((path, rel, lang))
+    if not candidates:
+        return []
+
+    entries: list[dict[str, object]] = []
+    # reads and hashing release the GIL, so the targets are hashed on a thread pool
+    workers = min(len(candidates), (os.cpu_count() or 1) * 4, 32)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        paths = [path for path, _rel, _lang in candidates]
+        hashes = pool.map(_hash_target, paths, repeat(max_file_bytes))
+        for (_path, rel, lang), hashed in zip(candidates, hashes, strict=True):
+            if hashed is None:
+                continue
+            size, rev_sha = hashed
+            entries.append(
+                {
+                    "file_id": _file_id(rel),
+                    "path": rel,
+                    "rev_sha": rev_sha,
+                    "lang": lang,
+                    "size": size,
+                    "prompt_version": prompt_ver,
+                }
+            )
     return entries
 
 
@@ -128,12 +164,10 @@ def build_manifest(
         [str(item) for item in files],
         max_file_bytes,
         base_root=base_root,
+        prompt_ver=prompt_version(settings),
     )
-    prompt_ver = prompt_version(settings)
-    for entry in entries:
-        entry["prompt_version"] = prompt_ver
-
-    entries = sorted(entries, key=lambda item: (item.get("path") or ""))
+    # every entry carries a str path, so itemgetter avoids a Python-level key function
+    entries.sort(key=itemgetter("path"))
     return {
         "schema": SCHEMA,
         "ticket": ticket,
@@ -158,6 +192,18 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     return parser.parse_args(argv)
 
 
+def _manifest_unchanged(output: Path, payload: dict[str, object]) -> bool:
+    # generated_at differs on every build, so it is left out of the comparison
+    try:
+        existing = json.loads(output.read_bytes())
+    except (OSError, ValueError):
+        return False
+    if not isinstance(existing, dict):
+        return False
+    existing.pop("generated_at", None)
+    return existing == {key: value for key, value in payload.items() if key != "generated_at"}
+
+
 def main(argv: list[str] | None = None) -> int:
     args = parse_args(argv)
     _, target = runtime.require_workflow_root()
@@ -178,9 +224,17 @@ def main(argv: list[str] | None = None) -> int:
         if args.output
         else target / "reports" / "research" / f"{ticket}-rlm-manifest.json"
     )
-    output.parent.mkdir(parents=True, exist_ok=True)
-    output.write_text(json.dumps(payload, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
     rel_output = runtime.rel_path(output, target)
+    if _manifest_unchanged(output, payload):
+        print(f"[aidd] rlm manifest unchanged: {rel_output}.")
+        return 0
+    output.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = output.with_suffix(output.suffix + ".tmp")
+    with tmp_path.open("w", encoding="utf-8", newline="\n", buffering=1 << 16) as handle:
+        # stream the indented JSON instead of building the whole string first
+        handle.writelines(_JSON_ENCODER.iterencode(payload))
+        handle.write("\n")
+    tmp_path.replace(output)
     print(f"[aidd] rlm manifest saved to {rel_output}.")
     return 0
 
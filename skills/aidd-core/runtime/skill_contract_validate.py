@@ -17,11 +17,15 @@ def _bootstrap_entrypoint() -> None:
             plugin_root = candidate.resolve()
 
     if plugin_root is None:
-        current = Path(__file__).resolve()
-        for parent in (current.parent, *current.parents):
-            if (parent / "aidd_runtime").is_dir():
-                plugin_root = parent
-                break
+        parents = Path(__file__).resolve().parents
+        # runtime modules live in <root>/skills/<skill>/runtime/, so that level is tried first
+        if len(parents) > 3 and (parents[3] / "aidd_runtime").is_dir():
+            plugin_root = parents[3]
+        else:
+            for parent in parents:
+                if (parent / "aidd_runtime").is_dir():
+                    plugin_root = parent
+                    break
 
     if plugin_root is None:
         raise RuntimeError("Unable to resolve AIDD_ROOT from entrypoint path.")
@@ -35,14 +39,13 @@ def _bootstrap_entrypoint() -> None:
 _bootstrap_entrypoint()
 
 import argparse
+import functools
 import json
 import sys
 from collections.abc import Iterable, Sequence
 from pathlib import Path
 from typing import Any
 
-from aidd_runtime import aidd_schemas
-
 SUPPORTED_SCHEMA_VERSIONS = ("aidd.skill_contract.v1",)
 REQUIRED_TOP_LEVEL = (
     "schema",
@@ -72,11 +75,17 @@ DISALLOWED_PREFLIGHT_FILES = (
     "aidd/reports/actions/{ticket}/{scope_key}/stage.preflight.result.json",
 )
 
+_CANONICAL_READMAP_SET = frozenset({CANONICAL_READMAP_MD})
+_CANONICAL_PREFLIGHT_SET = frozenset(CANONICAL_PREFLIGHT_FILES)
+_DISALLOWED_PREFLIGHT_SET = frozenset(DISALLOWED_PREFLIGHT_FILES)
+_PREFLIGHT_STAGES = frozenset({"implement", "review", "qa"})
+
 
 class ValidationError(ValueError):
     pass
 
 
+@functools.lru_cache(maxsize=1)
 def _repo_root() -> Path:
     here = Path(__file__).resolve()
     for candidate in (here.parent, *here.parents):
@@ -95,13 +104,46 @@ def _load_yaml_fallback(text: str) -> dict[str, Any]:
     except Exception as exc:  # pragma: no cover - optional
         raise ValidationError("CONTRACT.yaml is not JSON and PyYAML is unavailable") from exc
 
-    payload = yaml.safe_load(text)
+    try:
+        from yaml import CSafeLoader as _Loader  # type: ignore
+    except ImportError:  # pragma: no cover - libyaml bindings missing
+        from yaml import SafeLoader as _Loader  # type: ignore
+
+    payload = yaml.load(text, Loader=_Loader)
     if not isinstance(payload, dict):
         raise ValidationError("CONTRACT payload must be an object")
     return payload
 
 
+def _compiled_contract_path(path: Path) -> Path:
+    return path.with_suffix(".json")
+
+
+def _load_compiled(path: Path) -> dict[str, Any] | None:
+    compiled = _compiled_contract_path(path)
+    try:
+        if compiled.stat().st_mtime_ns < path.stat().st_mtime_ns:
+            return None
+        payload = json.loads(compiled.read_bytes())
+    except (OSError, ValueError):
+        return None
+    return payload if isinstance(payload, dict) else None
+
+
+def compile_contract(path: Path) -> Path:
+    """Write the parsed contract next to the YAML so later loads skip the YAML parser."""
+    payload = load_contract(path)
+    compiled = _compiled_contract_path(path)
+    compiled.write_text(json.dumps(payload, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    return compiled
+
+
 def load_contract(path: Path) -> dict[str, Any]:
+    if path.suffix != ".json":
+        # a CONTRACT.json at least as new as the YAML is the same payload, already parsed
+        payload = _load_compiled(path)
+        if payload is not None:
+            return payload
     try:
         text = path.read_text(encoding="utf-8")
     except OSError as exc:
@@ -159,12 +201,50 @@ def _validate_read_items(value: Any, errors: list[str], *, field: str) -> None:
             errors.append(f"{prefix}ref must be non-empty string")
 
 
+# field shapes are declared once and walked by _check_rule instead of re-spelled per contract
+_STRINGS = ("strings", ())
+_READ_ITEMS = ("read_items", ())
+_CONTRACT_RULES: tuple[tuple[str, tuple[str, tuple]], ...] = (
+    ("entrypoints", _STRINGS),
+    ("reads", ("object", (("required", _READ_ITEMS), ("optional", _READ_ITEMS)))),
+    (
+        "writes",
+        (
+            "object",
+            (
+                ("files", _STRINGS),
+                ("patterns", _STRINGS),
+                ("blocks", _READ_ITEMS),
+                ("via", ("object", (("docops_only", _STRINGS),))),
+            ),
+        ),
+    ),
+    ("outputs", _STRINGS),
+    ("gates", ("object", (("before", _STRINGS), ("after", _STRINGS)))),
+    ("context_budget", ("object", ())),
+)
+
+
+def _check_rule(value: Any, rule: tuple[str, tuple], errors: list[str], *, field: str) -> None:
+    kind, children = rule
+    if kind == "strings":
+        _validate_list_of_strings(value, errors, field=field)
+    elif kind == "read_items":
+        _validate_read_items(value, errors, field=field)
+    elif not isinstance(value, dict):
+        errors.append(f"field {field} must be object")
+    else:
+        for key, child in children:
+            _check_rule(value.get(key), child, errors, field=f"{field}.{key}")
+
+
 def _strip_ref_selector(value: str) -> str:
     raw = str(value or "").strip()
     if "#AIDD:" in raw:
-        return raw.split("#", 1)[0].strip()
+        # cut at the first "#", which may come before the "#AIDD:" selector itself
+        return raw.partition("#")[0].strip()
     if "@handoff:" in raw:
-        return raw.split("@handoff:", 1)[0].strip()
+        return raw.partition("@handoff:")[0].strip()
     return raw
 
 
@@ -223,42 +303,8 @@ def validate_contract_data(
         if isinstance(stage, str) and stage and stage != stage_from_path:
             errors.append(f"field stage ({stage}) must match directory name ({stage_from_path})")
 
-    _validate_list_of_strings(payload.get("entrypoints"), errors, field="entrypoints")
-
-    reads = payload.get("reads")
-    if not isinstance(reads, dict):
-        errors.append("field reads must be object")
-    else:
-        _validate_read_items(reads.get("required"), errors, field="reads.required")
-        _validate_read_items(reads.get("optional"), errors, field="reads.optional")
-
-    writes = payload.get("writes")
-    if not isinstance(writes, dict):
-        errors.append("field writes must be object")
-    else:
-        _validate_list_of_strings(writes.get("files"), errors, field="writes.files")
-        _validate_list_of_strings(writes.get("patterns"), errors, field="writes.patterns")
-        _validate_read_items(writes.get("blocks"), errors, field="writes.blocks")
-        via = writes.get("via")
-        if not isinstance(via, dict):
-            errors.append("field writes.via must be object")
-        else:
-            _validate_list_of_strings(
-                via.get("docops_only"), errors, field="writes.via.docops_only"
-            )
-
-    _validate_list_of_strings(payload.get("outputs"), errors, field="outputs")
-
-    gates = payload.get("gates")
-    if not isinstance(gates, dict):
-        errors.append("field gates must be object")
-    else:
-        _validate_list_of_strings(gates.get("before"), errors, field="gates.before")
-        _validate_list_of_strings(gates.get("after"), errors, field="gates.after")
-
-    context_budget = payload.get("context_budget")
-    if not isinstance(context_budget, dict):
-        errors.append("field context_budget must be object")
+    for field, rule in _CONTRACT_RULES:
+        _check_rule(payload.get(field), rule, errors, field=field)
 
     actions = payload.get("actions")
     if not isinstance(actions, dict):
@@ -273,24 +319,29 @@ def validate_contract_data(
         if allowed_types is not None:
             _validate_list_of_strings(allowed_types, errors, field="actions.allowed_types")
 
-    if isinstance(stage, str) and stage in {"implement", "review", "qa"}:
-        required_paths = set(
-            _collect_ref_paths((reads or {}).get("required") if isinstance(reads, dict) else [])
-        )
-        if CANONICAL_READMAP_MD not in required_paths:
+    if isinstance(stage, str) and stage in _PREFLIGHT_STAGES:
+        reads = payload.get("reads")
+        writes = payload.get("writes")
+        required_refs = _collect_ref_paths(reads.get("required") if isinstance(reads, dict) else [])
+        if _CANONICAL_READMAP_SET.isdisjoint(required_refs):
             errors.append(f"reads.required must include canonical path: {CANONICAL_READMAP_MD}")
 
-        write_files = _collect_string_set(
-            (writes or {}).get("files") if isinstance(writes, dict) else []
-        )
-        for expected in CANONICAL_PREFLIGHT_FILES:
-            if expected not in write_files:
-                errors.append(f"writes.files must include canonical preflight artifact: {expected}")
-        for disallowed in DISALLOWED_PREFLIGHT_FILES:
-            if disallowed in write_files:
-                errors.append(
-                    f"writes.files must not include deprecated preflight artifact: {disallowed}"
-                )
+        write_files = _collect_string_set(writes.get("files") if isinstance(writes, dict) else [])
+        missing = _CANONICAL_PREFLIGHT_SET - write_files
+        deprecated = _DISALLOWED_PREFLIGHT_SET & write_files
+        # the tuples are walked only on failure, to keep the messages in declaration order
+        if missing:
+            for expected in CANONICAL_PREFLIGHT_FILES:
+                if expected in missing:
+                    errors.append(
+                        f"writes.files must include canonical preflight artifact: {expected}"
+                    )
+        if deprecated:
+            for disallowed in DISALLOWED_PREFLIGHT_FILES:
+                if disallowed in deprecated:
+                    errors.append(
+                        f"writes.files must not include deprecated preflight artifact: {disallowed}"
+                    )
 
     return errors
 
@@ -304,6 +355,11 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     parser.add_argument("--contract", help="Path to CONTRACT.yaml file")
     parser.add_argument("--all", action="store_true", help="Validate all skills/*/CONTRACT.yaml")
     parser.add_argument("--quiet", action="store_true", help="Suppress OK output")
+    parser.add_argument(
+        "--compile",
+        action="store_true",
+        help="Write a sibling CONTRACT.json for each valid contract.",
+    )
     parser.add_argument(
         "--print-supported-versions",
         action="store_true",
@@ -320,6 +376,8 @@ def _validate_one(path: Path) -> list[str]:
 def main(argv: list[str] | None = None) -> int:
     args = parse_args(argv)
     if args.print_supported_versions:
+        from aidd_runtime import aidd_schemas
+
         values = ",".join(aidd_schemas.supported_schema_versions("aidd.skill_contract.v"))
         print(values)
         return 0
@@ -336,11 +394,7 @@ def main(argv: list[str] | None = None) -> int:
         return 2
 
     failed = False
-    seen: set[Path] = set()
-    for path in paths:
-        if path in seen:
-            continue
-        seen.add(path)
+    for path in dict.fromkeys(paths):
         if not path.exists():
             print(f"[skill-contract-validate] ERROR: missing contract: {path}", file=sys.stderr)
             failed = True
@@ -356,6 +410,10 @@ def main(argv: list[str] | None = None) -> int:
             for err in errors:
                 print(f"[skill-contract-validate] ERROR: {path}: {err}", file=sys.stderr)
             continue
+        if args.compile:
+            compiled = compile_contract(path)
+            if not args.quiet:
+                print(f"[skill-contract-validate] compiled: {compiled}")
         if not args.quiet:
             print(f"[skill-contract-validate] OK: {path}")
 
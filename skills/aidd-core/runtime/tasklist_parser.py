@@ -1,6 +1,44 @@
 from __future__ import annotations
 
 import re
+from collections.abc import Iterator
+from itertools import islice
+from typing import NamedTuple
+
+_BRACKET_RE = re.compile(r"\[([^\]]+)\]")
+_BRACKET_SPLIT_RE = re.compile(r"[,\n]")
+_TASKS_SPLIT_RE = re.compile(r"\s*;\s*")
+_FILTERS_SPLIT_RE = re.compile(r"\s*,\s*")
+
+
+# "- <field>: <value>" headers; the field is matched case-insensitively by lowercased name
+_FIELD_HEADER_RE = re.compile(r"^(?P<indent>\s*)-\s*(?P<field>[^:]*?)\s*:(?P<value>.*)$")
+
+
+class FieldIndex(NamedTuple):
+    """First scalar value and first block header (line index, indent) per lowercased field."""
+
+    scalars: dict[str, str]
+    blocks: dict[str, tuple[int, int]]
+
+
+def index_fields(lines: list[str]) -> FieldIndex:
+    scalars: dict[str, str] = {}
+    blocks: dict[str, tuple[int, int]] = {}
+    for idx, line in enumerate(lines):
+        match = _FIELD_HEADER_RE.match(line)
+        if not match:
+            continue
+        field = match.group("field").lower()
+        if not field:
+            continue
+        value = match.group("value")
+        stripped = value.strip()
+        if value and field not in scalars:
+            scalars[field] = stripped
+        if not stripped and field not in blocks:
+            blocks[field] = (idx, len(match.group("indent")))
+    return FieldIndex(scalars, blocks)
 
 
 def _strip_placeholder(value: str) -> str | None:
@@ -12,66 +50,65 @@ def _strip_placeholder(value: str) -> str | None:
     return stripped
 
 
-def extract_scalar_field(lines: list[str], field: str) -> str | None:
-    pattern = re.compile(rf"^\s*-\s*{re.escape(field)}\s*:\s*(.+)$", re.IGNORECASE)
-    for line in lines:
-        match = pattern.match(line)
-        if match:
-            value = match.group(1).strip()
-            return _strip_placeholder(value) or value
-    return None
+def _split_indent(raw: str) -> tuple[int, str]:
+    """Return (leading-space count, text after all leading whitespace)."""
+    body = raw.lstrip(" ")
+    indent = len(raw) - len(body)
+    # only mixed indentation (tabs etc.) needs a second strip
+    if body[:1].isspace():
+        body = body.lstrip()
+    return indent, body
 
 
-def extract_list_field(lines: list[str], field: str) -> list[str]:
-    pattern = re.compile(rf"^(?P<indent>\s*)-\s*{re.escape(field)}\s*:\s*$", re.IGNORECASE)
-    for idx, line in enumerate(lines):
-        match = pattern.match(line)
-        if not match:
+def _block_items(lines: list[str], field: str, index: FieldIndex | None) -> list[str] | None:
+    if index is None:
+        index = index_fields(lines)
+    header = index.blocks.get(field.lower())
+    if header is None:
+        return None
+    start, base_indent = header
+    items: list[str] = []
+    for raw in islice(lines, start + 1, None):
+        indent, body = _split_indent(raw)
+        if not body:
             continue
-        base_indent = len(match.group("indent"))
-        items: list[str] = []
-        for raw in lines[idx + 1 :]:
-            if not raw.strip():
-                continue
-            indent = len(raw) - len(raw.lstrip(" "))
-            if indent <= base_indent and raw.lstrip().startswith("-"):
-                break
-            if indent <= base_indent and raw.strip():
-                break
-            if raw.lstrip().startswith("-") and indent > base_indent:
-                item = raw.lstrip()[2:].strip()
-                if _strip_placeholder(item):
-                    items.append(item)
-        return items
-    return []
+        if indent <= base_indent:
+            break
+        if body.startswith("-"):
+            items.append(body[2:].strip())
+    return items
+
+
+def extract_scalar_field(
+    lines: list[str], field: str, *, index: FieldIndex | None = None
+) -> str | None:
+    if index is None:
+        index = index_fields(lines)
+    value = index.scalars.get(field.lower())
+    if value is None:
+        return None
+    return _strip_placeholder(value) or value
 
 
-def extract_mapping_field(lines: list[str], field: str) -> dict[str, str]:
-    pattern = re.compile(rf"^(?P<indent>\s*)-\s*{re.escape(field)}\s*:\s*$", re.IGNORECASE)
-    for idx, line in enumerate(lines):
-        match = pattern.match(line)
-        if not match:
-            continue
-        base_indent = len(match.group("indent"))
-        result: dict[str, str] = {}
-        for raw in lines[idx + 1 :]:
-            if not raw.strip():
-                continue
-            indent = len(raw) - len(raw.lstrip(" "))
-            if indent <= base_indent and raw.lstrip().startswith("-"):
-                break
-            if indent <= base_indent and raw.strip():
-                break
-            if raw.lstrip().startswith("-") and indent > base_indent:
-                item = raw.lstrip()[2:].strip()
-                if ":" in item:
-                    key, value = item.split(":", 1)
-                    key = key.strip()
-                    value = value.strip()
-                    if _strip_placeholder(key) and _strip_placeholder(value):
-                        result[key] = value
-        return result
-    return {}
+def extract_list_field(
+    lines: list[str], field: str, *, index: FieldIndex | None = None
+) -> list[str]:
+    items = _block_items(lines, field, index) or []
+    return [item for item in items if _strip_placeholder(item)]
+
+
+def extract_mapping_field(
+    lines: list[str], field: str, *, index: FieldIndex | None = None
+) -> dict[str, str]:
+    result: dict[str, str] = {}
+    for item in _block_items(lines, field, index) or []:
+        if ":" in item:
+            key, value = item.split(":", 1)
+            key = key.strip()
+            value = value.strip()
+            if _strip_placeholder(key) and _strip_placeholder(value):
+                result[key] = value
+    return result
 
 
 PATH_TOKEN_RE = re.compile(
@@ -80,6 +117,8 @@ PATH_TOKEN_RE = re.compile(
 
 SECTION_HEADER_RE = re.compile(r"^##\s+(.+?)\s*$")
 
+_FORBIDDEN_MARKERS = ("must-not-touch", "forbidden", "do not", "not touch")
+
 
 def _dedupe(items: list[str]) -> list[str]:
     seen = set()
@@ -93,31 +132,25 @@ def _dedupe(items: list[str]) -> list[str]:
     return deduped
 
 
-def _extract_paths_from_brackets(text: str) -> list[str]:
-    results: list[str] = []
-    for match in re.findall(r"\[([^\]]+)\]", text):
-        parts = re.split(r"[,\n]", match)
-        for part in parts:
-            cleaned = part.strip().strip("`'\" ")
-            if cleaned:
-                results.append(cleaned)
-    return results
-
-
-def _extract_paths_from_text(text: str) -> list[str]:
-    candidates: list[str] = []
-    candidates.extend(_extract_paths_from_brackets(text))
-    for match in PATH_TOKEN_RE.findall(text):
-        cleaned = match.strip().strip("`'\" ,;)")
+def _iter_paths_from_text(text: str) -> Iterator[str]:
+    # bracketed lists first, then every path-like token (including those inside brackets)
+    if "[" in text:
+        for match in _BRACKET_RE.finditer(text):
+            for part in _BRACKET_SPLIT_RE.split(match.group(1)):
+                cleaned = part.strip().strip("`'\" ")
+                if cleaned:
+                    yield cleaned
+    for match in PATH_TOKEN_RE.finditer(text):
+        cleaned = match.group(0).strip().strip("`'\" ,;)")
         if cleaned:
-            candidates.append(cleaned)
-    return candidates
+            yield cleaned
 
 
 def extract_boundaries(lines: list[str]) -> tuple[list[str], list[str], bool]:
     """Return (allowed_paths, forbidden_paths, has_boundaries)."""
-    items = extract_list_field(lines, "Boundaries")
-    scalar = extract_scalar_field(lines, "Boundaries")
+    index = index_fields(lines)
+    items = extract_list_field(lines, "Boundaries", index=index)
+    scalar = extract_scalar_field(lines, "Boundaries", index=index)
     has_boundaries = bool(items or scalar)
     if not items and scalar:
         items = [scalar]
@@ -125,15 +158,8 @@ def extract_boundaries(lines: list[str]) -> tuple[list[str], list[str], bool]:
     forbidden: list[str] = []
     for item in items:
         lower = item.lower()
-        paths = _extract_paths_from_text(item)
-        if not paths:
-            continue
-        if any(token in lower for token in ("must-not-touch", "forbidden", "do not", "not touch")):
-            forbidden.extend(paths)
-        elif "must-touch" in lower or "allowed" in lower:
-            allowed.extend(paths)
-        else:
-            allowed.extend(paths)
+        target = forbidden if any(token in lower for token in _FORBIDDEN_MARKERS) else allowed
+        target.extend(_iter_paths_from_text(item))
     return _dedupe(allowed), _dedupe(forbidden), has_boundaries
 
 
@@ -156,23 +182,24 @@ def extract_section(lines: list[str], title: str) -> list[str]:
 
 
 def parse_test_execution(lines: list[str]) -> dict[str, object]:
-    profile = (extract_scalar_field(lines, "profile") or "").strip()
-    tasks_raw = extract_scalar_field(lines, "tasks") or ""
-    filters_raw = extract_scalar_field(lines, "filters") or ""
-    when = (extract_scalar_field(lines, "when") or "").strip()
-    reason = (extract_scalar_field(lines, "reason") or "").strip()
-    tasks_list = extract_list_field(lines, "tasks")
-    filters_list = extract_list_field(lines, "filters")
+    index = index_fields(lines)
+    profile = (extract_scalar_field(lines, "profile", index=index) or "").strip()
+    tasks_raw = extract_scalar_field(lines, "tasks", index=index) or ""
+    filters_raw = extract_scalar_field(lines, "filters", index=index) or ""
+    when = (extract_scalar_field(lines, "when", index=index) or "").strip()
+    reason = (extract_scalar_field(lines, "reason", index=index) or "").strip()
+    tasks_list = extract_list_field(lines, "tasks", index=index)
+    filters_list = extract_list_field(lines, "filters", index=index)
     tasks: list[str] = []
     if tasks_list:
         tasks = tasks_list
     elif tasks_raw:
-        tasks = [item.strip() for item in re.split(r"\s*;\s*", tasks_raw) if item.strip()]
+        tasks = [item.strip() for item in _TASKS_SPLIT_RE.split(tasks_raw) if item.strip()]
     filters: list[str] = []
     if filters_list:
         filters = filters_list
     elif filters_raw:
-        filters = [item.strip() for item in re.split(r"\s*,\s*", filters_raw) if item.strip()]
+        filters = [item.strip() for item in _FILTERS_SPLIT_RE.split(filters_raw) if item.strip()]
     return {
         "profile": profile,
         "tasks": tasks,
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
+import functools
 import os
-from collections.abc import Iterable
 from pathlib import Path
 
 BASE_COMMON_PATTERNS = ("config/",)
@@ -157,54 +157,42 @@ DEFAULT_CODE_FILES = (
     "nuget.config",
 )
 
-_SKIP_DIRS = {
-    ".git",
-    ".hg",
-    ".svn",
-    ".aidd",
-    ".venv",
-    "venv",
-    "node_modules",
-    "vendor",
-    "__pycache__",
-    ".tox",
-    ".mypy_cache",
-    "aidd",
-}
-
-
-def _dedupe(items: Iterable[str]) -> list[str]:
-    seen: set[str] = set()
-    result: list[str] = []
-    for item in items:
-        if not item:
-            continue
-        if item in seen:
-            continue
-        seen.add(item)
-        result.append(item)
-    return result
-
-
-def detect_build_tools(root: Path) -> set[str]:
-    detected: set[str] = set()
-    if not root.exists():
-        return detected
-
-    gradle_names = {
+_SKIP_DIRS = frozenset(
+    {
+        ".git",
+        ".hg",
+        ".svn",
+        ".aidd",
+        ".venv",
+        "venv",
+        "node_modules",
+        "vendor",
+        "__pycache__",
+        ".tox",
+        ".mypy_cache",
+        "aidd",
+    }
+)
+_ALL_TOOLS = frozenset({"gradle", "npm", "python", "go", "rust", "dotnet"})
+_GRADLE_NAMES = frozenset(
+    {
         "build.gradle",
         "build.gradle.kts",
         "settings.gradle",
         "settings.gradle.kts",
     }
-    npm_names = {
+)
+_NPM_NAMES = frozenset(
+    {
         "package.json",
         "package-lock.json",
         "pnpm-lock.yaml",
         "yarn.lock",
         "npm-shrinkwrap.json",
     }
-    python_names = {
+)
+_PYTHON_NAMES = frozenset(
+    {
         "pyproject.toml",
         "pipfile",
         "pipfile.lock",
@@ -212,51 +200,92 @@ def detect_build_tools(root: Path) -> set[str]:
         "setup.py",
         "setup.cfg",
     }
-    go_names = {"go.mod", "go.sum"}
-    rust_names = {"cargo.toml", "cargo.lock"}
-    dotnet_names = {
+)
+_GO_NAMES = frozenset({"go.mod", "go.sum"})
+_RUST_NAMES = frozenset({"cargo.toml", "cargo.lock"})
+_DOTNET_NAMES = frozenset(
+    {
         "directory.packages.props",
         "packages.config",
         "packages.lock.json",
         "global.json",
         "nuget.config",
     }
+)
+
+# every known manifest name maps to exactly one tool, so a file needs a single lookup
+_FILENAME_TO_TOOL: dict[str, str] = {
+    name: tool
+    for tool, names in (
+        ("gradle", _GRADLE_NAMES),
+        ("npm", _NPM_NAMES),
+        ("python", _PYTHON_NAMES),
+        ("go", _GO_NAMES),
+        ("rust", _RUST_NAMES),
+        ("dotnet", _DOTNET_NAMES),
+    )
+    for name in names
+}
+_DOTNET_SUFFIXES = (".csproj", ".fsproj", ".vbproj")
+
+
+def _in_gradle_dir(dirpath: str) -> bool:
+    return any(part.lower() == "gradle" for part in Path(dirpath).parts)
+
+
+def detect_build_tools(root: Path) -> set[str]:
+    detected: set[str] = set()
+    if not root.exists():
+        return detected
 
-    for dirpath, dirnames, filenames in os.walk(root):
-        dirnames[:] = [d for d in dirnames if d not in _SKIP_DIRS]
-        parts = {part.lower() for part in Path(dirpath).parts}
-        for name in filenames:
-            lower = name.lower()
-            if lower in gradle_names:
-                detected.add("gradle")
-            if lower == "libs.versions.toml" and "gradle" in parts:
-                detected.add("gradle")
-            if lower in npm_names:
-                detected.add("npm")
-            if lower in python_names or (
-                lower.startswith("requirements") and lower.endswith(".txt")
-            ):
-                detected.add("python")
-            if lower in go_names:
-                detected.add("go")
-            if lower in rust_names:
-                detected.add("rust")
-            if lower.endswith((".csproj", ".fsproj", ".vbproj")) or lower in dotnet_names:
-                detected.add("dotnet")
+    # explicit DFS over os.scandir; like os.walk, symlinked directories are not followed
+    stack = [os.fspath(root)]
+    while stack:
+        dirpath = stack.pop()
+        try:
+            entries = os.scandir(dirpath)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if is_dir:
+                    if entry.name not in _SKIP_DIRS and not entry.is_symlink():
+                        stack.append(entry.path)
+                    continue
+                lower = entry.name.lower()
+                tool = _FILENAME_TO_TOOL.get(lower)
+                if tool:
+                    detected.add(tool)
+                elif lower.startswith("requirements") and lower.endswith(".txt"):
+                    detected.add("python")
+                elif lower.endswith(_DOTNET_SUFFIXES):
+                    detected.add("dotnet")
+                elif lower == "libs.versions.toml" and _in_gradle_dir(dirpath):
+                    detected.add("gradle")
+        # the answer cannot grow once every tool is present
+        if detected >= _ALL_TOOLS:
+            break
     return detected
 
 
-def build_settings_payload(detected: set[str] | None = None) -> dict[str, list[str]]:
-    if detected:
-        patterns: list[str] = list(BASE_COMMON_PATTERNS)
-        for tool in sorted(detected):
-            patterns.extend(COMMON_PATTERNS_BY_TOOL.get(tool, ()))
-        common_patterns = _dedupe(patterns)
-    else:
-        common_patterns = list(DEFAULT_COMMON_PATTERNS)
+@functools.lru_cache(maxsize=32)
+def _common_patterns(detected: frozenset[str]) -> tuple[str, ...]:
+    if not detected:
+        return DEFAULT_COMMON_PATTERNS
+    patterns: list[str] = list(BASE_COMMON_PATTERNS)
+    for tool in sorted(detected):
+        patterns.extend(COMMON_PATTERNS_BY_TOOL.get(tool, ()))
+    # dict.fromkeys keeps the first occurrence of each pattern, in order
+    return tuple(dict.fromkeys(patterns))
 
+
+def build_settings_payload(detected: set[str] | None = None) -> dict[str, list[str]]:
     return {
-        "commonPatterns": common_patterns,
+        "commonPatterns": list(_common_patterns(frozenset(detected or ()))),
         "codePaths": list(DEFAULT_CODE_PATHS),
         "codeExtensions": list(DEFAULT_CODE_EXTENSIONS),
         "codeFiles": list(DEFAULT_CODE_FILES),
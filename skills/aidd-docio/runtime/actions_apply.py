@@ -42,8 +42,15 @@ from pathlib import Path
 from aidd_runtime import actions_validate, docops, runtime
 from aidd_runtime.io_utils import utc_timestamp
 
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False)
 
-def _apply_action(root: Path, ticket: str, action: dict[str, object]) -> tuple[str, bool, bool]:
+
+def _apply_action(
+    root: Path,
+    ticket: str,
+    action: dict[str, object],
+    tasklist: docops.TasklistTransaction,
+) -> tuple[str, bool, bool]:
     action_type = str(action.get("type", ""))
     params = action.get("params") or {}
     if not isinstance(params, dict):
@@ -52,7 +59,7 @@ def _apply_action(root: Path, ticket: str, action: dict[str, object]) -> tuple[s
     if action_type == "tasklist_ops.set_iteration_done":
         item_id = str(params.get("item_id", ""))
         kind = str(params.get("kind", "iteration"))
-        result = docops.tasklist_set_iteration_done(root, ticket, item_id, kind=kind)
+        result = tasklist.set_iteration_done(item_id, kind=kind)
         return result.message, result.changed, result.error
     if action_type == "tasklist_ops.append_progress_log":
         entry = {
@@ -64,10 +71,13 @@ def _apply_action(root: Path, ticket: str, action: dict[str, object]) -> tuple[s
             "link": params.get("link"),
             "msg": params.get("msg"),
         }
-        result = docops.tasklist_append_progress_log(root, ticket, entry)
+        result = tasklist.append_progress_log(entry)
         return result.message, result.changed, result.error
     if action_type == "tasklist_ops.next3_recompute":
-        result = docops.tasklist_next3_recompute(root, ticket)
+        result = tasklist.recompute_next3()
+        return result.message, result.changed, result.error
+    if action_type == "tasklist_ops.progress_compact":
+        result = tasklist.compact_progress_log()
         return result.message, result.changed, result.error
     if action_type == "context_pack_ops.context_pack_update":
         result = docops.context_pack_update(root, ticket, params)
@@ -85,37 +95,51 @@ def _apply_actions(
         raise ValueError("actions must be a list")
 
     results: list[dict[str, object]] = []
-    for idx, action in enumerate(actions):
-        if not isinstance(action, dict):
+    op_families = {
+        str(action.get("type", "")).partition(".")[0]
+        for action in actions
+        if isinstance(action, dict)
+    }
+    if "tasklist_ops" in op_families or "context_pack_ops" in op_families:
+        docops.prefetch_docs(
+            root,
+            ticket,
+            tasklist="tasklist_ops" in op_families,
+            context_pack="context_pack_ops" in op_families,
+        )
+    # tasklist ops share one in-memory copy and are written back once
+    with docops.TasklistTransaction(root, ticket) as tasklist:
+        for idx, action in enumerate(actions):
+            if not isinstance(action, dict):
+                results.append(
+                    {
+                        "timestamp": utc_timestamp(),
+                        "index": idx,
+                        "type": "",
+                        "status": "error",
+                        "message": "action must be object",
+                    }
+                )
+                continue
+            action_type = str(action.get("type", ""))
+            try:
+                message, changed, errored = _apply_action(root, ticket, action, tasklist)
+                if errored:
+                    status = "error"
+                else:
+                    status = "applied" if changed else "skipped"
+            except Exception as exc:  # pragma: no cover - defensive
+                message = f"exception: {exc}"
+                status = "error"
             results.append(
                 {
                     "timestamp": utc_timestamp(),
                     "index": idx,
-                    "type": "",
-                    "status": "error",
-                    "message": "action must be object",
+                    "type": action_type,
+                    "status": status,
+                    "message": message,
                 }
             )
-            continue
-        action_type = str(action.get("type", ""))
-        try:
-            message, changed, errored = _apply_action(root, ticket, action)
-            if errored:
-                status = "error"
-            else:
-                status = "applied" if changed else "skipped"
-        except Exception as exc:  # pragma: no cover - defensive
-            message = f"exception: {exc}"
-            status = "error"
-        results.append(
-            {
-                "timestamp": utc_timestamp(),
-                "index": idx,
-                "type": action_type,
-                "status": status,
-                "message": message,
-            }
-        )
     if not results:
         results.append(
             {
@@ -127,10 +151,11 @@ def _apply_actions(
             }
         )
 
+    # the whole batch goes out in a single append
+    log_text = "".join(_JSON_ENCODER.encode(entry) + "\n" for entry in results)
     apply_log.parent.mkdir(parents=True, exist_ok=True)
     with apply_log.open("a", encoding="utf-8") as fh:
-        for entry in results:
-            fh.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        fh.write(log_text)
     return results
 
 
@@ -57,6 +57,7 @@ KNOWN_TYPES = {
     "tasklist_ops.set_iteration_done",
     "tasklist_ops.append_progress_log",
     "tasklist_ops.next3_recompute",
+    "tasklist_ops.progress_compact",
     "context_pack_ops.context_pack_update",
 }
 DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
@@ -169,6 +170,9 @@ def _validate_action_item(
     elif action_type == "tasklist_ops.next3_recompute":
         if params:
             errors.append(f"{prefix}params must be empty for next3_recompute")
+    elif action_type == "tasklist_ops.progress_compact":
+        if params:
+            errors.append(f"{prefix}params must be empty for progress_compact")
     elif action_type == "context_pack_ops.context_pack_update":
         _validate_context_pack_params(params, errors, prefix=prefix)
 
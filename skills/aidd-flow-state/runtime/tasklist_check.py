@@ -189,6 +189,16 @@ class WorkItem:
     order_key: tuple
 
 
+@dataclass
+class ParsedTasklist:
+    front: dict[str, str]
+    sections: list[Section]
+    section_map: dict[str, list[Section]]
+    iterations: list[IterationItem]
+    handoffs: list[HandoffItem]
+    progress_entries: list[dict]
+
+
 @dataclass
 class NormalizeResult:
     updated_text: str
@@ -702,6 +712,26 @@ def progress_entry_line(entry: dict) -> str:
     return line
 
 
+def parse_tasklist_full(lines: list[str]) -> ParsedTasklist:
+    """Parse front matter, sections and the iteration/handoff/progress items at once."""
+    front, _ = parse_front_matter(lines)
+    sections, section_map = parse_sections(lines)
+
+    def _first_body(title: str) -> list[str]:
+        entries = section_map.get(title)
+        return section_body(entries[0]) if entries else []
+
+    progress_entries, _ = progress_entries_from_lines(_first_body("AIDD:PROGRESS_LOG"))
+    return ParsedTasklist(
+        front=front,
+        sections=sections,
+        section_map=section_map,
+        iterations=parse_iteration_items(_first_body("AIDD:ITERATIONS_FULL")),
+        handoffs=parse_handoff_items(_first_body("AIDD:HANDOFF_INBOX")),
+        progress_entries=progress_entries,
+    )
+
+
 def load_gate_config(path: Path) -> dict | None:
     if not path.is_file():
         return None
@@ -962,8 +962,20 @@ def write_prd_pack(
     root: Path | None = None,
     limits: dict[str, int] | None = None,
 ) -> Path:
+    payload = json.loads(json_path.resolve().read_text(encoding="utf-8"))
+    return write_prd_pack_from_payload(payload, json_path, output=output, root=root, limits=limits)
+
+
+def write_prd_pack_from_payload(
+    payload: dict[str, Any],
+    json_path: Path,
+    *,
+    output: Path | None = None,
+    root: Path | None = None,
+    limits: dict[str, int] | None = None,
+) -> Path:
+    """Write the PRD pack for an in-memory report; `json_path` need not exist on disk."""
     path = json_path.resolve()
-    payload = json.loads(path.read_text(encoding="utf-8"))
     source_path = None
     if root:
         try:
@@ -220,12 +220,14 @@ def main(argv: list[str] | None = None) -> int:
     if not work_item_key:
         raise ValueError("work_item_key is required for review reports (run loop-pack first)")
 
+    scope_key_fallback = scope_key or runtime.resolve_scope_key(ticket, ticket)
+
     def _fmt(text: str) -> str:
         return (
             text.replace("{ticket}", ticket)
             .replace("{slug}", slug_hint or ticket)
             .replace("{branch}", branch or "")
-            .replace("{scope_key}", scope_key or runtime.resolve_scope_key(ticket, ticket))
+            .replace("{scope_key}", scope_key_fallback)
         )
 
     report_template = args.report or runtime.review_report_template(target)
@@ -279,3 +279,22 @@ def test_write_pack_wrappers_and_main(monkeypatch: pytest.MonkeyPatch, tmp_path:
 
     rc = reports_pack.main(["--rlm-nodes", str(nodes_path), "--rlm-links", str(links_path)])
     assert rc == 0
+
+
+def test_write_prd_pack_from_payload_without_json_on_disk(tmp_path: Path) -> None:
+    json_path = tmp_path / "reports" / "prd" / "TK-1.json"
+    payload = {
+        "ticket": "TK-1",
+        "slug": "tk-1",
+        "status": "ready",
+        "recommended_status": "ready",
+        "findings": [{"severity": "major", "title": "t", "details": "d", "id": "f1"}],
+        "action_items": [],
+        "generated_at": "now",
+    }
+    pack_path = reports_pack.write_prd_pack_from_payload(payload, json_path, root=tmp_path)
+    assert pack_path == json_path.with_suffix(".pack.json").resolve()
+    assert not json_path.exists()
+    pack = json.loads(pack_path.read_text(encoding="utf-8"))
+    assert pack["source_path"] == "reports/prd/TK-1.json"
+    assert pack["findings"]["rows"] == [["f1", "major", "t", "d"]]
@@ -40,3 +40,16 @@ def test_build_manifest_keeps_markdown_targets(tmp_path: Path) -> None:
     assert [item["path"] for item in manifest["files"]] == ["AGENTS.md", "aidd/AGENTS.md"]
     assert {item["lang"] for item in manifest["files"]} == {"md"}
     assert manifest["stats"]["files_total"] == 2
+
+
+def test_manifest_unchanged_ignores_generated_at(tmp_path: Path) -> None:
+    output = tmp_path / "manifest.json"
+    payload = {"schema": "x", "generated_at": "2024-01-01T00:00:00Z", "files": [{"path": "a"}]}
+    assert rlm_manifest._manifest_unchanged(output, payload) is False
+
+    output.write_text(json.dumps({**payload, "generated_at": "2023-01-01T00:00:00Z"}))
+    assert rlm_manifest._manifest_unchanged(output, payload) is True
+    assert rlm_manifest._manifest_unchanged(output, {**payload, "files": []}) is False
+
+    output.write_text("{broken")
+    assert rlm_manifest._manifest_unchanged(output, payload) is False
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
-from aidd_runtime import actions_validate
+import json
+from pathlib import Path
+
+from aidd_runtime import actions_apply, actions_validate
 
 
 def test_validate_actions_v1_success() -> None:
@@ -53,3 +56,44 @@ def test_validate_actions_requires_known_schema_version() -> None:
     errors = actions_validate.validate_actions_data({"schema_version": "aidd.actions.v9"})
     assert errors
     assert "schema_version must be one of" in errors[0]
+
+
+def test_apply_actions_appends_one_log_line_per_result(tmp_path: Path) -> None:
+    apply_log = tmp_path / "reports" / "actions" / "implement.apply.jsonl"
+    payload = {"ticket": "DEMO-1", "actions": ["bad", {"type": "unknown.op", "params": {}}]}
+    results = actions_apply._apply_actions(tmp_path, payload, apply_log)
+    assert [entry["status"] for entry in results] == ["error", "error"]
+
+    actions_apply._apply_actions(tmp_path, {"ticket": "DEMO-1", "actions": []}, apply_log)
+    lines = apply_log.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["type"] for line in lines] == ["", "unknown.op", "(none)"]
+    assert lines[2] == json.dumps(json.loads(lines[2]), ensure_ascii=False)
+
+
+def test_progress_compact_action_dedupes_legacy_progress_entries(tmp_path: Path) -> None:
+    payload = {
+        "schema_version": "aidd.actions.v1",
+        "stage": "implement",
+        "ticket": "DEMO-1",
+        "scope_key": "iteration_id_I1",
+        "work_item_key": "iteration_id=I1",
+        "allowed_action_types": ["tasklist_ops.progress_compact"],
+        "actions": [{"type": "tasklist_ops.progress_compact", "params": {}}],
+    }
+    assert actions_validate.validate_actions_data(payload) == []
+    bad_params = {
+        **payload,
+        "actions": [{"type": "tasklist_ops.progress_compact", "params": {"x": 1}}],
+    }
+    assert any(
+        "params must be empty" in err for err in actions_validate.validate_actions_data(bad_params)
+    )
+
+    line = "- 2024-01-02 source=implement id=I1 kind=iteration hash=abc123 msg=done"
+    tasklist = tmp_path / "docs" / "tasklist" / "DEMO-1.md"
+    tasklist.parent.mkdir(parents=True)
+    tasklist.write_text(f"# Tasklist\n\n## AIDD:PROGRESS_LOG\n{line}\n{line}\n", encoding="utf-8")
+    apply_log = tmp_path / "reports" / "actions" / "implement.apply.jsonl"
+    results = actions_apply._apply_actions(tmp_path, payload, apply_log)
+    assert [entry["status"] for entry in results] == ["applied"]
+    assert tasklist.read_text(encoding="utf-8").count(line) == 1
@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from aidd_runtime import docops
+
+TASKLIST = """---
+Ticket: DEMO-1
+---
+
+## AIDD:ITERATIONS_FULL
+- [ ] I1: First step (iteration_id: I1)
+  - State: open
+- [ ] I10: Tenth step (iteration_id: I10)
+  - State: open
+
+## AIDD:HANDOFF_INBOX
+- [ ] Fix review finding (id: review:F1)
+
+## AIDD:PROGRESS_LOG
+- (empty)
+"""
+
+
+def _write_tasklist(root: Path, text: str = TASKLIST) -> Path:
+    path = root / "docs" / "tasklist" / "DEMO-1.md"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+def test_mark_checkbox_done_matches_exact_iteration_id() -> None:
+    lines = TASKLIST.splitlines()
+    updated, status = docops._mark_checkbox_done(lines, "I1", kind="iteration")
+    assert status == "changed"
+    assert updated[5] == "- [x] I1: First step (iteration_id: I1)"
+    assert updated[6] == "  - State: done"
+    assert updated[7].startswith("- [ ] I10")
+    assert updated[8] == "  - State: open"
+
+
+def test_mark_checkbox_done_handles_handoff_ids_and_missing_items() -> None:
+    lines = TASKLIST.splitlines()
+    updated, status = docops._mark_checkbox_done(lines, "review:F1", kind="handoff")
+    assert status == "changed"
+    assert "- [x] Fix review finding (id: review:F1)" in updated
+
+    _, status = docops._mark_checkbox_done(updated, "review:F1", kind="handoff")
+    assert status == "already_done"
+    _, status = docops._mark_checkbox_done(lines, "I2", kind="iteration")
+    assert status == "not_found"
+
+
+def test_tasklist_set_iteration_done_rewrites_file(tmp_path: Path) -> None:
+    path = _write_tasklist(tmp_path)
+    result = docops.tasklist_set_iteration_done(tmp_path, "DEMO-1", "I10")
+    assert result.changed and not result.error
+    text = path.read_text(encoding="utf-8")
+    assert "- [x] I10: Tenth step (iteration_id: I10)" in text
+    assert "- [ ] I1: First step (iteration_id: I1)" in text
+
+    again = docops.tasklist_set_iteration_done(tmp_path, "DEMO-1", "I10")
+    assert not again.changed and not again.error
+
+
+def test_docops_reparses_tasklist_after_external_edit(tmp_path: Path) -> None:
+    path = _write_tasklist(tmp_path)
+    first = docops._read_doc(path)
+    assert docops._read_doc(path) is first
+
+    path.write_text(TASKLIST.replace("I10: Tenth", "I10: Tenth!"), encoding="utf-8")
+    second = docops._read_doc(path)
+    assert second is not first
+    assert "I10: Tenth! step (iteration_id: I10)" in second.text
+    assert second.lines == tuple(second.text.splitlines())
+
+
+def test_tasklist_transaction_writes_once(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    path = _write_tasklist(tmp_path)
+    writes: list[Path] = []
+    original_write = docops._write_doc
+
+    def _spy(target: Path, lines: list[str]) -> None:
+        writes.append(target)
+        original_write(target, lines)
+
+    monkeypatch.setattr(docops, "_write_doc", _spy)
+    entry = {
+        "date": "2024-01-02",
+        "source": "implement",
+        "item_id": "I1",
+        "kind": "iteration",
+        "hash": "abc123",
+        "msg": "done",
+    }
+    with docops.TasklistTransaction(tmp_path, "DEMO-1") as tx:
+        assert tx.set_iteration_done("I1").changed
+        assert tx.append_progress_log(entry).changed
+        assert tx.recompute_next3().changed
+        assert writes == []
+
+    assert writes == [path]
+    text = path.read_text(encoding="utf-8")
+    assert "- [x] I1: First step (iteration_id: I1)" in text
+    assert "source=implement id=I1" in text
+    assert "## AIDD:NEXT_3" in text
+    assert docops.tasklist_next3_recompute(tmp_path, "DEMO-1").changed is False
+
+
+def test_context_pack_update_reports_noop(tmp_path: Path) -> None:
+    path = tmp_path / "reports" / "context" / "DEMO-1.pack.md"
+    path.parent.mkdir(parents=True)
+    path.write_text(
+        "---\ngenerated_at: 2024-01-01\n---\n\nread_next:\n- a.md\n\n## What to do now\n- ship\n",
+        encoding="utf-8",
+    )
+    payload = {"read_next": ["a.md"], "generated_at": "2024-01-01", "what_to_do": "ship"}
+    result = docops.context_pack_update(tmp_path, "DEMO-1", payload)
+    assert result.changed is False
+
+    result = docops.context_pack_update(tmp_path, "DEMO-1", {"read_next": ["b.md"]})
+    assert result.changed is True
+    assert "read_next:\n- b.md\n" in path.read_text(encoding="utf-8")
+
+
+def test_context_pack_update_applies_all_fields(tmp_path: Path) -> None:
+    path = tmp_path / "reports" / "context" / "DEMO-1.pack.md"
+    path.parent.mkdir(parents=True)
+    path.write_text(
+        "\n".join(
+            [
+                "---",
+                "generated_at: 2024-01-01",
+                "---",
+                "",
+                "read_next:",
+                "- a.md",
+                "artefact_links:",
+                "- old",
+                "",
+                "## AIDD:READ_LOG",
+                "- one",
+                "",
+                "## What to do now",
+                "",
+                "## User note",
+                "- keep",
+                "",
+            ]
+        ),
+        encoding="utf-8",
+    )
+    payload = {
+        "read_log": ["x", "y", "z"],
+        "read_next": ["b.md", "c.md"],
+        "generated_at": "2024-02-02",
+        "artefact_links": [],
+        "what_to_do": "ship it",
+        "user_note": "",
+    }
+    result = docops.context_pack_update(tmp_path, "DEMO-1", payload)
+    assert result.changed is True
+    assert path.read_text(encoding="utf-8").splitlines() == [
+        "---",
+        "generated_at: 2024-02-02",
+        "---",
+        "",
+        "read_next:",
+        "- b.md",
+        "- c.md",
+        "artefact_links:",
+        "- n/a",
+        "",
+        "## AIDD:READ_LOG",
+        "- x",
+        "- y",
+        "- z",
+        "## What to do now",
+        "- ship it",
+        "",
+        "## User note",
+        "- n/a",
+    ]
+
+
+def test_tasklist_progress_compact_drops_legacy_duplicates(tmp_path: Path) -> None:
+    line = "- 2024-01-02 source=implement id=I1 kind=iteration hash=abc123 msg=done"
+    path = _write_tasklist(tmp_path, TASKLIST.replace("- (empty)", f"{line}\n{line}"))
+    entry = {
+        "date": "2024-01-03",
+        "source": "review",
+        "item_id": "I10",
+        "kind": "iteration",
+        "hash": "def456",
+        "msg": "ok",
+    }
+    assert docops.tasklist_append_progress_log(tmp_path, "DEMO-1", entry).changed
+    assert path.read_text(encoding="utf-8").count(line) == 2
+
+    assert docops.tasklist_progress_compact(tmp_path, "DEMO-1").changed
+    text = path.read_text(encoding="utf-8")
+    assert text.count(line) == 1
+    assert "source=review id=I10" in text
+    assert docops.tasklist_progress_compact(tmp_path, "DEMO-1").changed is False
+
+
+def test_context_pack_update_does_not_parse_a_tasklist(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    pack = tmp_path / "reports" / "context" / "DEMO-1.pack.md"
+    pack.parent.mkdir(parents=True)
+    pack.write_text("## What to do now\n- ship\n", encoding="utf-8")
+
+    def _fail(_lines: list[str]) -> None:
+        raise AssertionError("context packs are not tasklists")
+
+    monkeypatch.setattr(docops, "parse_tasklist_full", _fail)
+    assert docops.context_pack_update(tmp_path, "DEMO-1", {"what_to_do": "test"}).changed
+    assert pack.read_text(encoding="utf-8") == "## What to do now\n- test\n"
+
+
+def test_prefetch_docs_warms_parse_cache(tmp_path: Path) -> None:
+    tasklist = _write_tasklist(tmp_path)
+    pack = tmp_path / "reports" / "context" / "DEMO-1.pack.md"
+    pack.parent.mkdir(parents=True)
+    pack.write_text("## What to do now\n- ship\n", encoding="utf-8")
+
+    docs = docops.prefetch_docs(tmp_path, "DEMO-1")
+    assert set(docs) == {tasklist, pack}
+    assert docops._read_doc(tasklist) is docs[tasklist]
+    assert docops._read_doc(pack) is docs[pack]
+    assert docops.prefetch_docs(tmp_path, "MISSING") == {}
+    assert set(docops.prefetch_docs(tmp_path, "DEMO-1", context_pack=False)) == {tasklist}
+    assert set(docops.prefetch_docs(tmp_path, "DEMO-1", tasklist=False)) == {pack}
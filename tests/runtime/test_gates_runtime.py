@@ -2,11 +2,13 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from aidd_runtime import gate_workflow, gates
+import pytest
+
+from aidd_runtime import gate_workflow, gates, prd_review_gate, prd_scan
 from aidd_runtime.analyst_guard import AnalystSettings, validate_prd
-from aidd_runtime.prd_review import extract_review_section
-from aidd_runtime.prd_review_gate import extract_dialog_status
+from aidd_runtime.prd_review import MAX_PLACEHOLDER_FINDINGS, extract_review_section, scan_prd
 from aidd_runtime.prd_review_gate import parse_review_section as parse_prd_review_section
+from aidd_runtime.prd_scan import extract_dialog_status
 
 
 def test_select_file_path_prefers_src() -> None:
@@ -37,6 +39,14 @@ def test_resolve_stage_tests_policy_with_override() -> None:
     assert gates.resolve_stage_tests_policy(config, "implement") == "full"
 
 
+def test_resolve_stage_tests_policy_aliases_and_fallbacks() -> None:
+    assert gates.resolve_stage_tests_policy({"testsPolicy": "skip"}, "qa") == "none"
+    assert gates.resolve_stage_tests_policy({"tests_policy": "Selective"}, "qa") == "targeted"
+    assert gates.resolve_stage_tests_policy({"tests_policy": {"qa": "bogus"}}, "qa") == "full"
+    assert gates.resolve_stage_tests_policy(None, "review") == "targeted"  # type: ignore[arg-type]
+    assert gates.resolve_stage_tests_policy({}, "unknown") == ""
+
+
 def test_branch_enabled_with_allow_and_skip_patterns() -> None:
     assert gates.branch_enabled("feature/demo", allow=["feature/*"], skip=["docs/*"]) is True
     assert gates.branch_enabled("docs/readme", allow=["feature/*"], skip=["docs/*"]) is False
@@ -117,3 +127,190 @@ def test_prd_review_gate_parser_accepts_numbered_review_heading() -> None:
     assert found is True
     assert status == "ready"
     assert action_items == ["- [ ] Pending item"]
+
+
+def test_scan_prd_collects_review_dialog_and_placeholders() -> None:
+    content = "\n".join(
+        [
+            "# PRD",
+            "",
+            "## Dialog analyst",
+            "Status: DRAFT",
+            "Status: READY",
+            "",
+            "## Goals",
+            "- TBD owner",
+            "",
+            "## PRD Review",
+            "Status: BLOCKED",
+            "- [ ] Fill <metric>",
+            "",
+            "## Appendix",
+            "Status: READY",
+        ]
+    )
+    scan = scan_prd(content)
+    assert scan.dialog_status == "draft"
+    assert scan.review_found is True
+    assert scan.review_status == "blocked"
+    assert scan.action_items == ["- [ ] Fill <metric>"]
+    assert scan.placeholder_lines == ["- TBD owner", "- [ ] Fill <metric>"]
+    assert scan_prd("# PRD\n").review_found is False
+
+
+def test_scan_prd_caps_placeholder_lines() -> None:
+    content = "\n".join(f"- TODO {idx}" for idx in range(MAX_PLACEHOLDER_FINDINGS + 5))
+    scan = scan_prd(content)
+    assert len(scan.placeholder_lines) == MAX_PLACEHOLDER_FINDINGS
+    assert scan.placeholders_truncated is True
+    assert scan_prd("- TODO once").placeholders_truncated is False
+
+
+def test_prd_scan_reuses_sidecar_until_prd_changes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    prd_path = tmp_path / "docs" / "prd" / "T-1.prd.md"
+    prd_path.parent.mkdir(parents=True)
+    prd_path.write_text("## PRD Review\nStatus: READY\n", encoding="utf-8")
+    first = prd_scan.scan(prd_path, cache_root=tmp_path)
+    assert first.review_status == "ready"
+    assert list((tmp_path / ".cache" / "prd_scan").glob("*.json"))
+
+    def _fail(content: bytes) -> prd_scan.PrdScan:
+        raise AssertionError("sidecar should be reused")
+
+    monkeypatch.setattr(prd_scan, "scan_prd", _fail)
+    assert prd_scan.scan(prd_path, cache_root=tmp_path) == first
+    monkeypatch.undo()
+
+    prd_path.write_text("## PRD Review\nStatus: BLOCKED\n- [ ] Fix scope\n", encoding="utf-8")
+    second = prd_scan.scan(prd_path, cache_root=tmp_path)
+    assert second.review_status == "blocked"
+    assert second.action_items == ["- [ ] Fix scope"]
+
+
+def test_prd_scan_ignores_sidecar_from_another_scanner_version(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    prd_path = tmp_path / "docs" / "prd" / "T-1.prd.md"
+    prd_path.parent.mkdir(parents=True)
+    prd_path.write_text("## PRD Review\nStatus: READY\n", encoding="utf-8")
+    assert prd_scan.scan(prd_path, cache_root=tmp_path).review_status == "ready"
+
+    monkeypatch.setattr(prd_scan, "SCAN_VERSION", prd_scan.SCAN_VERSION + 1)
+    rescanned = prd_scan.PrdScan(False, "rescanned", [], [], False, None)
+    monkeypatch.setattr(prd_scan, "scan_prd", lambda content: rescanned)
+    assert prd_scan.scan(prd_path, cache_root=tmp_path) == rescanned
+
+
+def test_matches_uses_fnmatch_semantics() -> None:
+    assert gates.matches(["release/*", "hotfix-?"], "hotfix-1") is True
+    assert gates.matches(["release/*", "hotfix-?"], "hotfix-12") is False
+    assert gates.matches("main", "main") is True
+    assert gates.matches(["", None], "main") is False  # type: ignore[list-item]
+    assert gates.matches(["feature/*"], "") is False
+
+
+def test_load_gates_config_reloads_after_edit(tmp_path: Path) -> None:
+    config_path = tmp_path / "config" / "gates.json"
+    assert gates.load_gates_config(tmp_path) == {}
+    config_path.parent.mkdir(parents=True)
+    config_path.write_text('{"plan_review": false}', encoding="utf-8")
+    assert gates.load_gate_section(tmp_path, "plan_review") == {"enabled": False}
+
+    config_path.write_text('{"plan_review": {"enabled": true}}', encoding="utf-8")
+    assert gates.load_gate_section(tmp_path, "plan_review") == {"enabled": True}
+
+    config_path.write_text("{broken", encoding="utf-8")
+    with pytest.raises(ValueError):
+        gates.load_gates_config(tmp_path)
+
+
+def test_prd_gate_settings_are_cached_until_config_changes(tmp_path: Path) -> None:
+    config_path = tmp_path / "gates.json"
+    defaults = prd_review_gate.load_gate_settings(config_path)
+    assert defaults.enabled is True
+    assert defaults.code_prefixes == prd_review_gate.DEFAULT_CODE_PREFIXES
+
+    config_path.write_text(
+        '{"prd_review": {"approved_statuses": ["READY", "Done"], "code_prefixes": ["./pkg"]}}',
+        encoding="utf-8",
+    )
+    settings = prd_review_gate.load_gate_settings(config_path)
+    assert settings.approved == {"ready", "done"}
+    assert settings.code_prefixes == ("pkg/",)
+    assert prd_review_gate.load_gate_settings(config_path) is settings
+
+    config_path.write_text('{"prd_review": {"enabled": false}}', encoding="utf-8")
+    assert prd_review_gate.load_gate_settings(config_path).enabled is False
+
+
+def test_prd_gate_settings_normalize_branch_patterns() -> None:
+    settings = prd_review_gate._build_gate_settings(
+        {"skip_branches": "release/*", "branches": ["feature/*", 3]}
+    )
+    assert settings.skip_branches == ("release/*",)
+    assert settings.branches == ("feature/*",)
+    empty = prd_review_gate._build_gate_settings({"skip_branches": "", "branches": None})
+    assert (empty.skip_branches, empty.branches) == (None, None)
+
+
+def test_prd_gate_settings_format_report_path() -> None:
+    defaults = prd_review_gate._build_gate_settings({})
+    assert defaults.report_templated is True
+    assert defaults.report_path_text("T-1", "demo") == "aidd/reports/prd/T-1.json"
+
+    custom = prd_review_gate._build_gate_settings({"report_path": "out/{slug}-{ticket}.json"})
+    assert custom.report_path_text("T-1", "demo") == "out/demo-T-1.json"
+    fixed = prd_review_gate._build_gate_settings({"report_path": "out/prd.json"})
+    assert fixed.report_templated is False
+    assert fixed.report_path_text("T-1", "demo") == "out/prd.json"
+
+
+def test_prd_gate_code_path_matches_prefixes_and_globs() -> None:
+    globs_re = prd_review_gate._compile_globs(["*.gradle", "docker/*"])
+    prefixes = ("src/",)
+    assert prd_review_gate._is_code_path("src/app.py", prefixes, globs_re) is True
+    assert prd_review_gate._is_code_path("build.gradle", prefixes, globs_re) is True
+    assert prd_review_gate._is_code_path("docker\\Dockerfile", prefixes, globs_re) is True
+    assert prd_review_gate._is_code_path("docs/readme.md", prefixes, globs_re) is False
+    assert prd_review_gate._is_code_path("docs/readme.md", prefixes, None) is False
+
+
+def test_prd_gate_normalizes_file_paths_under_root(tmp_path: Path) -> None:
+    root = tmp_path.resolve()
+    normalize = prd_review_gate._normalize_file_path
+    assert normalize(str(root / "src" / "app.py"), root) == "src/app.py"
+    assert normalize(str(root / "docs" / ".." / "src" / "app.py"), root) == "src/app.py"
+    assert normalize("", root) == ""
+
+
+def test_prd_gate_skips_non_code_edits_before_reading_prd(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(prd_review_gate, "detect_project_root", lambda: tmp_path)
+    args = prd_review_gate.parse_args(["--ticket", "T-1", "--file-path", "docs/notes.md"])
+    assert prd_review_gate.run_gate(args) == 0
+
+    args = prd_review_gate.parse_args(["--ticket", "T-1", "--file-path", "src/app.py"])
+    assert prd_review_gate.run_gate(args) == 1
+
+
+def test_prd_review_pack_only_removes_stale_json_report(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from aidd_runtime import prd_review
+
+    root = tmp_path / "aidd"
+    prd = root / "docs" / "prd" / "T-1.prd.md"
+    prd.parent.mkdir(parents=True)
+    prd.write_text("# PRD\n\n## PRD Review\nStatus: READY\n", encoding="utf-8")
+    report = root / "reports" / "prd" / "T-1.json"
+    report.parent.mkdir(parents=True)
+    report.write_text('{"ticket": "T-1", "status": "blocked"}', encoding="utf-8")
+    monkeypatch.setattr(prd_review, "detect_project_root", lambda: root)
+
+    args = prd_review.parse_args(["--ticket", "T-1", "--pack-only", "--stdout-format", "text"])
+    assert prd_review.run(args) == 0
+    assert not report.exists()
+    assert (root / "reports" / "prd" / "T-1.pack.json").exists()
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+from aidd_runtime import launcher
+
+
+def test_run_guarded_captures_output_and_appends_log(tmp_path: Path) -> None:
+    log_path = tmp_path / "logs" / "wrapper.test.log"
+
+    def _runner() -> int:
+        print("hello")
+        print("oops", file=sys.stderr)
+        return 3
+
+    result = launcher.run_guarded(_runner, log_path_value=log_path)
+    assert result.exit_code == 3
+    assert result.stdout == "hello\n"
+    assert result.stderr == "oops\n"
+    assert (result.stdout_lines, result.stdout_bytes, result.stderr_lines) == (1, 6, 1)
+    assert result.output_limited is False
+
+    launcher.run_guarded(lambda: None, log_path_value=log_path)
+    assert log_path.read_text(encoding="utf-8") == (
+        "[stdout]\nhello\n\n[stderr]\noops\n\n[stdout]\n\n[stderr]\n\n"
+    )
+
+
+def test_counting_string_io_matches_splitlines_and_utf8_size() -> None:
+    buf = launcher.CountingStringIO()
+    for chunk in ("héllo\n", "wörld", "", "\n", "tail"):
+        buf.write(chunk)
+    text = buf.getvalue()
+    assert buf.line_count == len(text.splitlines())
+    assert buf.nbytes == len(text.encode("utf-8"))
+
+
+def test_run_guarded_drops_output_over_limits(tmp_path: Path) -> None:
+    log_path = tmp_path / "wrapper.limited.log"
+
+    def _runner() -> int:
+        for idx in range(10_000):
+            try:
+                print(f"line {idx}")
+            except Exception:  # runners swallowing errors must not bypass the cap
+                pass
+        return 0
+
+    result = launcher.run_guarded(_runner, log_path_value=log_path, stdout_max_lines=3)
+    assert result.exit_code == launcher.OUTPUT_LIMIT_EXIT_CODE
+    assert result.wrapped_exit_code == launcher.OUTPUT_LIMIT_EXIT_CODE
+    assert result.output_limited is True
+    assert result.stdout == ""
+    assert "output exceeded limits" in result.stderr
+    log_text = log_path.read_text(encoding="utf-8")
+    assert "line 2" in log_text
+    assert "line 3" not in log_text
+    assert result.stdout_lines == 3
+
+
+def test_counting_string_io_keeps_only_the_part_of_a_write_under_the_caps() -> None:
+    buf = launcher.CountingStringIO(byte_cap=8)
+    with pytest.raises(launcher._OutputLimitExceeded):
+        buf.write("héllo wörld\n" * 1000)
+    assert buf.getvalue() == "héllo w"
+    assert buf.nbytes == 8
+    buf.write("dropped")
+    assert buf.getvalue() == "héllo w"
+
+    buf = launcher.CountingStringIO(line_cap=2)
+    buf.write("a")
+    with pytest.raises(launcher._OutputLimitExceeded):
+        buf.write("b\nc\nd\n" + "x" * 10_000)
+    assert buf.getvalue() == "ab\nc\n"
+    assert (buf.line_count, buf.nbytes) == (2, 5)
+
+
+def test_actions_paths_layout(tmp_path: Path) -> None:
+    context = launcher.LaunchContext(
+        root=tmp_path, ticket="T-1", scope_key="iter-1", work_item_key="iter-1", stage="review"
+    )
+    paths = launcher.actions_paths(context)
+    actions_base = tmp_path / "reports" / "actions" / "T-1" / "iter-1"
+    assert paths["actions_template"] == actions_base / "review.actions.template.json"
+    assert paths["apply_log"] == actions_base / "review.apply.jsonl"
+    assert paths["readmap_md"] == tmp_path / "reports" / "context" / "T-1" / "iter-1.readmap.md"
+    assert paths["preflight_result"] == (
+        tmp_path / "reports" / "loops" / "T-1" / "iter-1" / "stage.preflight.result.json"
+    )
+    assert all(isinstance(value, Path) for value in paths.values())
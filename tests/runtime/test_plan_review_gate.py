@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from aidd_runtime import plan_review_gate
+
+PLAN = """# Plan
+
+## Scope
+- [ ] not a review item
+
+## Plan Review
+Status: READY (checked)
+
+```text
+- [ ] fenced item
+```
+
+### Action__Items
+- [x] closed item
+- [ ] open item
+
+## Next
+- [ ] trailing item
+"""
+
+
+def test_parse_review_section_reads_status_and_action_items() -> None:
+    found, status, items = plan_review_gate.parse_review_section(PLAN)
+    assert found is True
+    assert status == "ready"
+    assert items == ["- [x] closed item", "- [ ] open item"]
+
+
+def test_parse_review_section_falls_back_to_loose_items() -> None:
+    content = "## Plan Review\r\nstatus: blocked-by-qa\r\n- [ ] loose item\r\n"
+    found, status, items = plan_review_gate.parse_review_section(content)
+    assert found is True
+    assert status == "blocked"
+    assert items == ["- [ ] loose item"]
+
+
+def test_parse_review_section_missing_section() -> None:
+    assert plan_review_gate.parse_review_section("# Plan\n\n## Scope\n") == (False, "", [])
+
+
+def test_parse_review_section_for_gate_reports_open_items() -> None:
+    assert plan_review_gate.parse_review_section_for_gate(PLAN) == (True, "ready", True)
+    closed = PLAN.replace("- [ ] open item", "- [x] open item")
+    assert plan_review_gate.parse_review_section_for_gate(closed) == (True, "ready", False)
+
+
+LATE_BLOCKED = """## Plan Review
+Status: READY
+
+### Action items
+- [ ] x
+Status: BLOCKED
+"""
+
+
+def test_parse_review_section_for_gate_keeps_the_last_status_when_items_may_stay_open() -> None:
+    assert plan_review_gate.parse_review_section(LATE_BLOCKED)[1] == "blocked"
+    assert plan_review_gate.parse_review_section_for_gate(
+        LATE_BLOCKED, stop_at_open_item=False
+    ) == (True, "blocked", True)
+
+
+def test_run_gate_blocks_late_blocked_status_without_closed_item_rule(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    (tmp_path / "docs" / "plan").mkdir(parents=True)
+    (tmp_path / "docs" / "plan" / "DEMO-1.md").write_text(LATE_BLOCKED, encoding="utf-8")
+    (tmp_path / "config").mkdir()
+    (tmp_path / "config" / "gates.json").write_text(
+        json.dumps({"plan_review": {"require_action_items_closed": False}}), encoding="utf-8"
+    )
+    monkeypatch.setattr(plan_review_gate, "detect_project_root", lambda: tmp_path)
+
+    args = plan_review_gate.parse_args(["--ticket", "DEMO-1"])
+    assert plan_review_gate.run_gate(args) == 1
+    assert "marked 'BLOCKED'" in capsys.readouterr().out
+
+
+def test_status_set_defaults_and_lowercases_config_values() -> None:
+    default = plan_review_gate.DEFAULT_APPROVED
+    assert plan_review_gate._status_set(None, default) is default
+    assert plan_review_gate._status_set(["Ready", "DONE"], default) == {"ready", "done"}
+    assert plan_review_gate._status_set([], default) == frozenset()
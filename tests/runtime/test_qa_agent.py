@@ -0,0 +1,283 @@
+from __future__ import annotations
+
+import json
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from aidd_runtime import qa_agent
+
+
+def test_parse_status_records_collects_changed_staged_and_untracked() -> None:
+    records = [
+        "1 .M N... 100644 100644 100644 abc abc src/app.py",
+        "1 M. N... 100644 100644 100644 abc def docs/with space.md",
+        "2 R. N... 100644 100644 100644 abc abc R100 src/new.py",
+        "src/old.py",
+        "u UU N... 100644 100644 100644 100644 a b c conflict.py",
+        "? tests/test_new.py",
+        "! build/ignored.txt",
+    ]
+    assert qa_agent._parse_status_records(records) == {
+        "src/app.py",
+        "docs/with space.md",
+        "src/new.py",
+        "conflict.py",
+        "tests/test_new.py",
+    }
+
+
+def test_analyse_code_tokens_reuses_cached_hits_until_file_changes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(qa_agent, "ROOT_DIR", tmp_path)
+    source = tmp_path / "src" / "app.py"
+    source.parent.mkdir(parents=True)
+    source.write_text("x = 1\n# TODO: later\n# FIXME now\n", encoding="utf-8")
+
+    findings = qa_agent.analyse_code_tokens(["src/app.py", "docs/readme.md"])
+    assert [(item.severity, item.details) for item in findings] == [
+        ("blocker", "src/app.py:3 → # FIXME now"),
+        ("major", "src/app.py:2 → # TODO: later"),
+    ]
+    assert (tmp_path / ".cache" / qa_agent.TOKENS_CACHE_FILENAME).exists()
+
+    def _fail(*_args: object) -> tuple:
+        raise AssertionError("cached hits should be reused")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(qa_agent, "_scan_file_tokens", _fail)
+        assert len(qa_agent.analyse_code_tokens(["src/app.py"])) == 2
+
+    source.write_text("x = 2\n", encoding="utf-8")
+    assert qa_agent.analyse_code_tokens(["src/app.py"]) == []
+
+
+def test_analyse_code_tokens_drops_stale_versions_and_unscanned_entries(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(qa_agent, "ROOT_DIR", tmp_path)
+    source = tmp_path / "src" / "app.py"
+    source.parent.mkdir(parents=True)
+    source.write_text("# TODO: later\n", encoding="utf-8")
+    info = source.stat()
+    cache_path = tmp_path / ".cache" / qa_agent.TOKENS_CACHE_FILENAME
+    cache_path.parent.mkdir()
+    stale_hits = {"key": [info.st_mtime_ns, info.st_size], "hits": [["HACK", 1, "x"]]}
+    cache_path.write_text(json.dumps({"src/app.py": stale_hits}), encoding="utf-8")
+
+    findings = qa_agent.analyse_code_tokens(["src/app.py"])
+    assert [item.details for item in findings] == ["src/app.py:1 → # TODO: later"]
+    payload = json.loads(cache_path.read_text(encoding="utf-8"))
+    assert payload["version"] == qa_agent.CACHE_VERSION
+    assert set(payload["entries"]) == {"src/app.py"}
+
+    other = tmp_path / "src" / "other.py"
+    other.write_text("x = 1\n", encoding="utf-8")
+    qa_agent.analyse_code_tokens(["src/other.py"])
+    payload = json.loads(cache_path.read_text(encoding="utf-8"))
+    assert set(payload["entries"]) == {"src/other.py"}
+
+
+def test_analyse_code_tokens_ignores_its_own_cache_on_the_next_run(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+    monkeypatch.delenv("GIT_DIR", raising=False)
+    monkeypatch.delenv("QA_AGENT_DIFF_BASE", raising=False)
+    monkeypatch.setattr(qa_agent, "ROOT_DIR", tmp_path)
+    source = tmp_path / "src" / "app.py"
+    source.parent.mkdir(parents=True)
+    source.write_text("# FIXME now\n", encoding="utf-8")
+
+    for _ in range(2):
+        files = qa_agent.collect_changed_files()
+        assert files == {"src/app.py"}
+        findings = qa_agent.analyse_code_tokens(sorted(files))
+        assert [item.details for item in findings] == ["src/app.py:1 → # FIXME now"]
+    assert (tmp_path / ".cache" / qa_agent.TOKENS_CACHE_FILENAME).exists()
+    assert (
+        qa_agent.analyse_code_tokens([".cache/qa-tokens.json", ".cache/qa-tokens.json.tmp"]) == []
+    )
+
+
+def test_is_cache_path_matches_only_the_workflow_qa_caches(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(qa_agent, "ROOT_DIR", tmp_path / "aidd")
+    assert qa_agent._is_cache_path(".cache/qa-tokens.json")
+    assert qa_agent._is_cache_path(".cache/qa-tasklist.json.tmp")
+    assert qa_agent._is_cache_path("aidd/.cache/qa-tokens.json")
+    assert not qa_agent._is_cache_path("other/.cache/qa-tokens.json")
+    assert not qa_agent._is_cache_path(".cache/gen.py")
+    assert not qa_agent._is_cache_path("src/.cache/gen.py")
+
+
+def test_analyse_code_tokens_filters_by_suffix_and_source_dirs(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(qa_agent, "ROOT_DIR", tmp_path)
+    for relative in ("app/src/notes.md", "mysrc/notes.md", "build.gradle.kts", "docs/a.txt"):
+        path = tmp_path / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("TODO\n", encoding="utf-8")
+    files = ["app/src/notes.md", "mysrc/notes.md", "build.gradle.kts", "docs/a.txt"]
+    scopes = [item.scope for item in qa_agent.analyse_code_tokens(files)]
+    assert scopes == ["app/src/notes.md", "build.gradle.kts"]
+
+
+TASKLIST = """---
+Ticket: DEMO-1
+---
+
+## AIDD:CHECKLIST_QA
+- [ ] Run smoke suite
+- [ ] Manual check of login flow
+- [x] Done item
+
+## Notes
+- [ ] Not a QA item
+<!-- handoff:qa start -->
+- [ ] Fix flaky test (Blocking: true)
+- [ ] Polish copy (Blocking: false)
+- [ ] No flag here
+<!-- handoff:qa end -->
+- [ ] Outside handoff (Blocking: true)
+"""
+
+
+def test_analyse_tasklist_reports_open_checklist_and_handoff_items(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(qa_agent, "ROOT_DIR", tmp_path)
+    path = tmp_path / "docs" / "tasklist" / "DEMO-1.md"
+    path.parent.mkdir(parents=True)
+    path.write_text(TASKLIST, encoding="utf-8")
+
+    findings, manual = qa_agent.analyse_tasklist("DEMO-1", None)
+    assert [(item.severity, item.blocking, item.details) for item in findings] == [
+        ("blocker", False, "docs/tasklist/DEMO-1.md:6 → - [ ] Run smoke suite"),
+        ("major", False, "docs/tasklist/DEMO-1.md:7 → - [ ] Manual check of login flow"),
+        ("blocker", True, "docs/tasklist/DEMO-1.md:13 → - [ ] Fix flaky test (Blocking: true)"),
+        ("major", False, "docs/tasklist/DEMO-1.md:14 → - [ ] Polish copy (Blocking: false)"),
+    ]
+    assert manual == ["docs/tasklist/DEMO-1.md:7 → - [ ] Manual check of login flow"]
+    assert len({item.id for item in findings}) == 4
+    assert qa_agent.analyse_tasklist("MISSING", None) == ([], [])
+
+
+def test_analyse_tasklist_reuses_cached_findings_until_file_changes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(qa_agent, "ROOT_DIR", tmp_path)
+    path = tmp_path / "docs" / "tasklist" / "DEMO-1.md"
+    path.parent.mkdir(parents=True)
+    path.write_text(TASKLIST, encoding="utf-8")
+    first = qa_agent.analyse_tasklist(None, None)
+
+    def _fail(*_args: object) -> tuple:
+        raise AssertionError("cached findings should be reused")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(qa_agent, "_analyse_tasklist_lines", _fail)
+        assert qa_agent.analyse_tasklist(None, None) == first
+
+    path.write_text(TASKLIST.replace("- [ ] Run smoke suite\n", ""), encoding="utf-8")
+    findings, _ = qa_agent.analyse_tasklist(None, None)
+    assert len(findings) == len(first[0]) - 1
+
+
+def test_analyse_tasklist_ignores_old_finding_shapes_and_prunes_missing_tasklists(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(qa_agent, "ROOT_DIR", tmp_path)
+    path = tmp_path / "docs" / "tasklist" / "DEMO-1.md"
+    path.parent.mkdir(parents=True)
+    path.write_text(TASKLIST, encoding="utf-8")
+    info = path.stat()
+    cache_path = tmp_path / ".cache" / qa_agent.TASKLIST_CACHE_FILENAME
+    cache_path.parent.mkdir()
+    old_entry = {"key": [info.st_mtime_ns, info.st_size], "findings": [{"sev": "x"}]}
+    entries = {"docs/tasklist/DEMO-1.md": old_entry, "docs/tasklist/GONE.md": old_entry}
+    cache_path.write_text(
+        json.dumps({"version": qa_agent.CACHE_VERSION, "entries": entries}), encoding="utf-8"
+    )
+
+    findings, _ = qa_agent.analyse_tasklist("DEMO-1", None)
+    assert findings
+    cached = json.loads(cache_path.read_text(encoding="utf-8"))["entries"]
+    assert set(cached) == {"docs/tasklist/DEMO-1.md", "docs/tasklist/GONE.md"}
+
+    assert qa_agent.analyse_tasklist(None, None)[0] == findings
+    cached = json.loads(cache_path.read_text(encoding="utf-8"))["entries"]
+    assert set(cached) == {"docs/tasklist/DEMO-1.md"}
+
+
+def test_write_report_replaces_existing_report(tmp_path: Path) -> None:
+    report = tmp_path / "reports" / "qa" / "DEMO-1.json"
+    qa_agent.write_report(report, {"status": "WARN"})
+    qa_agent.write_report(report, {"status": "READY", "findings": []})
+    assert report.read_text(encoding="utf-8") == '{\n  "status": "READY",\n  "findings": []\n}'
+    assert list(report.parent.iterdir()) == [report]
+
+
+def test_analyse_tests_coverage_flags_code_without_tests() -> None:
+    files = ["src/main/A.kt", "docs/a.md", "src/main/B.kt", "src/main/C.kt", "src/main/D.kt"]
+    findings = qa_agent.analyse_tests_coverage(files)
+    assert [item.details for item in findings] == [
+        "Changed files (4): src/main/A.kt, src/main/B.kt, src/main/C.kt…"
+    ]
+    assert qa_agent.analyse_tests_coverage([*files, "tests/test_a.py"]) == []
+    assert qa_agent.analyse_tests_coverage(["docs/a.md"]) == []
+
+
+def test_summarise_counts_severities_and_status() -> None:
+    def _finding(severity: str, title: str) -> qa_agent.Finding:
+        return qa_agent.Finding(severity, "scope", title, "", "")
+
+    findings = [_finding("Blocker", "a"), _finding("major", "b"), _finding("custom", "c")]
+    summary, counts, blockers, warnings, status = qa_agent.summarise(findings)
+    assert counts == {
+        "blocker": 1,
+        "critical": 0,
+        "major": 1,
+        "minor": 0,
+        "info": 0,
+        "custom": 1,
+    }
+    assert (blockers, warnings, status) == (1, 1, "BLOCKED")
+    assert summary == "Summary: blockers 1, warnings 1."
+    assert qa_agent.summarise([])[4] == "READY"
+
+
+def test_main_writes_report_and_stdout_from_one_serialization(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    monkeypatch.setattr(qa_agent, "ROOT_DIR", tmp_path)
+    monkeypatch.setattr(qa_agent, "detect_project_root", lambda: tmp_path)
+    monkeypatch.setenv("QA_TESTS_SUMMARY", "pass")
+    report = tmp_path / "reports" / "qa" / "DEMO-1.json"
+    args = ["--ticket", "DEMO-1", "--branch", "main", "--report", str(report)]
+    assert qa_agent.main(args) == 0
+
+    stdout = capsys.readouterr().out
+    assert stdout == report.read_text(encoding="utf-8") + "\n"
+    payload = json.loads(stdout)
+    assert payload["status"] == "READY"
+    assert payload["files_considered"] == []
+
+
+def test_collect_changed_files_skips_git_outside_a_worktree(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def _fail(*_args: object, **_kwargs: object) -> list[str]:
+        raise AssertionError("git should not run outside a worktree")
+
+    monkeypatch.delenv("GIT_DIR", raising=False)
+    monkeypatch.setattr(qa_agent, "run_git", _fail)
+    monkeypatch.setattr(qa_agent, "ROOT_DIR", tmp_path / "aidd")
+    assert qa_agent.collect_changed_files() == set()
+
+    (tmp_path / ".git").write_text("gitdir: elsewhere\n", encoding="utf-8")
+    assert qa_agent._in_git_worktree(tmp_path / "aidd") is True
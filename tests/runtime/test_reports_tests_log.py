@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from aidd_runtime.reports import tests_log
+
+
+def _append(root: Path, status: str, stage: str = "implement") -> None:
+    tests_log.append_log(
+        root, ticket="DEMO-1", slug_hint=None, stage=stage, scope_key="I1", status=status
+    )
+
+
+def test_append_log_writes_each_entry_at_once(tmp_path: Path) -> None:
+    path = tests_log.tests_log_path(tmp_path, "DEMO-1", "I1")
+    _append(tmp_path, "fail")
+    assert len(path.read_text(encoding="utf-8").splitlines()) == 1
+    _append(tmp_path, "pass")
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["status"] for line in lines] == ["fail", "pass"]
+
+
+def test_read_log_merges_file_tails_across_block_boundaries(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(tests_log, "_TAIL_BLOCK_BYTES", 16)
+    log_dir = tests_log.tests_log_dir(tmp_path, "DEMO-1")
+    log_dir.mkdir(parents=True)
+    (log_dir / "a.jsonl").write_text(
+        '{"updated_at": "1", "stage": "qa"}\nbroken{\n{"updated_at": "4", "stage": "review"}\n',
+        encoding="utf-8",
+    )
+    (log_dir / "b.jsonl").write_text(
+        '{"updated_at": "2", "stage": "qa"}\n\n{"updated_at": "3", "stage": "QA"}',
+        encoding="utf-8",
+    )
+
+    (log_dir / "notes.txt").write_text('{"updated_at": "9"}\n', encoding="utf-8")
+    (log_dir / "nested.jsonl").mkdir()
+
+    stamps = [item["updated_at"] for item in tests_log.read_log(tmp_path, "DEMO-1", limit=3)]
+    assert stamps == ["2", "3", "4"]
+    qa = tests_log.read_log(tmp_path, "DEMO-1", stage="qa", limit=10)
+    assert [item["updated_at"] for item in qa] == ["1", "2", "3"]
+    assert tests_log.read_log(tmp_path, "DEMO-1", limit=0) == []
+    assert tests_log.read_log(tmp_path, "MISSING") == []
+
+    entry, path = tests_log.latest_entry(tmp_path, "DEMO-1", "a", stages=["qa"])
+    assert entry == {"updated_at": "1", "stage": "qa"}
+    assert path == log_dir / "a.jsonl"
+    assert tests_log.latest_entry(tmp_path, "DEMO-1", "missing") == (None, None)
+
+
+def test_latest_entry_reuses_tail_until_log_grows(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _append(tmp_path, "fail", stage="qa")
+    first, _ = tests_log.latest_entry(tmp_path, "DEMO-1", "I1", stages=["QA"])
+    assert first is not None and first["status"] == "fail"
+    first["status"] = "mutated"
+
+    def _fail(path: Path):
+        raise AssertionError("unchanged log should be served from the cache")
+
+    monkeypatch.setattr(tests_log, "_iter_events_reversed", _fail)
+    again, _ = tests_log.latest_entry(tmp_path, "DEMO-1", "I1", stages=["qa"])
+    assert again is not None and again["status"] == "fail"
+    monkeypatch.undo()
+
+    _append(tmp_path, "pass", stage="qa")
+    latest, _ = tests_log.latest_entry(tmp_path, "DEMO-1", "I1", stages=["qa"])
+    assert latest is not None and latest["status"] == "pass"
+    assert tests_log.latest_entry(tmp_path, "DEMO-1", "missing") == (None, None)
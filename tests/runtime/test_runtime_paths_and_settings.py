@@ -5,7 +5,7 @@ from pathlib import Path
 
 import pytest
 
-from aidd_runtime import runtime
+from aidd_runtime import resources, runtime
 
 
 def test_resolve_roots_and_require_workflow_root(tmp_path: Path) -> None:
@@ -211,3 +211,70 @@ def test_scope_and_tool_result_helpers() -> None:
     resolved3, warn3 = runtime.resolve_tool_result_id({}, index=7)
     assert resolved3 == "tool_result:7"
     assert warn3
+
+
+def test_resolve_project_root_stops_at_workspace_marker(tmp_path: Path) -> None:
+    outer = tmp_path / "outer"
+    (outer / "aidd").mkdir(parents=True)
+    workspace = outer / "repo"
+    nested = workspace / "src" / "pkg"
+    nested.mkdir(parents=True)
+    (workspace / "pyproject.toml").write_text("", encoding="utf-8")
+
+    assert resources._find_workspace_boundary(nested) == workspace.resolve()
+    assert resources.resolve_project_root(nested) == (nested.resolve(), nested.resolve() / "aidd")
+
+    (workspace / "aidd").mkdir()
+    assert resources.resolve_project_root(nested) == (
+        workspace.resolve(),
+        workspace.resolve() / "aidd",
+    )
+
+
+def test_workspace_boundary_ignores_dangling_links_and_stats_unlistable_dirs(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    nested = tmp_path / "repo" / "src"
+    nested.mkdir(parents=True)
+    (nested / ".git").symlink_to(tmp_path / "missing")
+    assert resources._find_workspace_boundary(nested) is None
+
+    (tmp_path / "repo" / "pyproject.toml").write_text("", encoding="utf-8")
+    listdir = resources.os.listdir
+
+    def _execute_only(path: Path) -> list[str]:
+        if Path(path) == tmp_path / "repo":
+            raise PermissionError(path)
+        return listdir(path)
+
+    monkeypatch.setattr(resources.os, "listdir", _execute_only)
+    assert resources._find_workspace_boundary(nested) == tmp_path / "repo"
+
+
+def test_resolve_project_root_sees_markers_and_workflow_dirs_created_later(
+    tmp_path: Path,
+) -> None:
+    outer = tmp_path / "outer"
+    (outer / "aidd").mkdir(parents=True)
+    nested = outer / "repo" / "src"
+    nested.mkdir(parents=True)
+    assert resources._find_workspace_boundary(nested) is None
+    assert resources.resolve_project_root(nested) == (outer, outer / "aidd")
+
+    (outer / "repo" / ".git").mkdir()
+    assert resources._find_workspace_boundary(nested) == outer / "repo"
+    assert resources.resolve_project_root(nested) == (nested, nested / "aidd")
+
+    (outer / "repo" / "aidd").mkdir()
+    assert resources.resolve_project_root(nested) == (outer / "repo", outer / "repo" / "aidd")
+    (nested / "aidd").mkdir()
+    assert resources.resolve_project_root(nested) == (nested, nested / "aidd")
+
+    (nested / "pyproject.toml").write_text("", encoding="utf-8")
+    assert resources._find_workspace_boundary(nested) == nested
+
+    (nested / "pyproject.toml").unlink()
+    (outer / "repo" / ".git").rmdir()
+    (nested / "aidd").rmdir()
+    (outer / "repo" / "aidd").rmdir()
+    assert resources._find_workspace_boundary(nested) is None
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from aidd_runtime import test_settings_defaults
+
+
+def _touch(root: Path, *parts: str) -> None:
+    path = root.joinpath(*parts)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("", encoding="utf-8")
+
+
+def test_detect_build_tools_skips_vendor_dirs(tmp_path: Path) -> None:
+    _touch(tmp_path, "app", "build.gradle.kts")
+    _touch(tmp_path, "gradle", "libs.versions.toml")
+    _touch(tmp_path, "svc", "requirements-dev.txt")
+    _touch(tmp_path, "node_modules", "left-pad", "package.json")
+    _touch(tmp_path, "aidd", "go.mod")
+    assert test_settings_defaults.detect_build_tools(tmp_path) == {"gradle", "python"}
+    assert test_settings_defaults.detect_build_tools(tmp_path / "missing") == set()
+
+
+def test_detect_build_tools_stops_once_every_tool_is_found(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    for name in ("build.gradle", "package.json", "setup.py", "go.mod", "Cargo.toml", "a.csproj"):
+        _touch(tmp_path, name)
+    _touch(tmp_path, "deep", "nested", "README.md")
+    scanned: list[str] = []
+    original = test_settings_defaults.os.scandir
+
+    def _scandir(path: str):
+        scanned.append(path)
+        return original(path)
+
+    monkeypatch.setattr(test_settings_defaults.os, "scandir", _scandir)
+    detected = test_settings_defaults.detect_build_tools(tmp_path)
+    assert detected == {"gradle", "npm", "python", "go", "rust", "dotnet"}
+    assert scanned == [str(tmp_path)]
+
+
+def test_build_settings_payload_returns_fresh_lists() -> None:
+    payload = test_settings_defaults.build_settings_payload({"npm", "python"})
+    assert payload["commonPatterns"][0] == "config/"
+    assert "**/package.json" in payload["commonPatterns"]
+    assert "**/go.mod" not in payload["commonPatterns"]
+    payload["commonPatterns"].clear()
+    again = test_settings_defaults.build_settings_payload({"python", "npm"})
+    assert "**/package.json" in again["commonPatterns"]
+
+    defaults = test_settings_defaults.build_settings_payload(None)
+    assert defaults["commonPatterns"] == list(test_settings_defaults.DEFAULT_COMMON_PATTERNS)
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from aidd_runtime import skill_contract_validate
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+def _contract(stage: str = "qa") -> dict:
+    return skill_contract_validate.load_contract(REPO_ROOT / "skills" / stage / "CONTRACT.yaml")
+
+
+def test_repo_contracts_are_valid() -> None:
+    for stage in ("implement", "review", "qa"):
+        path = REPO_ROOT / "skills" / stage / "CONTRACT.yaml"
+        assert skill_contract_validate._validate_one(path) == []
+
+
+def test_validate_reports_shape_errors_in_field_order() -> None:
+    payload = _contract()
+    payload["entrypoints"] = [""]
+    payload["writes"]["via"] = []
+    payload["gates"] = None
+    errors = skill_contract_validate.validate_contract_data(payload)
+    assert errors[:3] == [
+        "field entrypoints must be list[str]",
+        "field writes.via must be object",
+        "field gates must be object",
+    ]
+
+
+def test_validate_reports_preflight_artifacts_in_declaration_order() -> None:
+    payload = _contract()
+    canonical = skill_contract_validate.CANONICAL_PREFLIGHT_FILES
+    deprecated = skill_contract_validate.DISALLOWED_PREFLIGHT_FILES
+    payload["writes"]["files"] = [canonical[0], deprecated[4], deprecated[1]]
+    errors = skill_contract_validate.validate_contract_data(payload)
+    assert errors == [
+        *(f"writes.files must include canonical preflight artifact: {p}" for p in canonical[1:]),
+        f"writes.files must not include deprecated preflight artifact: {deprecated[1]}",
+        f"writes.files must not include deprecated preflight artifact: {deprecated[4]}",
+    ]
+
+
+def test_compiled_contract_is_used_until_yaml_is_newer(tmp_path: Path) -> None:
+    path = tmp_path / "qa" / "CONTRACT.yaml"
+    path.parent.mkdir()
+    path.write_bytes((REPO_ROOT / "skills" / "qa" / "CONTRACT.yaml").read_bytes())
+    assert skill_contract_validate.main(["--contract", str(path), "--compile", "--quiet"]) == 0
+    compiled = path.with_suffix(".json")
+    assert skill_contract_validate.load_contract(path) == _contract()
+
+    compiled.write_text('{"schema": "compiled"}', encoding="utf-8")
+    assert skill_contract_validate.load_contract(path) == {"schema": "compiled"}
+
+    stat = compiled.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert skill_contract_validate.load_contract(path) == _contract()
+
+
+def test_main_reports_each_contract_in_input_order(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    bad = tmp_path / "bad.yaml"
+    bad.write_text("[1]\n", encoding="utf-8")
+    good = REPO_ROOT / "skills" / "qa" / "CONTRACT.yaml"
+    assert skill_contract_validate.main(["--contract", str(bad)]) == 2
+    assert skill_contract_validate.main(["--contract", str(good)]) == 0
+    lines = capsys.readouterr()
+    assert lines.err.strip() == (
+        f"[skill-contract-validate] ERROR: {bad}: contract payload must be a JSON/YAML object"
+    )
+    assert lines.out.strip() == f"[skill-contract-validate] OK: {good}"
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from aidd_runtime import tasklist_parser
+
+SECTION = [
+    "- profile: targeted",
+    "- tasks:",
+    "  - :app:test",
+    "  - <placeholder>",
+    "  - :lib:test",
+    "- filters: com.demo.*, com.other.*",
+    "- when: after implement",
+    "- reason:  ",
+    "- Tests:",
+    "  - unit: ./gradlew test",
+    "  - <key>: value",
+    "- Boundaries:",
+    "  - must-touch: [src/app.py, src/util.py]",
+    "  - must-not-touch: docs/readme.md",
+]
+
+
+def test_index_fields_keeps_first_scalar_and_block_per_field() -> None:
+    index = tasklist_parser.index_fields(SECTION + ["- Profile: full", "- TASKS:"])
+    assert index.scalars["profile"] == "targeted"
+    assert index.blocks["tasks"] == (1, 0)
+    assert index.scalars["reason"] == ""
+    assert "reason" in index.blocks
+    assert "tasks" not in index.scalars
+
+
+def test_extract_fields_share_one_index() -> None:
+    index = tasklist_parser.index_fields(SECTION)
+    assert tasklist_parser.extract_scalar_field(SECTION, "PROFILE", index=index) == "targeted"
+    assert tasklist_parser.extract_scalar_field(SECTION, "missing", index=index) is None
+    assert tasklist_parser.extract_list_field(SECTION, "tasks", index=index) == [
+        ":app:test",
+        ":lib:test",
+    ]
+    assert tasklist_parser.extract_mapping_field(SECTION, "Tests") == {"unit": "./gradlew test"}
+
+
+def test_parse_test_execution_and_boundaries() -> None:
+    assert tasklist_parser.parse_test_execution(SECTION) == {
+        "profile": "targeted",
+        "tasks": [":app:test", ":lib:test"],
+        "filters": ["com.demo.*", "com.other.*"],
+        "when": "after implement",
+        "reason": "",
+    }
+    allowed, forbidden, defined = tasklist_parser.extract_boundaries(SECTION)
+    assert defined is True
+    assert allowed == ["src/app.py", "src/util.py"]
+    assert forbidden == ["docs/readme.md"]